@@ -10,7 +10,7 @@ import subprocess
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Add parent to path for bitbucket-cli import
 sys.path.append(str(Path(__file__).parent.parent))
@@ -384,14 +384,20 @@ def save_snapshot(violations: List[Dict[str, Any]]):
     print(f"\n💾 Saved snapshot to {snapshot_file}")
 
 
-def main():
-    """Main entrypoint"""
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entrypoint
+
+    Returns the exit code instead of calling sys.exit() so the PM agent
+    service can run the check in-process. Pass argv=[] when calling from
+    another program so its own command line isn't parsed.
+    """
     import argparse
 
     parser = argparse.ArgumentParser(description="SLA Monitor - Working Implementation")
     parser.add_argument("--no-slack", action="store_true", help="Skip posting to Slack")
     parser.add_argument("--skip-jira", action="store_true", help="Skip Jira checks (PRs only)")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     print("\n" + "=" * 60)
     print("🔍 SLA MONITORING CHECK")
@@ -474,8 +480,8 @@ def main():
 
     # Exit with non-zero if critical violations found
     critical_count = len([v for v in all_violations if v.get("severity") == "critical"])
-    sys.exit(1 if critical_count > 0 else 0)
+    return 1 if critical_count > 0 else 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
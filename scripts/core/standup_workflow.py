@@ -19,7 +19,7 @@ import sys
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from dotenv import load_dotenv
 
 # Add parent to path
@@ -381,32 +381,47 @@ NO additional text, ONLY the JSON object."""
             self.log("Running SLA compliance check...")
 
             # Execute the existing working SLA script
-            sla_script = self.project_root / "scripts" / "sla_check_working.py"
+            sla_script = self.project_root / "scripts" / "core" / "sla_check_working.py"
 
             cmd = ["python", str(sla_script)]
             if self.dry_run:
                 cmd.append("--no-slack")
 
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.project_root)
+            # Stream output as the check runs instead of buffering it all until exit
+            output_lines = []
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                cwd=self.project_root
+            ) as proc:
+                for line in proc.stdout:
+                    line = line.rstrip("\n")
+                    if self.verbose:
+                        self.log(f"   {line}")
+                    output_lines.append(line)
+                returncode = proc.wait()
 
             section_data = {
                 "title": "🚨 SLA VIOLATIONS & FOLLOW-UP TRACKING",
                 "status": "completed",
-                "output": result.stdout,
-                "errors": result.stderr if result.returncode != 0 else None,
-                "return_code": result.returncode
+                "output": "\n".join(output_lines),
+                # stderr is interleaved with stdout; the tail holds any traceback
+                "errors": "\n".join(output_lines[-20:]) if returncode != 0 else None,
+                "return_code": returncode
             }
 
             self.report["sections"]["sla_monitoring"] = section_data
 
-            if result.returncode == 0:
+            if returncode == 0:
                 self.log("✅ SLA monitoring completed successfully")
             else:
-                self.log(f"⚠️ SLA monitoring completed with errors (code {result.returncode})")
-                self.report["errors"].append(f"SLA monitoring returned code {result.returncode}")
+                self.log(f"⚠️ SLA monitoring completed with errors (code {returncode})")
+                self.report["errors"].append(f"SLA monitoring returned code {returncode}")
 
         except FileNotFoundError:
-            error_msg = "SLA check script not found at scripts/sla_check_working.py"
+            error_msg = "SLA check script not found at scripts/core/sla_check_working.py"
             self.report["errors"].append(error_msg)
             self.log(f"❌ {error_msg}")
         except Exception as e:
@@ -994,7 +1009,13 @@ NO additional text, ONLY the JSON object."""
         return 0 if not self.report['errors'] else 1
 
 
-def main():
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the standup workflow and return its exit code
+
+    Pass argv=[] when calling from another program (e.g. the PM agent
+    service) so its own command line isn't parsed.
+    """
     import argparse
 
     parser = argparse.ArgumentParser(description="Daily Standup Workflow")
@@ -1002,11 +1023,11 @@ def main():
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
     parser.add_argument("--date", type=str, help="Run for specific date (YYYY-MM-DD)")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     workflow = StandupWorkflow(dry_run=args.dry_run, verbose=args.verbose)
-    sys.exit(workflow.run())
+    return workflow.run()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
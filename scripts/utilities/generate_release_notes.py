@@ -82,7 +82,7 @@ def find_release_notes_page(version: str, space: str = RELEASE_NOTES_SPACE) -> O
     # Search for page with version in title
     cql = f'title ~ "Release Notes" AND title ~ "{version}" AND space = "{space}" AND type = page'
 
-    result = search_confluence(cql, limit=5)
+    result = search_confluence(cql, limit=5, hits=True)
 
     if result.get("error"):
         print(f"Error searching for release notes: {result.get('message')}")
@@ -90,9 +90,9 @@ def find_release_notes_page(version: str, space: str = RELEASE_NOTES_SPACE) -> O
 
     # Find exact match
     for page in result.get("results", []):
-        if version in page.get("title", ""):
+        if version in (page.title or ""):
             # Get full page content
-            return get_confluence_page(page["id"])
+            return get_confluence_page(page.id)
 
     return None
 
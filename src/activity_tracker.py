@@ -5,10 +5,16 @@ Provides metrics for heartbeat reporting and audit trails
 """
 
 import sqlite3
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# log_async() rows are written after this many are queued, or every ACTIVITY_FLUSH_INTERVAL seconds
+ACTIVITY_BATCH_SIZE = 50
+ACTIVITY_FLUSH_INTERVAL = 30
+
 
 class ActivityTracker:
     """Track all PM agent activities in database"""
@@ -18,6 +24,11 @@ class ActivityTracker:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.init_db()
 
+        # Rows queued by log_async(), written in batches by flush()
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._flusher = None
+
     def init_db(self):
         """Initialize activity tracking database"""
         with sqlite3.connect(self.db_path) as conn:
@@ -67,8 +78,53 @@ class ActivityTracker:
                 (activity_type, details, item_id, 1 if success else 0)
             )
 
+    def log_async(self, activity_type: str, details: str = None, item_id: str = None, success: bool = True):
+        """
+        Queue an activity to be written with the next batch
+
+        For frequent routine entries (polling, heartbeat). Queued rows keep
+        their own timestamp and are written every ACTIVITY_BATCH_SIZE rows,
+        every ACTIVITY_FLUSH_INTERVAL seconds, and before any read.
+        """
+        # Same format/timezone as the column's CURRENT_TIMESTAMP default
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        row = (timestamp, activity_type, details, item_id, 1 if success else 0)
+
+        with self._pending_lock:
+            self._pending.append(row)
+            full = len(self._pending) >= ACTIVITY_BATCH_SIZE
+
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_periodically, name="activity-flush", daemon=True)
+                self._flusher.start()
+
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Write all queued activities in a single transaction"""
+        with self._pending_lock:
+            rows, self._pending = self._pending, []
+
+        if rows:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    "INSERT INTO activities (timestamp, activity_type, details, item_id, success) VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+
+    def _flush_periodically(self):
+        """Background flush loop for log_async() rows"""
+        while True:
+            time.sleep(ACTIVITY_FLUSH_INTERVAL)
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                print(f"⚠️  Failed to write activity batch: {e}")
+
     def get_recent_summary(self, hours: int = 1) -> Dict[str, int]:
         """Get count of activities by type in last N hours"""
+        self.flush()
         since = datetime.now() - timedelta(hours=hours)
 
         with sqlite3.connect(self.db_path) as conn:
@@ -84,6 +140,7 @@ class ActivityTracker:
 
     def get_last_activity(self, activity_type: str) -> Optional[datetime]:
         """Get timestamp of last activity of a given type"""
+        self.flush()
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.execute("""
                 SELECT timestamp
@@ -100,6 +157,7 @@ class ActivityTracker:
 
     def get_recent_activities(self, limit: int = 50) -> List[Dict]:
         """Get recent activities for debugging"""
+        self.flush()
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.execute("""
                 SELECT timestamp, activity_type, details, item_id, success
@@ -4,6 +4,7 @@ Bitbucket Monitor - Polls Bitbucket for PR mentions using bitbucket-cli library
 Leverages the existing bitbucket-cli-for-claude-code package
 """
 
+import hashlib
 import os
 import sqlite3
 from datetime import datetime, timedelta
@@ -15,6 +16,9 @@ from bitbucket_cli.api import BitbucketAPI
 from bitbucket_cli.auth import load_config as load_bb_config
 from bitbucket_cli.exceptions import BitbucketAPIError, RateLimitError
 
+# Reviewed diff hashes kept per PR (older ones are pruned)
+REVIEWED_DIFFS_PER_PR = 20
+
 
 class BitbucketMonitor:
     """Polls Bitbucket PRs for service account mentions"""
@@ -101,6 +105,17 @@ class BitbucketMonitor:
                 )
             """)
 
+            # Reviewed PR diff contents (skips re-reviews of rebased/amended but identical changes)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS reviewed_pr_diffs (
+                    repo TEXT,
+                    pr_id INTEGER,
+                    diff_hash TEXT,
+                    reviewed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (repo, pr_id, diff_hash)
+                )
+            """)
+
         print(f"✅ Bitbucket database ready at {self.db_path}")
 
     def get_last_check_time(self, repo: str) -> datetime:
@@ -155,9 +170,24 @@ class BitbucketMonitor:
             result = cursor.fetchone()
             return result[0] if result else None
 
-    def mark_commit_reviewed(self, repo: str, pr_id: int, commit_sha: str):
-        """Mark a commit as reviewed for a PR"""
+    def mark_commit_reviewed(self, repo: str, pr_id: int, commit_sha: str, diff_hash: Optional[str] = None):
+        """Mark a commit (and optionally its diff content) as reviewed for a PR"""
         with sqlite3.connect(self.db_path) as conn:
+            if diff_hash:
+                # Replace so a re-reviewed hash counts as recent when pruning
+                conn.execute(
+                    "INSERT OR REPLACE INTO reviewed_pr_diffs (repo, pr_id, diff_hash) VALUES (?, ?, ?)",
+                    (repo, pr_id, diff_hash),
+                )
+                conn.execute(
+                    """
+                    DELETE FROM reviewed_pr_diffs WHERE repo=? AND pr_id=? AND rowid NOT IN (
+                        SELECT rowid FROM reviewed_pr_diffs WHERE repo=? AND pr_id=?
+                        ORDER BY reviewed_at DESC, rowid DESC LIMIT ?
+                    )
+                    """,
+                    (repo, pr_id, repo, pr_id, REVIEWED_DIFFS_PER_PR),
+                )
             # Add to reviewed commits log
             conn.execute(
                 "INSERT OR IGNORE INTO reviewed_pr_commits (repo, pr_id, commit_sha) VALUES (?, ?, ?)",
@@ -172,6 +202,51 @@ class BitbucketMonitor:
                 (repo, pr_id, commit_sha),
             )
 
+    def is_diff_reviewed(self, repo: str, pr_id: int, diff_hash: str) -> bool:
+        """Check if a PR diff with this content hash was already reviewed"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "SELECT 1 FROM reviewed_pr_diffs WHERE repo=? AND pr_id=? AND diff_hash=?",
+                (repo, pr_id, diff_hash),
+            )
+            return cursor.fetchone() is not None
+
+    def get_pr_diff_hash(self, repo: str, pr_id: int) -> Optional[str]:
+        """
+        Hash the PR's current diff, ignoring parts that change without the content changing
+
+        Blob index lines and hunk line numbers are dropped, so a rebase or
+        amend that leaves the change itself untouched hashes the same.
+
+        Returns:
+            Hex digest, or None if the diff couldn't be fetched (the PR is
+            then reviewed as usual)
+
+        Raises:
+            RateLimitError: Passed on so the caller stops polling, as for other calls
+        """
+        try:
+            diff = self.api.get_diff(workspace=self.workspace, repo=repo, pr_id=pr_id)
+        except RateLimitError:
+            raise
+        except BitbucketAPIError as e:
+            print(f"   ⚠️  Could not fetch diff for {repo} PR#{pr_id}: {e}")
+            return None
+
+        if isinstance(diff, str):
+            diff = diff.encode()
+
+        digest = hashlib.blake2b(digest_size=16)
+        for line in diff.splitlines():
+            if line.startswith(b"index "):
+                continue
+            if line.startswith(b"@@"):
+                # Keep the function context after the line ranges
+                line = b"@@" + line.split(b"@@", 2)[-1]
+            digest.update(line)
+            digest.update(b"\n")
+        return digest.hexdigest()
+
     def poll_pull_requests(self) -> List[Dict[str, Any]]:
         """
         Poll Bitbucket for PR mentions across all repositories
@@ -234,6 +309,13 @@ class BitbucketMonitor:
                     last_reviewed = self.get_last_reviewed_commit(repo, pr_id)
 
                     if last_reviewed != latest_commit_sha:
+                        # Skip commits whose diff matches an already-reviewed revision
+                        diff_hash = self.get_pr_diff_hash(repo, pr_id)
+                        if diff_hash and self.is_diff_reviewed(repo, pr_id, diff_hash):
+                            self.mark_commit_reviewed(repo, pr_id, latest_commit_sha)
+                            print(f"   ⏭️  {repo} PR#{pr_id} {latest_commit_sha[:8]}: diff unchanged since last review")
+                            continue
+
                         # New commit detected - needs review
                         pr_url = pr.get("links", {}).get("html", {}).get("href", "")
                         commit_message = source_commit.get("message", "")
@@ -252,6 +334,7 @@ class BitbucketMonitor:
                             "commit_message": commit_message,
                             "commit_author": commit_author,
                             "previous_commit": last_reviewed,
+                            "diff_hash": diff_hash,
                             "timestamp": datetime.now().isoformat(),
                         })
 
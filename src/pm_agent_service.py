@@ -23,7 +23,7 @@ Architecture:
 │             │                       │
 │  ┌──────────┴──────────────────┐   │
 │  │  Slack Monitor (Polling)    │   │  ← Polls Slack every 15s
-│  │  Background Thread          │   │
+│  │  Scheduler Thread           │   │
 │  └─────────────────────────────┘   │
 │                                     │
 └─────────────────────────────────────┘
@@ -31,11 +31,22 @@ Architecture:
 
 import sys
 import os
+import atexit
+import heapq
+import importlib.util
+import itertools
+import logging
+import logging.handlers
+import queue
 import threading
 import time
 import signal
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dt_time, timedelta
+from operator import itemgetter
 from pathlib import Path
+import pytz
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -49,56 +60,99 @@ from src.monitors.jira_monitor import JiraMonitor
 from src.monitors.bitbucket_monitor import BitbucketMonitor
 from src.orchestration.claude_code_orchestrator import ClaudeCodeOrchestrator
 from src.utils.slack_logger import get_slack_logger
+from src.activity_tracker import get_tracker
+from src.database.pm_requests_db import get_pm_requests_db
+from src.team_roster import reload_team_roster
+
+logger = logging.getLogger(__name__)
+
+# Full tracebacks for handled errors are opt-in; the one-line error is always logged
+DEBUG_TRACEBACKS = os.getenv("PM_DEBUG_TRACEBACKS", "false").lower() in ("1", "true")
+
+# Max event keys remembered per source for in-memory duplicate suppression
+SEEN_EVENTS_MAX = 4096
+
+# Activity the service logs on every run; an hour with nothing else is "quiet"
+ROUTINE_ACTIVITY_TYPES = {"polling_slack", "polling_jira", "polling_bitbucket", "heartbeat"}
+
+# With HEARTBEAT_SKIP_QUIET, skip up to this many quiet heartbeats in a row
+QUIET_HEARTBEATS_SKIPPED = 3
+
+# Static tail of the hourly heartbeat message
+HEARTBEAT_TAIL = (
+    "\n\n🔍 *Configured Monitors:*\n"
+    "• Slack (15s) | Jira (30s) | Bitbucket (30s)\n"
+    "• SLA Check (hourly) | Standup (weekdays 9AM)\n\n"
+    "🟢 All systems operational"
+)
 
 
 class PMAgentService:
     """Unified service running webhooks (primary) + polling (backup)"""
 
     def __init__(self):
-        print("\n" + "="*70)
-        print(" 🤖 Autonomous PM Agent Service ".center(70))
-        print("="*70)
-        print("\nInitializing hybrid webhook + polling architecture...\n")
-        print("Strategy:")
-        print("  - Webhooks: Primary (instant response)")
-        print("  - Polling: Backup (catches missed events)")
-        print("  - Intelligence: Claude Code with MCP tools\n")
+        logger.info("=" * 70)
+        logger.info(" 🤖 Autonomous PM Agent Service ".center(70))
+        logger.info("=" * 70)
+        logger.info("Initializing hybrid webhook + polling architecture...")
+        logger.info("Strategy:")
+        logger.info("  - Webhooks: Primary (instant response)")
+        logger.info("  - Polling: Backup (catches missed events)")
+        logger.info("  - Intelligence: Claude Code with MCP tools")
 
         self.running = False
         self.threads = []
+        # Set on shutdown to wake the scheduler out of its wait
+        self.stop_event = threading.Event()
+
+        # Scheduler heap of (next_run, seq, name, fn, interval, background); next_run is
+        # on the monotonic clock so wall-clock/NTP adjustments don't shift the schedule
+        self.jobs = []
+        self._job_seq = itertools.count()
+        self.background_runs = {}
+
+        # Optionally post only every few heartbeats while nothing is happening
+        self.heartbeat_skip_quiet = os.getenv("HEARTBEAT_SKIP_QUIET", "false").lower() == "true"
+        self.quiet_heartbeats = 0
+
+        # Recently handled events: (issue_key, comment_id) / (repo, pr_id, latest_commit)
+        # Keys are recorded when handling starts and forgotten on any failure so
+        # the next poll retries; the lock covers pool threads forgetting keys
+        self.seen_jira_events = OrderedDict()
+        self.seen_pr_reviews = OrderedDict()
+        self.seen_events_lock = threading.Lock()
 
         # Initialize Slack logger (for activity logging to #pm-agent-logs)
         try:
             self.slack_logger = get_slack_logger()
-            print("✅ Slack logger initialized\n")
+            logger.info("✅ Slack logger initialized")
         except Exception as e:
-            print(f"⚠️  Slack logger not initialized: {e}")
-            print("   Activity logging to Slack will be disabled\n")
+            logger.warning("⚠️  Slack logger not initialized: %s", e)
+            logger.info("   Activity logging to Slack will be disabled")
             self.slack_logger = None
 
         # Initialize Claude Code orchestrator (with full .claude/ context)
         try:
             self.orchestrator = ClaudeCodeOrchestrator()
         except ValueError as e:
-            print(f"❌ Failed to initialize Claude Code orchestrator: {e}")
-            print("\nFalling back to simple orchestrator...")
+            logger.error("❌ Failed to initialize Claude Code orchestrator: %s", e)
+            logger.info("Falling back to simple orchestrator...")
             # Fallback to simple orchestrator if Claude Code not available
             try:
                 from src.orchestration.simple_orchestrator import SimpleOrchestrator
                 self.orchestrator = SimpleOrchestrator()
-                print("✅ Simple orchestrator initialized (limited functionality)\n")
+                logger.info("✅ Simple orchestrator initialized (limited functionality)")
             except Exception as e2:
-                print(f"❌ Failed to initialize any orchestrator: {e2}")
+                logger.error("❌ Failed to initialize any orchestrator: %s", e2)
                 sys.exit(1)
 
         # Initialize Slack monitor (polling only - no webhook support)
         try:
             self.slack_monitor = SlackMonitor()
             # Override to 15 seconds for Slack (no webhook alternative)
-            print("")
         except ValueError as e:
-            print(f"⚠️  Slack monitor not initialized: {e}")
-            print("   Slack polling will be disabled\n")
+            logger.warning("⚠️  Slack monitor not initialized: %s", e)
+            logger.info("   Slack polling will be disabled")
             self.slack_monitor = None
 
         # Initialize Jira monitor (backup polling - webhooks are primary)
@@ -106,380 +160,376 @@ class PMAgentService:
             self.jira_monitor = JiraMonitor()
             # Override to 1 hour for backup polling
             self.jira_monitor.polling_interval = int(os.getenv("JIRA_BACKUP_POLL_INTERVAL", "3600"))
-            print(f"   🔄 Jira backup polling: {self.jira_monitor.polling_interval}s (webhooks are primary)\n")
+            # Issue link prefix for Slack activity logs
+            self.jira_browse_prefix = f"{self.jira_monitor.jira_base_url}/browse/"
+            # Replies are posted off the polling thread so slow Jira writes overlap
+            self.jira_post_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="jira-post")
+            logger.info("   🔄 Jira backup polling: %ss (webhooks are primary)", self.jira_monitor.polling_interval)
         except ValueError as e:
-            print(f"⚠️  Jira monitor not initialized: {e}")
-            print("   Jira backup polling will be disabled\n")
+            logger.warning("⚠️  Jira monitor not initialized: %s", e)
+            logger.info("   Jira backup polling will be disabled")
             self.jira_monitor = None
+            self.jira_post_pool = None
 
         # Initialize Bitbucket monitor (backup polling - webhooks are primary)
         try:
             self.bitbucket_monitor = BitbucketMonitor()
             # Override to 1 hour for backup polling
             self.bitbucket_monitor.polling_interval = int(os.getenv("BITBUCKET_BACKUP_POLL_INTERVAL", "3600"))
-            print(f"   🔄 Bitbucket backup polling: {self.bitbucket_monitor.polling_interval}s (webhooks are primary)\n")
+            # PR link template for Slack activity logs (workspace is fixed for the process)
+            self.bitbucket_pr_url_template = (
+                f"https://bitbucket.org/{self.bitbucket_monitor.workspace}/{{repo}}/pull-requests/{{pr_id}}"
+            )
+            logger.info("   🔄 Bitbucket backup polling: %ss (webhooks are primary)", self.bitbucket_monitor.polling_interval)
         except ValueError as e:
-            print(f"⚠️  Bitbucket monitor not initialized: {e}")
-            print("   Bitbucket backup polling will be disabled\n")
+            logger.warning("⚠️  Bitbucket monitor not initialized: %s", e)
+            logger.info("   Bitbucket backup polling will be disabled")
             self.bitbucket_monitor = None
 
     def start_slack_polling(self):
-        """Start Slack polling in background thread (primary - no webhook alternative)"""
+        """Schedule Slack polling (primary - no webhook alternative)"""
         if not self.slack_monitor:
-            print("⏭️  Skipping Slack polling (not configured)")
+            logger.info("⏭️  Skipping Slack polling (not configured)")
             return
 
-        def poll_loop():
-            print("🔄 Starting Slack polling thread (primary)...")
-            poll_interval = self.slack_monitor.polling_interval
+        self._schedule_job("Slack polling", self.poll_slack, self.slack_monitor.polling_interval)
+        logger.info("✅ Slack polling started (interval: %ss)", self.slack_monitor.polling_interval)
+
+    def poll_slack(self):
+        """Poll Slack once and process new mentions"""
+        try:
+            # Poll for new mentions
+            events = self.slack_monitor.poll_for_mentions()
 
-            while self.running:
+            # Log polling activity
+            get_tracker().log_async("polling_slack", f"Polled Slack, found {len(events)} mentions")
+
+            # Process each event with orchestrator (same workflow as Jira)
+            for event in events:
                 try:
-                    # Poll for new mentions
-                    events = self.slack_monitor.poll_for_mentions()
+                    logger.info("=" * 60)
+                    logger.info("📥 SLACK MENTION DETECTED")
+                    logger.info("=" * 60)
+                    logger.info("User: %s", event['user'])
+                    logger.info("Message: %s...", event['text'][:100])
+                    if event.get('thread_context'):
+                        logger.info("Thread Context: %s replies", len(event['thread_context'].get('replies', [])))
+                    logger.info("=" * 60)
+
+                    # Get message text (remove bot mention for cleaner processing)
+                    message_text = event.get('text', '')
+                    message_text = message_text.replace(f"<@{self.slack_monitor.bot_user_id}>", "").strip()
+
+                    # Build context string including FULL thread history in chronological order
+                    context_parts = []
+                    if event.get('thread_context'):
+                        thread_ctx = event['thread_context']
+                        # Start with original/parent message
+                        if thread_ctx.get('parent'):
+                            parent_text = thread_ctx['parent']['text']
+                            parent_user = thread_ctx['parent'].get('user', 'unknown')
+                            context_parts.append(f"[THREAD START - User {parent_user}]: {parent_text}")
+
+                        # Include ALL replies in chronological order (not just last 5)
+                        if thread_ctx.get('replies'):
+                            for i, reply in enumerate(thread_ctx['replies']):
+                                reply_user = reply.get('user', 'unknown')
+                                reply_text = reply['text']
+                                # Mark if this is the current message being processed
+                                if reply.get('ts') == event.get('ts'):
+                                    context_parts.append(f"[CURRENT MESSAGE - User {reply_user}]: {reply_text}")
+                                else:
+                                    context_parts.append(f"[Reply {i+1} - User {reply_user}]: {reply_text}")
 
-                    # Log polling activity
-                    from src.activity_tracker import get_tracker
-                    get_tracker().log("polling_slack", f"Polled Slack, found {len(events)} mentions")
+                    # If no thread context or current message wasn't in replies, add it at the end
+                    if not context_parts:
+                        context_parts.append(f"[User message]: {message_text}")
+                    elif not any("CURRENT MESSAGE" in p for p in context_parts):
+                        context_parts.append(f"[CURRENT MESSAGE]: {message_text}")
 
-                    # Process each event with orchestrator (same workflow as Jira)
-                    for event in events:
-                        try:
-                            print(f"\n{'='*60}")
-                            print("📥 SLACK MENTION DETECTED")
-                            print(f"{'='*60}")
-                            print(f"User: {event['user']}")
-                            print(f"Message: {event['text'][:100]}...")
-                            if event.get('thread_context'):
-                                print(f"Thread Context: {len(event['thread_context'].get('replies', []))} replies")
-                            print(f"{'='*60}\n")
-
-                            # Get message text (remove bot mention for cleaner processing)
-                            message_text = event.get('text', '')
-                            message_text = message_text.replace(f"<@{self.slack_monitor.bot_user_id}>", "").strip()
-
-                            # Build context string including FULL thread history in chronological order
-                            context_parts = []
-                            if event.get('thread_context'):
-                                thread_ctx = event['thread_context']
-                                # Start with original/parent message
-                                if thread_ctx.get('parent'):
-                                    parent_text = thread_ctx['parent']['text']
-                                    parent_user = thread_ctx['parent'].get('user', 'unknown')
-                                    context_parts.append(f"[THREAD START - User {parent_user}]: {parent_text}")
-
-                                # Include ALL replies in chronological order (not just last 5)
-                                if thread_ctx.get('replies'):
-                                    for i, reply in enumerate(thread_ctx['replies']):
-                                        reply_user = reply.get('user', 'unknown')
-                                        reply_text = reply['text']
-                                        # Mark if this is the current message being processed
-                                        if reply.get('ts') == event.get('ts'):
-                                            context_parts.append(f"[CURRENT MESSAGE - User {reply_user}]: {reply_text}")
-                                        else:
-                                            context_parts.append(f"[Reply {i+1} - User {reply_user}]: {reply_text}")
-
-                            # If no thread context or current message wasn't in replies, add it at the end
-                            if not context_parts:
-                                context_parts.append(f"[User message]: {message_text}")
-                            elif not any("CURRENT MESSAGE" in p for p in context_parts):
-                                context_parts.append(f"[CURRENT MESSAGE]: {message_text}")
-
-                            full_context = "\n".join(context_parts)
-                            print(f"   📜 Built context with {len(context_parts)} parts")
-
-                            # Source ID for tracking (use thread_ts if available, otherwise message ts)
-                            source_id = event.get('thread_ts') or event.get('ts')
-
-                            # FIRST: Check if this is a response to a pending PM request
-                            from src.database.pm_requests_db import get_pm_requests_db
-                            pm_db = get_pm_requests_db()
-                            pending_request = pm_db.get_request_by_source('slack', source_id)
-
-                            if pending_request and pending_request['status'] == 'pending':
-                                # This thread has a pending PM request - check for approval response
-                                print(f"📋 Checking for approval response (pending request: {pending_request['request_id'][:8]}...)")
-
-                                approval_response = self.orchestrator.parse_approval_response(message_text)
-
-                                if approval_response['response_type']:
-                                    # Handle approval/changes/cancel
-                                    print(f"✅ APPROVAL RESPONSE DETECTED: {approval_response['response_type']}")
-                                    request_id = pending_request['request_id']
-
-                                    if approval_response['response_type'] == 'approved':
-                                        result = self.orchestrator.handle_pm_approval(request_id)
-                                        if result['success']:
-                                            response = f"✅ Created Jira ticket: {result.get('jira_ticket_key')}\n{result.get('jira_url', '')}"
-                                            print(f"   ✅ Created Jira ticket: {result.get('jira_ticket_key')}")
-                                            if self.slack_logger:
-                                                self.slack_logger.post_activity(
-                                                    "PM Ticket Created",
-                                                    f"Created {result.get('jira_ticket_key')} from approved PM request (Slack)",
-                                                    link=result.get('jira_url')
-                                                )
-                                        else:
-                                            response = f"❌ Failed to create ticket: {result.get('error')}"
-                                            print(f"   ❌ Failed to create ticket: {result.get('error')}")
-
-                                    elif approval_response['response_type'] == 'changes':
-                                        feedback = approval_response.get('feedback', '')
-                                        result = self.orchestrator.handle_pm_revision(request_id, feedback)
-                                        if result['success']:
-                                            response = f"✅ Generated revision {result.get('revision_number')} based on your feedback. Please review the updated draft in this thread."
-                                            print(f"   ✅ Generated revision {result.get('revision_number')}")
-                                            if self.slack_logger:
-                                                self.slack_logger.post_activity(
-                                                    "PM Draft Revised",
-                                                    f"Generated revision {result.get('revision_number')} for Slack thread {source_id}"
-                                                )
-                                        else:
-                                            response = f"❌ Failed to generate revision: {result.get('error')}"
-                                            print(f"   ❌ Failed to generate revision: {result.get('error')}")
-
-                                    elif approval_response['response_type'] == 'cancel':
-                                        result = self.orchestrator.handle_pm_cancellation(request_id)
-                                        if result['success']:
-                                            response = "✅ PM request cancelled."
-                                            print(f"   ✅ Cancelled PM request")
-                                            if self.slack_logger:
-                                                self.slack_logger.post_activity(
-                                                    "PM Request Cancelled",
-                                                    f"User cancelled PM request via Slack thread {source_id}"
-                                                )
-                                        else:
-                                            response = f"❌ Failed to cancel: {result.get('error')}"
-                                            print(f"   ❌ Failed to cancel: {result.get('error')}")
-
-                                    # Send response back to Slack
-                                    thread_ts = event.get('thread_ts') or event.get('ts')
-                                    self.slack_monitor.send_response(response, thread_ts=thread_ts)
-                                    continue  # Skip further processing
-
-                            # SECOND: Detect if this is a NEW PM request (story/bug/epic creation)
-                            pm_intent = self.orchestrator.detect_pm_intent(full_context)
-
-                            if pm_intent['is_pm_request'] and pm_intent['confidence'] > 0.5:
-                                print(f"🎯 PM REQUEST DETECTED: {pm_intent['request_type']} (confidence: {pm_intent['confidence']})")
-                                print(f"   Keywords: {', '.join(pm_intent['keywords_found'])}")
-
-                                # Route to PM request handler
-                                result = self.orchestrator.process_pm_request(
-                                    source='slack',
-                                    source_id=source_id,
-                                    request_type=pm_intent['request_type'],
-                                    comment_text=full_context,
-                                    requester_id=event.get('user', ''),
-                                    requester_name=event.get('user', 'Unknown')
-                                )
+                    full_context = "\n".join(context_parts)
+                    logger.info("   📜 Built context with %s parts", len(context_parts))
 
-                                # Send PM draft response to Slack
-                                if result.get('draft'):
-                                    response = f"📋 **{pm_intent['request_type'].title()} Draft Generated**\n\n{result['draft']}\n\n_Reply with 'approved', 'changes needed: <feedback>', or 'cancel' to proceed._"
-                                    thread_ts = event.get('thread_ts') or event.get('ts')
-                                    print(f"   🐛 DEBUG PM: Sending to thread_ts={thread_ts}, channel={event.get('channel')}")
-                                    success = self.slack_monitor.send_response(response, thread_ts=thread_ts)
-                                    if success:
-                                        print(f"   ✅ PM draft sent to Slack thread {thread_ts}")
-                                    else:
-                                        print(f"   ❌ FAILED to send PM draft to Slack thread {thread_ts}")
-
-                                    # Register thread for continued polling (for approval responses)
-                                    self.slack_monitor.register_thread(thread_ts, context=f"PM {pm_intent['request_type']} request pending approval")
-                                else:
-                                    print(f"   ⚠️  No draft generated")
+                    # Source ID for tracking (use thread_ts if available, otherwise message ts)
+                    source_id = event.get('thread_ts') or event.get('ts')
+
+                    # FIRST: Check if this is a response to a pending PM request
+                    pm_db = get_pm_requests_db()
+                    pending_request = pm_db.get_request_by_source('slack', source_id)
+
+                    if pending_request and pending_request['status'] == 'pending':
+                        # This thread has a pending PM request - check for approval response
+                        logger.info("📋 Checking for approval response (pending request: %s...)", pending_request['request_id'][:8])
 
-                                # Log to Slack
-                                if self.slack_logger:
-                                    try:
+                        approval_response = self.orchestrator.parse_approval_response(message_text)
+
+                        if approval_response['response_type']:
+                            # Handle approval/changes/cancel
+                            logger.info("✅ APPROVAL RESPONSE DETECTED: %s", approval_response['response_type'])
+                            request_id = pending_request['request_id']
+
+                            if approval_response['response_type'] == 'approved':
+                                result = self.orchestrator.handle_pm_approval(request_id)
+                                if result['success']:
+                                    response = f"✅ Created Jira ticket: {result.get('jira_ticket_key')}\n{result.get('jira_url', '')}"
+                                    logger.info("   ✅ Created Jira ticket: %s", result.get('jira_ticket_key'))
+                                    if self.slack_logger:
+                                        self.slack_logger.post_activity(
+                                            "PM Ticket Created",
+                                            f"Created {result.get('jira_ticket_key')} from approved PM request (Slack)",
+                                            link=result.get('jira_url')
+                                        )
+                                else:
+                                    response = f"❌ Failed to create ticket: {result.get('error')}"
+                                    logger.error("   ❌ Failed to create ticket: %s", result.get('error'))
+
+                            elif approval_response['response_type'] == 'changes':
+                                feedback = approval_response.get('feedback', '')
+                                result = self.orchestrator.handle_pm_revision(request_id, feedback)
+                                if result['success']:
+                                    response = f"✅ Generated revision {result.get('revision_number')} based on your feedback. Please review the updated draft in this thread."
+                                    logger.info("   ✅ Generated revision %s", result.get('revision_number'))
+                                    if self.slack_logger:
                                         self.slack_logger.post_activity(
-                                            f"PM {pm_intent['request_type'].title()} Draft",
-                                            f"Generated {pm_intent['request_type']} draft from Slack thread {source_id}",
-                                            link=f"https://slack.com/archives/{event['channel']}/p{source_id.replace('.', '')}"
+                                            "PM Draft Revised",
+                                            f"Generated revision {result.get('revision_number')} for Slack thread {source_id}"
                                         )
-                                    except Exception as log_err:
-                                        print(f"   ⚠️  Could not log to Slack: {log_err}")
+                                else:
+                                    response = f"❌ Failed to generate revision: {result.get('error')}"
+                                    logger.error("   ❌ Failed to generate revision: %s", result.get('error'))
+
+                            elif approval_response['response_type'] == 'cancel':
+                                result = self.orchestrator.handle_pm_cancellation(request_id)
+                                if result['success']:
+                                    response = "✅ PM request cancelled."
+                                    logger.info("   ✅ Cancelled PM request")
+                                    if self.slack_logger:
+                                        self.slack_logger.post_activity(
+                                            "PM Request Cancelled",
+                                            f"User cancelled PM request via Slack thread {source_id}"
+                                        )
+                                else:
+                                    response = f"❌ Failed to cancel: {result.get('error')}"
+                                    logger.error("   ❌ Failed to cancel: %s", result.get('error'))
+
+                            # Send response back to Slack
+                            thread_ts = event.get('thread_ts') or event.get('ts')
+                            self.slack_monitor.send_response(response, thread_ts=thread_ts)
+                            continue  # Skip further processing
+
+                    # SECOND: Detect if this is a NEW PM request (story/bug/epic creation)
+                    pm_intent = self.orchestrator.detect_pm_intent(full_context)
+
+                    if pm_intent['is_pm_request'] and pm_intent['confidence'] > 0.5:
+                        logger.info("🎯 PM REQUEST DETECTED: %s (confidence: %s)", pm_intent['request_type'], pm_intent['confidence'])
+                        logger.info("   Keywords: %s", ', '.join(pm_intent['keywords_found']))
+
+                        # Route to PM request handler
+                        result = self.orchestrator.process_pm_request(
+                            source='slack',
+                            source_id=source_id,
+                            request_type=pm_intent['request_type'],
+                            comment_text=full_context,
+                            requester_id=event.get('user', ''),
+                            requester_name=event.get('user', 'Unknown')
+                        )
 
+                        # Send PM draft response to Slack
+                        if result.get('draft'):
+                            response = f"📋 **{pm_intent['request_type'].title()} Draft Generated**\n\n{result['draft']}\n\n_Reply with 'approved', 'changes needed: <feedback>', or 'cancel' to proceed._"
+                            thread_ts = event.get('thread_ts') or event.get('ts')
+                            logger.debug("   🐛 DEBUG PM: Sending to thread_ts=%s, channel=%s", thread_ts, event.get('channel'))
+                            success = self.slack_monitor.send_response(response, thread_ts=thread_ts)
+                            if success:
+                                logger.info("   ✅ PM draft sent to Slack thread %s", thread_ts)
                             else:
-                                # THIRD: Generic Slack mention processing (fallback)
-                                print("🤖 Processing as generic request with Claude Code...")
-                                # Pass full context including thread history
-                                response = self.slack_monitor.process_with_claude(event, full_context=full_context)
-
-                                # Send response back to Slack
-                                # DEBUG: Log event details to diagnose thread_ts issue
-                                print(f"   🐛 DEBUG: event['ts'] = {event.get('ts')}, event['thread_ts'] = {event.get('thread_ts')}")
-                                thread_ts = event.get('thread_ts') or event.get('ts')
-                                print(f"   🐛 DEBUG: Using thread_ts = {thread_ts}")
-                                success = self.slack_monitor.send_response(response, thread_ts=thread_ts)
-
-                                if success:
-                                    print(f"✅ Response sent to Slack thread {thread_ts}")
-
-                                    # NOW mark as processed (only after successful response)
-                                    self.slack_monitor.mark_processed(event['ts'], response=response[:100])
-                                    print(f"   ✅ Marked message {event['ts']} as processed")
-
-                                    # Register this thread for continued polling
-                                    self.slack_monitor.register_thread(thread_ts, context=f"Generic request from {event.get('user')}")
-                                else:
-                                    print(f"❌ Failed to send response to Slack - NOT marking as processed (will retry)")
-                                    # Don't mark as processed - allows retry on next poll
+                                logger.error("   ❌ FAILED to send PM draft to Slack thread %s", thread_ts)
 
-                        except Exception as e:
-                            print(f"❌ Error processing Slack event: {e}")
-                            import traceback
-                            traceback.print_exc()
+                            # Register thread for continued polling (for approval responses)
+                            self.slack_monitor.register_thread(thread_ts, context=f"PM {pm_intent['request_type']} request pending approval")
+                        else:
+                            logger.warning("   ⚠️  No draft generated")
 
-                except Exception as e:
-                    print(f"❌ Error in Slack polling: {e}")
-                    import traceback
-                    traceback.print_exc()
+                        # Log to Slack
+                        if self.slack_logger:
+                            try:
+                                self.slack_logger.post_activity(
+                                    f"PM {pm_intent['request_type'].title()} Draft",
+                                    f"Generated {pm_intent['request_type']} draft from Slack thread {source_id}",
+                                    link=f"https://slack.com/archives/{event['channel']}/p{source_id.replace('.', '')}"
+                                )
+                            except Exception as log_err:
+                                logger.warning("   ⚠️  Could not log to Slack: %s", log_err)
 
-                # Wait before next poll
-                time.sleep(poll_interval)
+                    else:
+                        # THIRD: Generic Slack mention processing (fallback)
+                        logger.info("🤖 Processing as generic request with Claude Code...")
+                        # Pass full context including thread history
+                        response = self.slack_monitor.process_with_claude(event, full_context=full_context)
+
+                        # Send response back to Slack
+                        # DEBUG: Log event details to diagnose thread_ts issue
+                        logger.debug("   🐛 DEBUG: event['ts'] = %s, event['thread_ts'] = %s", event.get('ts'), event.get('thread_ts'))
+                        thread_ts = event.get('thread_ts') or event.get('ts')
+                        logger.debug("   🐛 DEBUG: Using thread_ts = %s", thread_ts)
+                        success = self.slack_monitor.send_response(response, thread_ts=thread_ts)
+
+                        if success:
+                            logger.info("✅ Response sent to Slack thread %s", thread_ts)
+
+                            # NOW mark as processed (only after successful response)
+                            self.slack_monitor.mark_processed(event['ts'], response=response[:100])
+                            logger.info("   ✅ Marked message %s as processed", event['ts'])
+
+                            # Register this thread for continued polling
+                            self.slack_monitor.register_thread(thread_ts, context=f"Generic request from {event.get('user')}")
+                        else:
+                            logger.error("❌ Failed to send response to Slack - NOT marking as processed (will retry)")
+                            # Don't mark as processed - allows retry on next poll
 
-            print("🛑 Slack polling thread stopped")
+                except Exception as e:
+                    logger.error("❌ Error processing Slack event: %s", e, exc_info=DEBUG_TRACEBACKS)
 
-        # Start polling thread
-        thread = threading.Thread(target=poll_loop, daemon=True)
-        thread.start()
-        self.threads.append(thread)
-        print(f"✅ Slack polling started (interval: {self.slack_monitor.polling_interval}s)\n")
+        except Exception as e:
+            logger.error("❌ Error in Slack polling: %s", e, exc_info=DEBUG_TRACEBACKS)
 
     def start_jira_polling(self):
-        """Start Jira backup polling in background thread"""
+        """Schedule Jira backup polling"""
         if not self.jira_monitor:
-            print("⏭️  Skipping Jira backup polling (not configured)")
+            logger.info("⏭️  Skipping Jira backup polling (not configured)")
             return
 
-        def poll_loop():
-            print("🔄 Starting Jira backup polling thread...")
-            poll_interval = self.jira_monitor.polling_interval
+        # Runs off the scheduler thread - replies go through Claude and can take minutes
+        self._schedule_job("Jira backup polling", self.poll_jira, self.jira_monitor.polling_interval, background=True)
+        logger.info("✅ Jira backup polling started (interval: %ss)", self.jira_monitor.polling_interval)
 
-            while self.running:
-                try:
-                    # Poll for new mentions
-                    events = self.jira_monitor.poll_for_mentions()
+    def poll_jira(self):
+        """Poll Jira once for missed mentions and PM approvals"""
+        try:
+            # Poll for new mentions
+            events = self.jira_monitor.poll_for_mentions()
 
-                    # Log polling activity
-                    from src.activity_tracker import get_tracker
-                    get_tracker().log("polling_jira", f"Polled Jira, found {len(events)} comments")
+            # Log polling activity
+            get_tracker().log_async("polling_jira", f"Polled Jira, found {len(events)} comments")
 
-                    if events:
-                        print(f"\n🔍 Jira backup polling found {len(events)} event(s) (webhook may have missed these)")
+            if events:
+                logger.info("🔍 Jira backup polling found %s event(s) (webhook may have missed these)", len(events))
 
-                    # Process each event with orchestrator
-                    for event in events:
-                        try:
-                            print(f"\n{'='*60}")
-                            print("📥 JIRA MENTION DETECTED (via backup polling)")
-                            print(f"{'='*60}")
-                            print(f"Issue: {event['issue_key']}")
-                            comment_text = event.get('comment_text', event.get('text', ''))
-                            comment_preview = comment_text[:100]
-                            print(f"Comment: {comment_preview}...")
-                            print(f"{'='*60}\n")
-
-                            # FIRST: Check if this is a response to a pending PM request
-                            from src.database.pm_requests_db import get_pm_requests_db
-                            pm_db = get_pm_requests_db()
-                            pending_request = pm_db.get_request_by_source('jira', event['issue_key'])
-
-                            if pending_request and pending_request['status'] == 'pending':
-                                # This issue has a pending PM request - check for approval response
-                                print(f"📋 Checking for approval response (pending request: {pending_request['request_id'][:8]}...)")
-
-                                approval_response = self.orchestrator.parse_approval_response(comment_text)
-
-                                if approval_response['response_type']:
-                                    # Handle approval/changes/cancel
-                                    print(f"✅ APPROVAL RESPONSE DETECTED: {approval_response['response_type']}")
-                                    request_id = pending_request['request_id']
-
-                                    if approval_response['response_type'] == 'approved':
-                                        result = self.orchestrator.handle_pm_approval(request_id)
-                                        if result['success']:
-                                            print(f"   ✅ Created Jira ticket: {result.get('jira_ticket_key')}")
-                                            if self.slack_logger:
-                                                self.slack_logger.post_activity(
-                                                    "PM Ticket Created",
-                                                    f"Created {result.get('jira_ticket_key')} from approved PM request",
-                                                    link=f"{get_jira_base_url()}/browse/{result.get('jira_ticket_key')}"
-                                                )
-                                        else:
-                                            print(f"   ❌ Failed to create ticket: {result.get('error')}")
-
-                                    elif approval_response['response_type'] == 'changes':
-                                        feedback = approval_response.get('feedback', '')
-                                        result = self.orchestrator.handle_pm_revision(request_id, feedback)
-                                        if result['success']:
-                                            print(f"   ✅ Generated revision {result.get('revision_number')}")
-                                            if self.slack_logger:
-                                                self.slack_logger.post_activity(
-                                                    "PM Draft Revised",
-                                                    f"Generated revision {result.get('revision_number')} for {event['issue_key']}"
-                                                )
-                                        else:
-                                            print(f"   ❌ Failed to generate revision: {result.get('error')}")
-
-                                    elif approval_response['response_type'] == 'cancel':
-                                        result = self.orchestrator.handle_pm_cancellation(request_id)
-                                        if result['success']:
-                                            print(f"   ✅ Cancelled PM request")
-                                            if self.slack_logger:
-                                                self.slack_logger.post_activity(
-                                                    "PM Request Cancelled",
-                                                    f"User cancelled PM request for {event['issue_key']}"
-                                                )
-                                        else:
-                                            print(f"   ❌ Failed to cancel: {result.get('error')}")
-
-                                    # Mark as processed
-                                    self.jira_monitor.mark_processed(event['issue_key'], event.get('comment_id', ''))
-                                    continue  # Skip further processing
-
-                            # SECOND: Detect if this is a NEW PM request (story/bug/epic creation)
-                            pm_intent = self.orchestrator.detect_pm_intent(comment_text)
-
-                            if pm_intent['is_pm_request'] and pm_intent['confidence'] > 0.5:
-                                print(f"🎯 PM REQUEST DETECTED: {pm_intent['request_type']} (confidence: {pm_intent['confidence']})")
-                                print(f"   Keywords: {', '.join(pm_intent['keywords_found'])}")
-
-                                # Route to PM request handler
-                                result = self.orchestrator.process_pm_request(
-                                    source='jira',
-                                    source_id=event['issue_key'],
-                                    request_type=pm_intent['request_type'],
-                                    comment_text=comment_text,
-                                    requester_id=event.get('author_id', ''),
-                                    requester_name=event['author']
-                                )
+            # Process each event with orchestrator
+            for event in events:
+                event_key = (event['issue_key'], event.get('comment_id', ''))
+                if self._seen_before(self.seen_jira_events, event_key):
+                    logger.debug("Skipping already handled Jira event %s", event_key)
+                    continue
 
-                                # Mark as processed
-                                self.jira_monitor.mark_processed(event['issue_key'], event.get('comment_id', ''))
+                try:
+                    logger.info("=" * 60)
+                    logger.info("📥 JIRA MENTION DETECTED (via backup polling)")
+                    logger.info("=" * 60)
+                    logger.info("Issue: %s", event['issue_key'])
+                    comment_text = event.get('comment_text', event.get('text', ''))
+                    comment_preview = comment_text[:100]
+                    logger.info("Comment: %s...", comment_preview)
+                    logger.info("=" * 60)
+
+                    # FIRST: Check if this is a response to a pending PM request
+                    pm_db = get_pm_requests_db()
+                    pending_request = pm_db.get_request_by_source('jira', event['issue_key'])
+
+                    if pending_request and pending_request['status'] == 'pending':
+                        # This issue has a pending PM request - check for approval response
+                        logger.info("📋 Checking for approval response (pending request: %s...)", pending_request['request_id'][:8])
+
+                        approval_response = self.orchestrator.parse_approval_response(comment_text)
+
+                        if approval_response['response_type']:
+                            # Handle approval/changes/cancel
+                            logger.info("✅ APPROVAL RESPONSE DETECTED: %s", approval_response['response_type'])
+                            request_id = pending_request['request_id']
+
+                            if approval_response['response_type'] == 'approved':
+                                result = self.orchestrator.handle_pm_approval(request_id)
+                                if result['success']:
+                                    logger.info("   ✅ Created Jira ticket: %s", result.get('jira_ticket_key'))
+                                    if self.slack_logger:
+                                        self.slack_logger.post_activity(
+                                            "PM Ticket Created",
+                                            f"Created {result.get('jira_ticket_key')} from approved PM request",
+                                            link=f"{self.jira_browse_prefix}{result.get('jira_ticket_key')}"
+                                        )
+                                else:
+                                    logger.error("   ❌ Failed to create ticket: %s", result.get('error'))
+
+                            elif approval_response['response_type'] == 'changes':
+                                feedback = approval_response.get('feedback', '')
+                                result = self.orchestrator.handle_pm_revision(request_id, feedback)
+                                if result['success']:
+                                    logger.info("   ✅ Generated revision %s", result.get('revision_number'))
+                                    if self.slack_logger:
+                                        self.slack_logger.post_activity(
+                                            "PM Draft Revised",
+                                            f"Generated revision {result.get('revision_number')} for {event['issue_key']}"
+                                        )
+                                else:
+                                    logger.error("   ❌ Failed to generate revision: %s", result.get('error'))
 
-                                # Log to Slack
-                                if self.slack_logger:
-                                    try:
+                            elif approval_response['response_type'] == 'cancel':
+                                result = self.orchestrator.handle_pm_cancellation(request_id)
+                                if result['success']:
+                                    logger.info("   ✅ Cancelled PM request")
+                                    if self.slack_logger:
                                         self.slack_logger.post_activity(
-                                            f"PM {pm_intent['request_type'].title()} Draft",
-                                            f"Generated {pm_intent['request_type']} draft for {event['issue_key']}",
-                                            link=f"{get_jira_base_url()}/browse/{event['issue_key']}"
+                                            "PM Request Cancelled",
+                                            f"User cancelled PM request for {event['issue_key']}"
                                         )
-                                    except Exception as log_err:
-                                        print(f"   ⚠️  Failed to log to Slack: {log_err}")
+                                else:
+                                    logger.error("   ❌ Failed to cancel: %s", result.get('error'))
+
+                            # Mark as processed
+                            self.jira_monitor.mark_processed(event['issue_key'], event.get('comment_id', ''))
+                            continue  # Skip further processing
+
+                    # SECOND: Detect if this is a NEW PM request (story/bug/epic creation)
+                    pm_intent = self.orchestrator.detect_pm_intent(comment_text)
+
+                    if pm_intent['is_pm_request'] and pm_intent['confidence'] > 0.5:
+                        logger.info("🎯 PM REQUEST DETECTED: %s (confidence: %s)", pm_intent['request_type'], pm_intent['confidence'])
+                        logger.info("   Keywords: %s", ', '.join(pm_intent['keywords_found']))
+
+                        # Route to PM request handler
+                        result = self.orchestrator.process_pm_request(
+                            source='jira',
+                            source_id=event['issue_key'],
+                            request_type=pm_intent['request_type'],
+                            comment_text=comment_text,
+                            requester_id=event.get('author_id', ''),
+                            requester_name=event['author']
+                        )
 
-                                print(f"   ✅ PM Draft Created: {result.get('request_id', 'unknown')}")
-                            else:
-                                # Not a PM request, process as normal Jira comment
-                                print(f"🔍 STANDARD JIRA COMMENT (not a PM request)")
-
-                                # Format issue context for Claude prompt
-                                issue_context = event.get('issue_context')
-                                if issue_context:
-                                    # Build rich context with issue details + all previous comments
-                                    context_str = f"""ISSUE CONTEXT:
+                        # Mark as processed
+                        self.jira_monitor.mark_processed(event['issue_key'], event.get('comment_id', ''))
+
+                        # Log to Slack
+                        if self.slack_logger:
+                            try:
+                                self.slack_logger.post_activity(
+                                    f"PM {pm_intent['request_type'].title()} Draft",
+                                    f"Generated {pm_intent['request_type']} draft for {event['issue_key']}",
+                                    link=self.jira_browse_prefix + event['issue_key']
+                                )
+                            except Exception as log_err:
+                                logger.warning("   ⚠️  Failed to log to Slack: %s", log_err)
+
+                        logger.info("   ✅ PM Draft Created: %s", result.get('request_id', 'unknown'))
+                    else:
+                        # Not a PM request, process as normal Jira comment
+                        logger.info("🔍 STANDARD JIRA COMMENT (not a PM request)")
+
+                        # Format issue context for Claude prompt
+                        issue_context = event.get('issue_context')
+                        if issue_context:
+                            # Build rich context with issue details + all previous comments
+                            context_str = f"""ISSUE CONTEXT:
 --------------
 Issue: {issue_context['issue_key']} - {issue_context['summary']}
 Status: {issue_context['status']} | Priority: {issue_context['priority']}
@@ -490,441 +540,499 @@ DESCRIPTION:
 
 PREVIOUS COMMENTS ({len(issue_context['comments'])} total):
 """
-                                    # Add all previous comments chronologically
-                                    for i, comment in enumerate(issue_context['comments'], 1):
-                                        context_str += f"\n[Comment {i}] {comment['author']} ({comment['created'][:10]}):\n{comment['text']}\n"
-
-                                    context_str += f"\n\nLATEST COMMENT (requires your response):\n{comment_text}"
+                            # Add all previous comments chronologically
+                            for i, comment in enumerate(issue_context['comments'], 1):
+                                context_str += f"\n[Comment {i}] {comment['author']} ({comment['created'][:10]}):\n{comment['text']}\n"
 
-                                    print(f"   📜 Using full issue context ({len(issue_context['comments'])} previous comments)")
-                                    prompt_text = context_str
-                                else:
-                                    # Fallback if context fetch failed
-                                    print(f"   ⚠️  No issue context available, using basic comment only")
-                                    prompt_text = f"Comment on {event['issue_key']}: {comment_text}"
-
-                                result = self.orchestrator.process_jira_comment(
-                                    event['issue_key'],
-                                    prompt_text,
-                                    event['author'],
-                                    event.get('author_id', '')
-                                )
-                                print(f"   ✅ Processed: {result}")
-
-                                # CRITICAL: Actually post the response back to Jira
-                                # The orchestrator generates a response but doesn't guarantee posting
-                                response_text = result.get('response', '')
-                                if response_text and self.jira_monitor:
-                                    try:
-                                        # Post response as a comment on the Jira issue
-                                        post_success = self.jira_monitor.add_comment(
-                                            event['issue_key'],
-                                            response_text
-                                        )
-                                        if post_success:
-                                            print(f"   ✅ Posted response to Jira {event['issue_key']}")
-                                        else:
-                                            print(f"   ❌ Failed to post response to Jira {event['issue_key']}")
-                                    except Exception as post_err:
-                                        print(f"   ❌ Error posting to Jira: {post_err}")
-                                        import traceback
-                                        traceback.print_exc()
-                                else:
-                                    print(f"   ⚠️  No response to post or Jira monitor not available")
+                            context_str += f"\n\nLATEST COMMENT (requires your response):\n{comment_text}"
 
-                                # Mark as processed
-                                self.jira_monitor.mark_processed(event['issue_key'], event.get('comment_id', ''))
+                            logger.info("   📜 Using full issue context (%s previous comments)", len(issue_context['comments']))
+                            prompt_text = context_str
+                        else:
+                            # Fallback if context fetch failed
+                            logger.warning("   ⚠️  No issue context available, using basic comment only")
+                            prompt_text = f"Comment on {event['issue_key']}: {comment_text}"
+
+                        result = self.orchestrator.process_jira_comment(
+                            event['issue_key'],
+                            prompt_text,
+                            event['author'],
+                            event.get('author_id', '')
+                        )
+                        logger.info("   ✅ Processed: %s", result)
 
-                                # Log to Slack (for standard comments only)
-                                if self.slack_logger:
-                                    try:
-                                        self.slack_logger.post_activity(
-                                            "Jira Comment",
-                                            f"Responded to mention in {event['issue_key']}",
-                                            link=event.get('issue_url', f"{get_jira_base_url()}/browse/{event['issue_key']}")
-                                        )
-                                    except Exception as log_err:
-                                        print(f"   ⚠️  Failed to log to Slack: {log_err}")
-
-                        except Exception as e:
-                            print(f"❌ Error processing Jira event: {e}")
-                            import traceback
-                            traceback.print_exc()
-
-                            # Log error to Slack
-                            if self.slack_logger:
-                                try:
-                                    self.slack_logger.post_error(
-                                        "Jira Monitor",
-                                        f"Failed to process Jira comment in {event.get('issue_key', 'unknown')}",
-                                        details=str(e)[:200]
-                                    )
-                                except:
-                                    pass  # Don't fail on logging failure
+                        # CRITICAL: Actually post the response back to Jira
+                        # The orchestrator generates a response but doesn't guarantee posting
+                        response_text = result.get('response', '')
+                        if response_text:
+                            self.jira_post_pool.submit(self._post_jira_response, event, event_key, response_text)
+                        else:
+                            logger.warning("   ⚠️  No response to post")
+                            self.jira_monitor.mark_processed(event['issue_key'], event.get('comment_id', ''))
 
                 except Exception as e:
-                    print(f"❌ Error in Jira backup polling: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    logger.error("❌ Error processing Jira event: %s", e, exc_info=DEBUG_TRACEBACKS)
+                    self._forget_seen(self.seen_jira_events, event_key)
 
-                # Wait before next poll
-                time.sleep(poll_interval)
+                    # Log error to Slack
+                    if self.slack_logger:
+                        try:
+                            self.slack_logger.post_error(
+                                "Jira Monitor",
+                                f"Failed to process Jira comment in {event.get('issue_key', 'unknown')}",
+                                details=str(e)[:200]
+                            )
+                        except:
+                            pass  # Don't fail on logging failure
 
-            print("🛑 Jira backup polling thread stopped")
+        except Exception as e:
+            logger.error("❌ Error in Jira backup polling: %s", e, exc_info=DEBUG_TRACEBACKS)
 
-        # Start polling thread
-        thread = threading.Thread(target=poll_loop, daemon=True)
-        thread.start()
-        self.threads.append(thread)
-        print(f"✅ Jira backup polling started (interval: {self.jira_monitor.polling_interval}s)\n")
+    def _post_jira_response(self, event, event_key, response_text):
+        """
+        Post a response comment to Jira, then mark the event processed and log it
+
+        Runs on the Jira post pool; the event is only marked processed once the
+        comment is posted, and a failed post forgets `event_key` so the next
+        poll retries it.
+
+        Args:
+            event: Jira mention event
+            event_key: Key recorded in seen_jira_events for this event
+            response_text: Response to post as a comment
+        """
+        try:
+            # Post response as a comment on the Jira issue
+            post_success = self.jira_monitor.add_comment(
+                event['issue_key'],
+                response_text
+            )
+            if not post_success:
+                logger.error("   ❌ Failed to post response to Jira %s", event['issue_key'])
+                self._forget_seen(self.seen_jira_events, event_key)
+                return
+
+            logger.info("   ✅ Posted response to Jira %s", event['issue_key'])
+            self.jira_monitor.mark_processed(event['issue_key'], event.get('comment_id', ''))
+        except Exception as post_err:
+            logger.error("   ❌ Error posting to Jira: %s", post_err, exc_info=DEBUG_TRACEBACKS)
+            self._forget_seen(self.seen_jira_events, event_key)
+            return
+
+        # Log to Slack (for standard comments only)
+        if self.slack_logger:
+            try:
+                self.slack_logger.post_activity(
+                    "Jira Comment",
+                    f"Responded to mention in {event['issue_key']}",
+                    link=event.get('issue_url') or self.jira_browse_prefix + event['issue_key']
+                )
+            except Exception as log_err:
+                logger.warning("   ⚠️  Failed to log to Slack: %s", log_err)
 
     def start_bitbucket_polling(self):
-        """Start Bitbucket backup polling in background thread"""
+        """Schedule Bitbucket backup polling"""
         if not self.bitbucket_monitor:
-            print("⏭️  Skipping Bitbucket backup polling (not configured)")
+            logger.info("⏭️  Skipping Bitbucket backup polling (not configured)")
             return
 
-        def poll_loop():
-            print("🔄 Starting Bitbucket backup polling thread...")
-            poll_interval = self.bitbucket_monitor.polling_interval
+        # Runs off the scheduler thread - a PR review can take minutes
+        self._schedule_job("Bitbucket backup polling", self.poll_bitbucket, self.bitbucket_monitor.polling_interval, background=True)
+        logger.info("✅ Bitbucket backup polling started (interval: %ss)", self.bitbucket_monitor.polling_interval)
 
-            while self.running:
+    def poll_bitbucket(self):
+        """Poll Bitbucket once for missed PR mentions"""
+        try:
+            # Poll for new PR mentions
+            events = self.bitbucket_monitor.poll_pull_requests()
+
+            # Log polling activity
+            get_tracker().log_async("polling_bitbucket", f"Polled Bitbucket, found {len(events)} PR comments")
+
+            if events:
+                logger.info("🔍 Bitbucket backup polling found %s event(s) (webhook may have missed these)", len(events))
+
+            # Process each event
+            for event in events:
                 try:
-                    # Poll for new PR mentions
-                    events = self.bitbucket_monitor.poll_pull_requests()
+                    logger.info("=" * 60)
+                    logger.info("📥 BITBUCKET PR MENTION DETECTED (via backup polling)")
+                    logger.info("=" * 60)
+                    logger.info("Repo: %s", event['repo'])
+                    logger.info("PR: #%s", event['pr_id'])
+                    logger.info("Comment: %s...", event.get('comment_text', event.get('text', ''))[:100])
+                    logger.info("=" * 60)
+
+                    # TODO: Create orchestrator.process_bitbucket_pr_comment() method
+                    logger.info("   ℹ️  Bitbucket event logged (processing not yet implemented)")
 
-                    # Log polling activity
-                    from src.activity_tracker import get_tracker
-                    get_tracker().log("polling_bitbucket", f"Polled Bitbucket, found {len(events)} PR comments")
+                except Exception as e:
+                    logger.error("❌ Error processing Bitbucket event: %s", e, exc_info=DEBUG_TRACEBACKS)
 
-                    if events:
-                        print(f"\n🔍 Bitbucket backup polling found {len(events)} event(s) (webhook may have missed these)")
+            # Poll for PR updates that need review
+            try:
+                pr_updates = self.bitbucket_monitor.poll_for_pr_updates()
+
+                if pr_updates:
+                    logger.info("🔍 Found %s PR(s) with new commits needing review", len(pr_updates))
+
+                # Process each PR that needs review
+                for pr_event in pr_updates:
+                    review_key = (pr_event['repo'], pr_event['pr_id'], pr_event['latest_commit'])
+                    if self._seen_before(self.seen_pr_reviews, review_key):
+                        logger.debug("Skipping already reviewed commit %s", review_key)
+                        continue
 
-                    # Process each event
-                    for event in events:
-                        try:
-                            print(f"\n{'='*60}")
-                            print("📥 BITBUCKET PR MENTION DETECTED (via backup polling)")
-                            print(f"{'='*60}")
-                            print(f"Repo: {event['repo']}")
-                            print(f"PR: #{event['pr_id']}")
-                            print(f"Comment: {event.get('comment_text', event.get('text', ''))[:100]}...")
-                            print(f"{'='*60}\n")
-
-                            # TODO: Create orchestrator.process_bitbucket_pr_comment() method
-                            print(f"   ℹ️  Bitbucket event logged (processing not yet implemented)")
-
-                        except Exception as e:
-                            print(f"❌ Error processing Bitbucket event: {e}")
-                            import traceback
-                            traceback.print_exc()
-
-                    # Poll for PR updates that need review
                     try:
-                        pr_updates = self.bitbucket_monitor.poll_for_pr_updates()
+                        logger.info("=" * 60)
+                        logger.info("📝 PR REVIEW TRIGGERED")
+                        logger.info("=" * 60)
+                        logger.info("Repo: %s", pr_event['repo'])
+                        logger.info("PR: #%s - %s", pr_event['pr_id'], pr_event['pr_title'])
+                        logger.info("Author: %s", pr_event['pr_author'])
+                        logger.info("New Commit: %s", pr_event['latest_commit'][:8])
+                        logger.info("=" * 60)
+
+                        # Process with orchestrator PR review
+                        result = self.orchestrator.process_pr_review(
+                            repo=pr_event['repo'],
+                            pr_id=pr_event['pr_id'],
+                            pr_title=pr_event['pr_title'],
+                            pr_author=pr_event['pr_author'],
+                            pr_author_account_id=pr_event.get('pr_author_account_id', ''),
+                            latest_commit=pr_event['latest_commit']
+                        )
+
+                        # Mark commit as reviewed
+                        self.bitbucket_monitor.mark_commit_reviewed(
+                            pr_event['repo'],
+                            pr_event['pr_id'],
+                            pr_event['latest_commit'],
+                            diff_hash=pr_event.get('diff_hash')
+                        )
 
-                        if pr_updates:
-                            print(f"\n🔍 Found {len(pr_updates)} PR(s) with new commits needing review")
+                        logger.info("   ✅ PR review complete: %s", result['status'])
 
-                        # Process each PR that needs review
-                        for pr_event in pr_updates:
+                        # Log to Slack
+                        if self.slack_logger:
                             try:
-                                print(f"\n{'='*60}")
-                                print("📝 PR REVIEW TRIGGERED")
-                                print(f"{'='*60}")
-                                print(f"Repo: {pr_event['repo']}")
-                                print(f"PR: #{pr_event['pr_id']} - {pr_event['pr_title']}")
-                                print(f"Author: {pr_event['pr_author']}")
-                                print(f"New Commit: {pr_event['latest_commit'][:8]}")
-                                print(f"{'='*60}\n")
-
-                                # Process with orchestrator PR review
-                                result = self.orchestrator.process_pr_review(
-                                    repo=pr_event['repo'],
-                                    pr_id=pr_event['pr_id'],
-                                    pr_title=pr_event['pr_title'],
-                                    pr_author=pr_event['pr_author'],
-                                    pr_author_account_id=pr_event.get('pr_author_account_id', ''),
-                                    latest_commit=pr_event['latest_commit']
+                                pr_url = self.bitbucket_pr_url_template.format(repo=pr_event['repo'], pr_id=pr_event['pr_id'])
+                                self.slack_logger.post_activity(
+                                    "PR Review",
+                                    f"Reviewed PR #{pr_event['pr_id']} in {pr_event['repo']} by {pr_event['pr_author']}",
+                                    link=pr_url
                                 )
+                            except Exception as log_err:
+                                logger.warning("   ⚠️  Failed to log to Slack: %s", log_err)
+
+                    except Exception as e:
+                        logger.error("❌ Error processing PR review: %s", e, exc_info=DEBUG_TRACEBACKS)
+                        # Forget the commit so the next poll retries the review
+                        self._forget_seen(self.seen_pr_reviews, review_key)
 
-                                # Mark commit as reviewed
-                                self.bitbucket_monitor.mark_commit_reviewed(
-                                    pr_event['repo'],
-                                    pr_event['pr_id'],
-                                    pr_event['latest_commit']
+                        # Log error to Slack
+                        if self.slack_logger:
+                            try:
+                                self.slack_logger.post_error(
+                                    "Bitbucket Monitor",
+                                    f"Failed to process PR #{pr_event.get('pr_id', 'unknown')} in {pr_event.get('repo', 'unknown')}",
+                                    details=str(e)[:200]
                                 )
+                            except:
+                                pass  # Don't fail on logging failure
 
-                                print(f"   ✅ PR review complete: {result['status']}")
+            except Exception as e:
+                logger.error("❌ Error polling for PR updates: %s", e, exc_info=DEBUG_TRACEBACKS)
 
-                                # Log to Slack
-                                if self.slack_logger:
-                                    try:
-                                        pr_url = f"https://bitbucket.org/{os.getenv('BITBUCKET_WORKSPACE', 'workspace')}/{pr_event['repo']}/pull-requests/{pr_event['pr_id']}"
-                                        self.slack_logger.post_activity(
-                                            "PR Review",
-                                            f"Reviewed PR #{pr_event['pr_id']} in {pr_event['repo']} by {pr_event['pr_author']}",
-                                            link=pr_url
-                                        )
-                                    except Exception as log_err:
-                                        print(f"   ⚠️  Failed to log to Slack: {log_err}")
-
-                            except Exception as e:
-                                print(f"❌ Error processing PR review: {e}")
-                                import traceback
-                                traceback.print_exc()
-
-                                # Log error to Slack
-                                if self.slack_logger:
-                                    try:
-                                        self.slack_logger.post_error(
-                                            "Bitbucket Monitor",
-                                            f"Failed to process PR #{pr_event.get('pr_id', 'unknown')} in {pr_event.get('repo', 'unknown')}",
-                                            details=str(e)[:200]
-                                        )
-                                    except:
-                                        pass  # Don't fail on logging failure
+        except Exception as e:
+            logger.error("❌ Error in Bitbucket backup polling: %s", e, exc_info=DEBUG_TRACEBACKS)
 
-                    except Exception as e:
-                        print(f"❌ Error polling for PR updates: {e}")
-                        import traceback
-                        traceback.print_exc()
+    def start_sla_monitoring(self):
+        """Schedule SLA monitoring (runs hourly)"""
+        if not self._job_module_available("scripts.core.sla_check_working"):
+            logger.warning("⚠️  Skipping SLA monitoring (scripts/core/sla_check_working.py not found)")
+            return
 
-                except Exception as e:
-                    print(f"❌ Error in Bitbucket backup polling: {e}")
-                    import traceback
-                    traceback.print_exc()
+        # Runs off the scheduler thread - a full SLA check can take minutes
+        self._schedule_job("SLA monitoring", self.run_sla_check, 3600, background=True)
+        logger.info("✅ SLA monitoring started (interval: 1 hour)")
 
-                # Wait before next poll
-                time.sleep(poll_interval)
+    def run_sla_check(self):
+        """Run one SLA monitoring check"""
+        try:
+            # Imported here (cached after the first run) so a broken
+            # script import is reported like any other SLA failure
+            from scripts.core.sla_check_working import main as run_sla_check
 
-            print("🛑 Bitbucket backup polling thread stopped")
+            logger.info("=" * 60)
+            logger.info("🔍 SLA MONITORING CHECK")
+            logger.info("=" * 60)
+            logger.info("Time: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            logger.info("=" * 60)
 
-        # Start polling thread
-        thread = threading.Thread(target=poll_loop, daemon=True)
-        thread.start()
-        self.threads.append(thread)
-        print(f"✅ Bitbucket backup polling started (interval: {self.bitbucket_monitor.polling_interval}s)\n")
+            # Pick up team_roster.json edits (a single stat() when unchanged)
+            reload_team_roster()
 
-    def start_sla_monitoring(self):
-        """Start SLA monitoring in background thread (runs hourly)"""
-        def sla_loop():
-            print("🔄 Starting SLA monitoring thread...")
-            check_interval = 3600  # 1 hour
+            # Run SLA check in-process (reuses loaded clients and singletons)
+            returncode = run_sla_check([])
 
-            while self.running:
-                try:
-                    import subprocess
-                    from pathlib import Path
-
-                    print(f"\n{'='*60}")
-                    print("🔍 SLA MONITORING CHECK")
-                    print(f"{'='*60}")
-                    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                    print(f"{'='*60}\n")
-
-                    # Run SLA check script
-                    scripts_dir = Path(__file__).parent.parent / "scripts"
-                    sla_script = scripts_dir / "core" / "sla_check_working.py"
-
-                    if sla_script.exists():
-                        result = subprocess.run(
-                            ["python3", str(sla_script)],
-                            capture_output=True,
-                            text=True,
-                            timeout=300
-                        )
+            if returncode == 0:
+                logger.info("   ✅ SLA check completed")
+            else:
+                logger.error("   ❌ SLA check failed (exit code %s)", returncode)
 
-                        if result.returncode == 0:
-                            print(result.stdout)
-                            print("   ✅ SLA check completed")
-                        else:
-                            print(f"   ❌ SLA check failed: {result.stderr}")
-                    else:
-                        print(f"   ⚠️  SLA script not found: {sla_script}")
+        except Exception as e:
+            logger.error("❌ Error in SLA monitoring: %s", e, exc_info=DEBUG_TRACEBACKS)
 
-                except Exception as e:
-                    print(f"❌ Error in SLA monitoring: {e}")
-                    import traceback
-                    traceback.print_exc()
+    def start_daily_standup(self):
+        """Schedule daily standup workflow (runs weekdays at 9 AM)"""
+        if not self._job_module_available("scripts.core.standup_workflow"):
+            logger.warning("⚠️  Skipping daily standup (scripts/core/standup_workflow.py not found)")
+            return
 
-                # Wait before next check
-                time.sleep(check_interval)
+        # Get timezone from env or default to America/New_York
+        tz_name = os.getenv("BUSINESS_TIMEZONE", "America/New_York")
+        self.standup_tz = pytz.timezone(tz_name)
 
-            print("🛑 SLA monitoring thread stopped")
+        self._schedule_job("Daily standup", self.run_daily_standup, self._seconds_until_standup, background=True)
+        logger.info("✅ Daily standup scheduled (weekdays at 9 AM)")
 
-        # Start SLA thread
-        thread = threading.Thread(target=sla_loop, daemon=True)
-        thread.start()
-        self.threads.append(thread)
-        print(f"✅ SLA monitoring started (interval: 1 hour)\n")
+    def _seconds_until_standup(self):
+        """
+        Seconds until the next weekday 9 AM in the business timezone
 
-    def start_daily_standup(self):
-        """Start daily standup workflow (runs weekdays at 9 AM)"""
-        def standup_loop():
-            print("🔄 Starting daily standup thread...")
-            from datetime import datetime, time as dt_time
-            import pytz
+        Returns:
+            Delay in seconds before the next standup run
+        """
+        now = datetime.now(self.standup_tz)
 
-            # Get timezone from env or default to America/New_York
-            tz_name = os.getenv("BUSINESS_TIMEZONE", "America/New_York")
-            tz = pytz.timezone(tz_name)
+        run_date = now.date()
+        if now.hour >= 9:
+            run_date += timedelta(days=1)
+        while run_date.weekday() >= 5:  # Skip Saturday/Sunday
+            run_date += timedelta(days=1)
 
-            last_run_date = None
+        # Localize the date (not now + timedelta) so DST changes keep it at 9 AM
+        next_run = self.standup_tz.localize(datetime.combine(run_date, dt_time(9, 0)))
+        return (next_run - now).total_seconds()
 
-            while self.running:
-                try:
-                    now = datetime.now(tz)
-                    current_date = now.date()
-
-                    # Check if it's a weekday (Monday=0, Sunday=6)
-                    if now.weekday() < 5:  # Monday-Friday
-                        # Check if it's 9 AM hour and we haven't run today
-                        if now.hour == 9 and last_run_date != current_date:
-                            import subprocess
-                            from pathlib import Path
-
-                            print(f"\n{'='*60}")
-                            print("📊 DAILY STANDUP WORKFLOW")
-                            print(f"{'='*60}")
-                            print(f"Date: {current_date}")
-                            print(f"Time: {now.strftime('%H:%M:%S %Z')}")
-                            print(f"{'='*60}\n")
-
-                            # Run standup workflow script
-                            scripts_dir = Path(__file__).parent.parent / "scripts"
-                            standup_script = scripts_dir / "core" / "standup_workflow.py"
-
-                            if standup_script.exists():
-                                result = subprocess.run(
-                                    ["python3", str(standup_script)],
-                                    capture_output=True,
-                                    text=True,
-                                    timeout=600
-                                )
+    def run_daily_standup(self):
+        """Run the daily standup workflow"""
+        try:
+            from scripts.core.standup_workflow import main as run_standup
 
-                                if result.returncode == 0:
-                                    print(result.stdout)
-                                    print("   ✅ Daily standup completed")
-                                else:
-                                    print(f"   ❌ Daily standup failed: {result.stderr}")
-                            else:
-                                print(f"   ⚠️  Standup script not found: {standup_script}")
-
-                            # Mark as run for today
-                            last_run_date = current_date
-
-                            # Log to Slack
-                            if self.slack_logger:
-                                try:
-                                    self.slack_logger.post_activity(
-                                        "Daily Standup Complete",
-                                        f"Generated daily standup report for {current_date}",
-                                        link="#ecd-standup"
-                                    )
-                                except Exception as log_err:
-                                    print(f"   ⚠️  Failed to log to Slack: {log_err}")
+            now = datetime.now(self.standup_tz)
+            current_date = now.date()
 
-                except Exception as e:
-                    print(f"❌ Error in daily standup: {e}")
-                    import traceback
-                    traceback.print_exc()
+            logger.info("=" * 60)
+            logger.info("📊 DAILY STANDUP WORKFLOW")
+            logger.info("=" * 60)
+            logger.info("Date: %s", current_date)
+            logger.info("Time: %s", now.strftime('%H:%M:%S %Z'))
+            logger.info("=" * 60)
 
-                # Check every 5 minutes
-                time.sleep(300)
+            # Run standup workflow in-process
+            returncode = run_standup([])
 
-            print("🛑 Daily standup thread stopped")
+            if returncode == 0:
+                logger.info("   ✅ Daily standup completed")
+            else:
+                logger.error("   ❌ Daily standup failed (exit code %s)", returncode)
 
-        # Start standup thread
-        thread = threading.Thread(target=standup_loop, daemon=True)
-        thread.start()
-        self.threads.append(thread)
-        print(f"✅ Daily standup scheduled (weekdays at 9 AM)\n")
+            # Log to Slack
+            if self.slack_logger:
+                try:
+                    self.slack_logger.post_activity(
+                        "Daily Standup Complete",
+                        f"Generated daily standup report for {current_date}",
+                        link="#ecd-standup"
+                    )
+                except Exception as log_err:
+                    logger.warning("   ⚠️  Failed to log to Slack: %s", log_err)
+
+        except Exception as e:
+            logger.error("❌ Error in daily standup: %s", e, exc_info=DEBUG_TRACEBACKS)
 
     def start_hourly_heartbeat(self):
-        """Start hourly heartbeat logging (shows agent is alive and what it's monitoring)"""
-        def heartbeat_loop():
-            print("🔄 Starting hourly heartbeat thread...")
-            heartbeat_interval = 3600  # 1 hour
+        """Schedule hourly heartbeat logging (shows agent is alive and what it's monitoring)"""
+        self._schedule_job("Hourly heartbeat", self.post_heartbeat, 3600)
+        logger.info("✅ Hourly heartbeat started")
 
-            while self.running:
+    def post_heartbeat(self):
+        """Log one heartbeat with the last hour's activity counts"""
+        try:
+            logger.info("=" * 60)
+            logger.info("💓 HOURLY HEARTBEAT")
+            logger.info("=" * 60)
+            logger.info("Time: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            logger.info("=" * 60)
+
+            # Query activity database for real metrics
+            tracker = get_tracker()
+            activity_summary = tracker.get_recent_summary(hours=1)
+
+            if self.heartbeat_skip_quiet and activity_summary.keys() <= ROUTINE_ACTIVITY_TYPES:
+                if self.quiet_heartbeats < QUIET_HEARTBEATS_SKIPPED:
+                    self.quiet_heartbeats += 1
+                    logger.info("   ⏭️  Quiet hour - skipping Slack heartbeat")
+                    return
+            self.quiet_heartbeats = 0
+
+            # Show actual counts from database, sorted by count descending,
+            # with activity names made more readable
+            sorted_activities = sorted(activity_summary.items(), key=itemgetter(1), reverse=True)
+            activity_lines = [
+                f"• {activity_type.replace('_', ' ').title()}: {count}"
+                for activity_type, count in sorted_activities
+            ] or ["• No activities recorded in last hour"]
+
+            # Generate heartbeat message with real metrics
+            heartbeat_msg = (
+                f"💓 *PM Agent Heartbeat* - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                "📊 *Activity Last Hour:*\n"
+                + "\n".join(activity_lines)
+                + HEARTBEAT_TAIL
+            )
+
+            # Log this heartbeat to activity tracker
+            tracker.log_async("heartbeat", f"Posted heartbeat with {len(activity_summary)} activity types")
+
+            # Log to Slack
+            if self.slack_logger:
                 try:
-                    from datetime import datetime
-
-                    print(f"\n{'='*60}")
-                    print("💓 HOURLY HEARTBEAT")
-                    print(f"{'='*60}")
-                    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                    print(f"{'='*60}\n")
-
-                    # Query activity database for real metrics
-                    from src.activity_tracker import get_tracker
-                    tracker = get_tracker()
-                    activity_summary = tracker.get_recent_summary(hours=1)
-
-                    # Generate heartbeat message with real metrics
-                    heartbeat_msg = f"💓 *PM Agent Heartbeat* - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                    heartbeat_msg += "📊 *Activity Last Hour:*\n"
-
-                    # Show actual counts from database
-                    if activity_summary:
-                        # Sort by count descending
-                        sorted_activities = sorted(activity_summary.items(), key=lambda x: x[1], reverse=True)
-                        for activity_type, count in sorted_activities:
-                            # Make activity names more readable
-                            display_name = activity_type.replace('_', ' ').title()
-                            heartbeat_msg += f"• {display_name}: {count}\n"
-                    else:
-                        heartbeat_msg += "• No activities recorded in last hour\n"
+                    self.slack_logger.post_activity(
+                        "Heartbeat",
+                        heartbeat_msg,
+                        link=None
+                    )
+                    logger.info("   ✅ Heartbeat logged to Slack")
+                except Exception as log_err:
+                    logger.warning("   ⚠️  Failed to log heartbeat: %s", log_err)
 
-                    heartbeat_msg += "\n🔍 *Configured Monitors:*\n"
-                    heartbeat_msg += "• Slack (15s) | Jira (30s) | Bitbucket (30s)\n"
-                    heartbeat_msg += "• SLA Check (hourly) | Standup (weekdays 9AM)\n\n"
-                    heartbeat_msg += f"🟢 All systems operational"
+        except Exception as e:
+            logger.error("❌ Error in heartbeat: %s", e, exc_info=DEBUG_TRACEBACKS)
 
-                    # Log this heartbeat to activity tracker
-                    tracker.log("heartbeat", f"Posted heartbeat with {len(activity_summary)} activity types")
+    def _job_module_available(self, module_name):
+        """
+        Check once at startup that a job's script module can be found
 
-                    # Log to Slack
-                    if self.slack_logger:
-                        try:
-                            self.slack_logger.post_activity(
-                                "Heartbeat",
-                                heartbeat_msg,
-                                link=None
-                            )
-                            print("   ✅ Heartbeat logged to Slack")
-                        except Exception as log_err:
-                            print(f"   ⚠️  Failed to log heartbeat: {log_err}")
+        The module itself is imported on first run, so an import error in
+        the script is still reported as a job failure.
 
-                except Exception as e:
-                    print(f"❌ Error in heartbeat: {e}")
-                    import traceback
-                    traceback.print_exc()
+        Args:
+            module_name: Dotted module name (e.g. "scripts.core.sla_check_working")
 
-                # Wait before next heartbeat
-                time.sleep(heartbeat_interval)
+        Returns:
+            True if the module exists
+        """
+        try:
+            return importlib.util.find_spec(module_name) is not None
+        except ImportError:
+            return False
+
+    def _seen_before(self, seen, key):
+        """
+        Check a bounded LRU of handled event keys, recording the key if it's new
+
+        Args:
+            seen: OrderedDict used as the LRU
+            key: Event key tuple
+
+        Returns:
+            True if the key was already recorded (the event should be skipped)
+        """
+        with self.seen_events_lock:
+            if key in seen:
+                seen.move_to_end(key)
+                return True
+
+            seen[key] = None
+            if len(seen) > SEEN_EVENTS_MAX:
+                seen.popitem(last=False)
+            return False
+
+    def _forget_seen(self, seen, key):
+        """Drop a key recorded by _seen_before so the event is retried on the next poll"""
+        with self.seen_events_lock:
+            seen.pop(key, None)
+
+    def _schedule_job(self, name, fn, interval, background=False):
+        """
+        Register a recurring job with the scheduler (first run is immediate)
+
+        Args:
+            name: Job name used in logs
+            fn: Callable to run
+            interval: Seconds between the end of one run and the start of the next, or a
+                callable returning the seconds until the next run (calendar-based jobs,
+                whose first run is also deferred to that time)
+            background: Run on a short-lived thread so a slow job doesn't delay the others
+        """
+        next_run = time.monotonic() + (interval() if callable(interval) else 0)
+        heapq.heappush(self.jobs, (next_run, next(self._job_seq), name, fn, interval, background))
+
+    def _run_in_background(self, name, fn):
+        """
+        Run a slow job on its own daemon thread, skipping it if the previous run is still going
+
+        Args:
+            name: Job name used in logs
+            fn: Callable to run
+        """
+        previous = self.background_runs.get(name)
+        if previous and previous.is_alive():
+            logger.warning("⚠️  %s still running - skipping this run", name)
+            return
+
+        thread = threading.Thread(target=fn, name=name, daemon=True)
+        thread.start()
+        self.background_runs[name] = thread
+
+    def _scheduler_loop(self):
+        """Run scheduled jobs in due order until shutdown"""
+        logger.info("🔄 Starting scheduler thread (%s jobs)...", len(self.jobs))
+
+        while self.running and self.jobs:
+            next_run, seq, name, fn, interval, background = self.jobs[0]
+
+            delay = next_run - time.monotonic()
+            if delay > 0:
+                if self.stop_event.wait(delay):
+                    break
+                continue
+
+            try:
+                if background:
+                    self._run_in_background(name, fn)
+                else:
+                    fn()
+            except Exception as e:
+                logger.error("❌ Error in %s: %s", name, e)
+
+            delay = interval() if callable(interval) else interval
+            heapq.heapreplace(self.jobs, (time.monotonic() + delay, seq, name, fn, interval, background))
 
-            print("🛑 Heartbeat thread stopped")
+        logger.info("🛑 Scheduler thread stopped")
 
-        # Start heartbeat thread
-        thread = threading.Thread(target=heartbeat_loop, daemon=True)
+    def start_scheduler(self):
+        """Start the single background thread that runs all scheduled jobs"""
+        thread = threading.Thread(target=self._scheduler_loop, name="scheduler", daemon=True)
         thread.start()
         self.threads.append(thread)
-        print(f"✅ Hourly heartbeat started\n")
+        logger.info("✅ Scheduler started")
 
     def start_webhook_server(self):
         """Start FastAPI webhook server"""
         # Use Heroku's dynamic PORT or default to 8001 for local dev
         port = int(os.getenv('PORT', 8001))
 
-        print(f"🚀 Starting webhook server on port {port}...")
-        print("   Endpoints:")
-        print("   - POST /webhooks/jira")
-        print("   - POST /webhooks/bitbucket")
-        print("   - POST /webhooks/slack")
-        print("   - GET  /health")
-        print("   - GET  /docs\n")
+        logger.info("🚀 Starting webhook server on port %s...", port)
+        logger.info("   Endpoints:")
+        logger.info("   - POST /webhooks/jira")
+        logger.info("   - POST /webhooks/bitbucket")
+        logger.info("   - POST /webhooks/slack")
+        logger.info("   - GET  /health")
+        logger.info("   - GET  /docs")
 
         # Import and run FastAPI app using import string
         # This prevents duplicate orchestrator initialization and avoids uvicorn warnings
@@ -946,24 +1054,23 @@ PREVIOUS COMMENTS ({len(issue_context['comments'])} total):
         signal.signal(signal.SIGINT, self._handle_shutdown)
         signal.signal(signal.SIGTERM, self._handle_shutdown)
 
-        print("="*70)
-        print(" 🟢 PM Agent Service Starting ".center(70))
-        print("="*70)
-        print()
+        logger.info("=" * 70)
+        logger.info(" 🟢 PM Agent Service Starting ".center(70))
+        logger.info("=" * 70)
 
-        # Start all polling threads in background
-        print("Starting background polling threads...\n")
+        # Schedule all polling jobs on one background scheduler thread
+        logger.info("Scheduling background jobs...")
         self.start_slack_polling()       # Primary (15s) - no webhook alternative
         self.start_jira_polling()        # Backup (30s) - webhooks are primary (also checks for PM approvals)
         self.start_bitbucket_polling()   # Backup (30s) - webhooks are primary
         self.start_sla_monitoring()      # SLA checks (1 hour)
         self.start_daily_standup()       # Daily standup (weekdays 9 AM)
         self.start_hourly_heartbeat()    # Heartbeat logging (1 hour)
+        self.start_scheduler()
 
-        print("="*70)
-        print(" Polling Threads Active ".center(70))
-        print("="*70)
-        print()
+        logger.info("=" * 70)
+        logger.info(" Scheduler Active ".center(70))
+        logger.info("=" * 70)
 
         # Start webhook server (blocks)
         try:
@@ -973,20 +1080,56 @@ PREVIOUS COMMENTS ({len(issue_context['comments'])} total):
 
     def _handle_shutdown(self, signum, frame):
         """Handle graceful shutdown"""
-        print("\n\n" + "="*70)
-        print(" 🛑 Shutting down PM Agent Service ".center(70))
-        print("="*70)
+        logger.info("=" * 70)
+        logger.info(" 🛑 Shutting down PM Agent Service ".center(70))
+        logger.info("=" * 70)
 
         self.running = False
+        self.stop_event.set()
 
-        # Wait for threads
+        # Wait for threads (the scheduler wakes immediately; a running job finishes first)
         for thread in self.threads:
-            thread.join(timeout=2)
+            thread.join(timeout=5)
 
-        print("\n✅ Shutdown complete\n")
+        # Let queued Jira replies finish posting
+        if self.jira_post_pool:
+            self.jira_post_pool.shutdown(wait=True)
+
+        # Write any batched activity rows
+        get_tracker().flush()
+
+        # Post any queued Slack logs
+        if self.slack_logger:
+            self.slack_logger.flush(timeout=10)
+
+        logger.info("✅ Shutdown complete")
         sys.exit(0)
 
 
+def _configure_logging():
+    """
+    Log to stdout through a queue so job threads never block on stdout writes
+
+    Records are formatted by the calling thread and written by a single
+    QueueListener thread, which is stopped (and drained) at exit.
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
+
+    log_queue = queue.Queue()
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        format='%(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+
 if __name__ == "__main__":
+    _configure_logging()
+
     service = PMAgentService()
     service.start()
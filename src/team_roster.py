@@ -9,26 +9,43 @@ Loads from team_roster.json for easy manual editing
 import os
 import json
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
+
+ROSTER_FILE = Path(__file__).parent.parent / "team_roster.json"
+
+# Parsed roster, reused until team_roster.json's mtime changes
+_ROSTER_CACHE = {"mtime_ns": None, "roster": {}}
 
 
 def load_team_roster() -> Dict:
-    """Load team roster from JSON file"""
-    roster_file = Path(__file__).parent.parent / "team_roster.json"
+    """
+    Load team roster from JSON file
 
-    if not roster_file.exists():
-        print(f"⚠️  Team roster file not found: {roster_file}")
+    The parsed roster is cached and only re-read when the file's mtime
+    changes, so repeated calls cost a single stat().
+    """
+    try:
+        mtime_ns = ROSTER_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        print(f"⚠️  Team roster file not found: {ROSTER_FILE}")
         return {}
 
-    with open(roster_file, 'r') as f:
+    if _ROSTER_CACHE["mtime_ns"] == mtime_ns:
+        return _ROSTER_CACHE["roster"]
+
+    with open(ROSTER_FILE, 'r') as f:
         data = json.load(f)
 
-    # Convert list to dict keyed by name
+    # Convert list to dict keyed by name (each record keeps its "name" key
+    # so lookups can hand back the record itself)
     roster = {}
     for member in data.get("team_members", []):
-        name = member.pop("name")
-        roster[name] = member
+        roster[member["name"]] = member
 
+    _ROSTER_CACHE["mtime_ns"] = mtime_ns
+    _ROSTER_CACHE["roster"] = roster
     return roster
 
 
@@ -36,32 +53,64 @@ def load_team_roster() -> Dict:
 TEAM_ROSTER = load_team_roster()
 
 
-def get_team_member_by_jira_id(jira_id: str) -> Optional[Dict]:
-    """Look up team member by Jira account ID"""
+def reload_team_roster() -> bool:
+    """
+    Reload TEAM_ROSTER in place if team_roster.json changed on disk
+
+    Returns:
+        True if the roster was reloaded, False if it was unchanged
+    """
+    previous_mtime_ns = _ROSTER_CACHE["mtime_ns"]
+    roster = load_team_roster()
+    if _ROSTER_CACHE["mtime_ns"] == previous_mtime_ns:
+        return False
+
+    # Update in place so modules holding a TEAM_ROSTER reference see it
+    TEAM_ROSTER.clear()
+    TEAM_ROSTER.update(roster)
+    _ROSTER_CACHE["roster"] = TEAM_ROSTER
+    load_slack_ids_from_env()
+    return True
+
+
+# Reverse indexes for O(1) lookups, keyed by Jira ID, Slack ID and
+# lowercased name/display name. Rebuilt by _build_indexes().
+# Values are read-only views of the TEAM_ROSTER records, built once and
+# shared by every caller.
+_BY_JIRA_ID: Dict[str, Mapping] = {}
+_BY_SLACK_ID: Dict[str, Mapping] = {}
+_BY_NAME: Dict[str, Mapping] = {}
+
+
+def _build_indexes():
+    """Rebuild the lookup indexes from TEAM_ROSTER"""
+    _BY_JIRA_ID.clear()
+    _BY_SLACK_ID.clear()
+    _BY_NAME.clear()
+
+    # setdefault keeps the first match, same as the old linear scans
     for name, member in TEAM_ROSTER.items():
-        if member["jira_id"] == jira_id:
-            return {"name": name, **member}
-    return None
+        record = MappingProxyType(member)
+        _BY_JIRA_ID.setdefault(member["jira_id"], record)
+        if member.get("slack_id"):
+            _BY_SLACK_ID.setdefault(member["slack_id"], record)
+        _BY_NAME.setdefault(name.lower(), record)
+        _BY_NAME.setdefault(member["display_name"].lower(), record)
+
+
+def get_team_member_by_jira_id(jira_id: str) -> Optional[Mapping]:
+    """Look up team member by Jira account ID"""
+    return _BY_JIRA_ID.get(jira_id)
 
 
-def get_team_member_by_slack_id(slack_id: str) -> Optional[Dict]:
+def get_team_member_by_slack_id(slack_id: str) -> Optional[Mapping]:
     """Look up team member by Slack user ID"""
-    for name, member in TEAM_ROSTER.items():
-        if member.get("slack_id") == slack_id:
-            return {"name": name, **member}
-    return None
+    return _BY_SLACK_ID.get(slack_id)
 
 
-def get_team_member_by_name(name: str) -> Optional[Dict]:
-    """Look up team member by short name (case-insensitive)"""
-    name_lower = name.lower()
-    for member_name, member in TEAM_ROSTER.items():
-        if member_name.lower() == name_lower:
-            return {"name": member_name, **member}
-        # Also check display name
-        if member["display_name"].lower() == name_lower:
-            return {"name": member_name, **member}
-    return None
+def get_team_member_by_name(name: str) -> Optional[Mapping]:
+    """Look up team member by short name or display name (case-insensitive)"""
+    return _BY_NAME.get(name.lower())
 
 
 def get_slack_mention(jira_id: str) -> Optional[str]:
@@ -124,6 +173,9 @@ def load_slack_ids_from_env():
         if slack_id:
             TEAM_ROSTER[name]["slack_id"] = slack_id.strip("'\"")
 
+    # Slack IDs may have changed - keep the lookup indexes in sync
+    _build_indexes()
+
 
-# Auto-load Slack IDs from env on import
+# Auto-load Slack IDs from env on import (this also builds the lookup indexes)
 load_slack_ids_from_env()
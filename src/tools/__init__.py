@@ -13,20 +13,10 @@ Usage:
     results = search_jira("project = ECD")
 """
 
-from .base import (
-    get_jira_auth_headers,
-    get_confluence_auth_headers,
-    get_bitbucket_auth_headers,
-    ATLASSIAN_CLOUD_ID,
-    JIRA_BASE_URL,
-    CONFLUENCE_BASE_URL,
-    BITBUCKET_BASE_URL,
-    BITBUCKET_WORKSPACE,
-)
-
 __all__ = [
     "get_jira_auth_headers",
     "get_confluence_auth_headers",
+    "get_confluence_session",
     "get_bitbucket_auth_headers",
     "ATLASSIAN_CLOUD_ID",
     "JIRA_BASE_URL",
@@ -34,3 +24,11 @@ __all__ = [
     "BITBUCKET_BASE_URL",
     "BITBUCKET_WORKSPACE",
 ]
+
+
+def __getattr__(name):
+    # Loaded on first use, so the tool CLIs' daemon client skips base/requests
+    if name in __all__:
+        from . import base
+        return getattr(base, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,13 +6,37 @@ Uses service account credentials that don't expire (unlike OAuth tokens).
 """
 
 import base64
+import functools
+import gzip
+import json
 import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+import requests
 from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.retry import Retry
+
+# Optional: faster JSON encoding/decoding for large page bodies
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Load environment variables (once, even if this module is reloaded)
+if not globals().get("_DOTENV_LOADED"):
+    load_dotenv(override=False)
+    _DOTENV_LOADED = True
 
 # Atlassian Cloud Configuration
 ATLASSIAN_CLOUD_ID = os.getenv("ATLASSIAN_CLOUD_ID", "67bbfd03-b309-414f-9640-908213f80628")
@@ -22,37 +46,208 @@ JIRA_BASE_URL = f"https://api.atlassian.com/ex/jira/{ATLASSIAN_CLOUD_ID}"
 CONFLUENCE_BASE_URL = f"https://api.atlassian.com/ex/confluence/{ATLASSIAN_CLOUD_ID}"
 BITBUCKET_BASE_URL = "https://api.bitbucket.org/2.0"
 
+# Default (connect, read) timeouts in seconds for Atlassian REST calls
+DEFAULT_TIMEOUT = (5, 30)
+
+# Browser base for Confluence links (API responses return paths relative to it)
+CONFLUENCE_WIKI_URL = "https://citemed.atlassian.net/wiki"
+
 # Bitbucket workspace
 BITBUCKET_WORKSPACE = os.getenv("BITBUCKET_WORKSPACE", "citemed")
 
+# Service account credentials (fixed for the life of the process)
+_JIRA_EMAIL = os.getenv("ATLASSIAN_SERVICE_ACCOUNT_EMAIL")
+_JIRA_TOKEN = os.getenv("ATLASSIAN_SERVICE_ACCOUNT_TOKEN")
+_BITBUCKET_USERNAME = os.getenv("BITBUCKET_USERNAME")
+_BITBUCKET_APP_PASSWORD = os.getenv("BITBUCKET_APP_PASSWORD")
+
+# Client-side request rate for the shared Atlassian session (0 disables)
+ATLASSIAN_RATE_LIMIT = float(os.getenv("ATLASSIAN_RATE_LIMIT", "10"))
+ATLASSIAN_RATE_BURST = int(os.getenv("ATLASSIAN_RATE_BURST", "20"))
+
+# Gzip large request bodies (page updates); opt-in, and callers fall back
+# to a plain body if an endpoint answers 415
+ATLASSIAN_GZIP_REQUESTS = os.getenv("ATLASSIAN_GZIP_REQUESTS", "false").lower() == "true"
+GZIP_MIN_BYTES = 1024
+
+
+
+class AtlassianRetry(Retry):
+    """
+    Retry policy for Atlassian REST calls
+
+    Throttled (429) and 5xx responses are retried with jittered exponential
+    backoff, honoring Retry-After. POST isn't idempotent (a retried comment
+    would post twice), so it is only retried on 429, where Atlassian
+    rejected the request without processing it.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST" and status_code == 429:
+            return bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        # Jitter so parallel workers don't retry in lockstep
+        return backoff + random.uniform(0, backoff / 2) if backoff else backoff
 
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        # Slow the whole process down when Atlassian starts throttling us
+        if response is not None and response.status == 429 and _RATE_LIMITER is not None:
+            _RATE_LIMITER.penalize()
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket for pacing outgoing requests
+
+    Allows bursts of up to `burst` requests, then `rate` requests per second.
+    On a 429, penalize() halves the rate for `hold_seconds`, after which it
+    climbs back linearly to the configured rate over `recovery_seconds`
+    (additive increase, multiplicative decrease).
+    """
+
+    def __init__(self, rate: float, burst: int, hold_seconds: float = 60.0,
+                 recovery_seconds: float = 60.0, min_rate: float = 0.5):
+        self.max_rate = rate
+        # Below one token a request could never be sent (it would wait forever)
+        self.burst = max(1, burst)
+        self.hold_seconds = hold_seconds
+        self.recovery_seconds = recovery_seconds
+        self.min_rate = min(min_rate, rate)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._floor = rate
+        self._penalized_at = None
+        self._lock = threading.Lock()
+
+    def _rate(self, now: float) -> float:
+        if self._penalized_at is None:
+            return self.max_rate
+
+        elapsed = now - self._penalized_at - self.hold_seconds
+        if elapsed <= 0:
+            return self._floor
+
+        rate = self._floor + elapsed * (self.max_rate - self._floor) / self.recovery_seconds
+        if rate >= self.max_rate:
+            self._penalized_at = None
+            return self.max_rate
+        return rate
+
+    @property
+    def rate(self) -> float:
+        """Current allowed requests per second"""
+        with self._lock:
+            return self._rate(time.monotonic())
+
+    def acquire(self) -> None:
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                rate = self._rate(now)
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / rate
+
+            time.sleep(wait)
+
+    def penalize(self) -> None:
+        """Halve the rate after a 429 (a burst of 429s counts once)"""
+        with self._lock:
+            now = time.monotonic()
+            if self._penalized_at is not None and now - self._penalized_at < 1:
+                return
+
+            # Bank the tokens earned at the old rate before it changes
+            rate = self._rate(now)
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._floor = max(rate / 2, self.min_rate)
+            self._penalized_at = now
+
+
+class RateLimitedSession(requests.Session):
+    """requests.Session that takes a token from a TokenBucket before each request"""
+
+    def __init__(self, limiter: Optional[TokenBucket] = None):
+        super().__init__()
+        self.limiter = limiter
+
+    def request(self, *args, **kwargs):
+        if self.limiter is not None:
+            self.limiter.acquire()
+        return super().request(*args, **kwargs)
+
+
+_RATE_LIMITER = TokenBucket(ATLASSIAN_RATE_LIMIT, ATLASSIAN_RATE_BURST) if ATLASSIAN_RATE_LIMIT > 0 else None
+
+
+# Shared HTTP session (Jira and Confluence use the same host and credentials)
+# so repeated tool calls reuse pooled keep-alive connections, paced by
+# _RATE_LIMITER to stay under Atlassian's rate limits. This stays on
+# requests/HTTP 1.1: batches are capped at DEFAULT_CONCURRENCY and paced
+# to ATLASSIAN_RATE_LIMIT, so a handful of kept-alive connections carry
+# them, and the tools' requests.exceptions handling stays as it is.
+_SESSION = RateLimitedSession(_RATE_LIMITER)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=AtlassianRetry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        # Return the final error response instead of raising, so tools
+        # report the real status code
+        raise_on_status=False
+    )
+))
+_SESSION.headers.update({"Accept": "application/json", "Accept-Encoding": ACCEPT_ENCODING})
+_RETRY_AFTER_PARSER = Retry(0)
+_session_auth_lock = threading.Lock()
+_session_authenticated = False
+
+
+@functools.lru_cache(maxsize=1)
 def get_jira_auth_headers() -> dict:
     """
     Get authentication headers for Jira REST API
 
     Uses Basic Auth with service account email and API token.
     This is more reliable than OAuth as tokens don't expire.
+    The headers are built once and shared; don't mutate the returned dict.
+
+    Accept-Encoding lists every codec urllib3 can decode here (br too
+    when the optional brotli package is installed); Jira search payloads
+    compress several times over.
 
     Returns:
-        dict: Headers with Authorization, Content-Type, Accept
+        dict: Headers with Authorization, Content-Type, Accept, Accept-Encoding
 
     Raises:
         ValueError: If credentials are missing
     """
-    email = os.getenv("ATLASSIAN_SERVICE_ACCOUNT_EMAIL")
-    token = os.getenv("ATLASSIAN_SERVICE_ACCOUNT_TOKEN")
-
-    if not email or not token:
+    if not _JIRA_EMAIL or not _JIRA_TOKEN:
         raise ValueError(
             "Missing credentials. Set ATLASSIAN_SERVICE_ACCOUNT_EMAIL and "
             "ATLASSIAN_SERVICE_ACCOUNT_TOKEN environment variables."
         )
 
-    auth = base64.b64encode(f"{email}:{token}".encode()).decode()
+    auth = base64.b64encode(_JIRA_EMAIL.encode() + b":" + _JIRA_TOKEN.encode()).decode("ascii")
     return {
         "Authorization": f"Basic {auth}",
         "Content-Type": "application/json",
-        "Accept": "application/json"
+        "Accept": "application/json",
+        "Accept-Encoding": ACCEPT_ENCODING
     }
 
 
@@ -68,11 +263,55 @@ def get_confluence_auth_headers() -> dict:
     return get_jira_auth_headers()
 
 
+def get_jira_session() -> requests.Session:
+    """
+    Get the shared HTTP session for Atlassian (Jira/Confluence) REST API calls
+
+    Auth headers are mounted on the session once (at import when the
+    credentials are set), so callers don't pass headers per request.
+
+    Returns:
+        requests.Session: Pooled session with Atlassian auth headers
+
+    Raises:
+        ValueError: If credentials are missing
+    """
+    global _session_authenticated
+
+    if not _session_authenticated:
+        with _session_auth_lock:
+            if not _session_authenticated:
+                _SESSION.headers.update(get_jira_auth_headers())
+                _session_authenticated = True
+
+    return _SESSION
+
+
+def get_confluence_session() -> requests.Session:
+    """
+    Get the shared HTTP session for Confluence REST API calls
+
+    Uses the same session as Jira (same host and service account).
+
+    Returns:
+        requests.Session: Pooled session with Atlassian auth headers
+    """
+    return get_jira_session()
+
+
+# Mount the auth headers up front when credentials are configured; otherwise
+# get_jira_session() raises the missing-credentials error on first use
+if _JIRA_EMAIL and _JIRA_TOKEN:
+    get_jira_session()
+
+
+@functools.lru_cache(maxsize=1)
 def get_bitbucket_auth_headers() -> dict:
     """
     Get authentication headers for Bitbucket REST API
 
     Uses app password authentication.
+    The headers are built once and shared; don't mutate the returned dict.
 
     Returns:
         dict: Headers with Authorization, Content-Type, Accept
@@ -80,24 +319,21 @@ def get_bitbucket_auth_headers() -> dict:
     Raises:
         ValueError: If credentials are missing
     """
-    username = os.getenv("BITBUCKET_USERNAME")
-    app_password = os.getenv("BITBUCKET_APP_PASSWORD")
+    username = _BITBUCKET_USERNAME
+    app_password = _BITBUCKET_APP_PASSWORD
 
     if not username or not app_password:
         # Fall back to Atlassian credentials if Bitbucket-specific ones aren't set
-        email = os.getenv("ATLASSIAN_SERVICE_ACCOUNT_EMAIL")
-        token = os.getenv("ATLASSIAN_SERVICE_ACCOUNT_TOKEN")
-
-        if email and token:
-            username = email
-            app_password = token
+        if _JIRA_EMAIL and _JIRA_TOKEN:
+            username = _JIRA_EMAIL
+            app_password = _JIRA_TOKEN
         else:
             raise ValueError(
                 "Missing Bitbucket credentials. Set BITBUCKET_USERNAME and "
                 "BITBUCKET_APP_PASSWORD, or ATLASSIAN_SERVICE_ACCOUNT_* variables."
             )
 
-    auth = base64.b64encode(f"{username}:{app_password}".encode()).decode()
+    auth = base64.b64encode(username.encode() + b":" + app_password.encode()).decode("ascii")
     return {
         "Authorization": f"Basic {auth}",
         "Content-Type": "application/json",
@@ -105,6 +341,25 @@ def get_bitbucket_auth_headers() -> dict:
     }
 
 
+@functools.lru_cache(maxsize=256)
+def _mention_scanner(mentions: tuple) -> tuple:
+    """
+    Compiled @mention matcher for a set of (account_id, name) pairs
+
+    Returns (pattern, {placeholder: account_id}). The pattern tries longer
+    placeholders first, so "@Ethan Drower" wins over "@Ethan"; the first
+    mention with a given name wins.
+    """
+    account_ids = {}
+    for account_id, name in mentions:
+        account_ids.setdefault(f"@{name}", account_id)
+    pattern = re.compile("|".join(
+        re.escape(placeholder)
+        for placeholder in sorted(account_ids, key=len, reverse=True)
+    ))
+    return pattern, account_ids
+
+
 def build_adf_comment(text: str, mentions: Optional[list] = None) -> dict:
     """
     Build Atlassian Document Format (ADF) comment body with optional @mentions
@@ -122,32 +377,34 @@ def build_adf_comment(text: str, mentions: Optional[list] = None) -> dict:
             mentions=[{"id": "712020:xxx", "name": "Ethan"}]
         )
     """
+    if not mentions:
+        # Fast path: plain text comment (the common case for automated posts)
+        return {
+            "version": 1,
+            "type": "doc",
+            "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}]
+        }
+
+    pattern, account_ids = _mention_scanner(tuple((mention["id"], mention["name"]) for mention in mentions))
+
     content = []
+    pos = 0
+    for match in pattern.finditer(text):
+        if match.start() > pos:
+            content.append({"type": "text", "text": text[pos:match.start()]})
+        content.append({
+            "type": "mention",
+            "attrs": {
+                "id": account_ids[match.group()],
+                "text": match.group(),
+                "accessLevel": ""
+            }
+        })
+        pos = match.end()
 
-    if mentions:
-        # Split text by @mentions and build nodes
-        parts = text
-        for mention in mentions:
-            placeholder = f"@{mention['name']}"
-            if placeholder in parts:
-                before, after = parts.split(placeholder, 1)
-                if before:
-                    content.append({"type": "text", "text": before})
-                content.append({
-                    "type": "mention",
-                    "attrs": {
-                        "id": mention["id"],
-                        "text": f"@{mention['name']}",
-                        "accessLevel": ""
-                    }
-                })
-                parts = after
-
-        # Add remaining text
-        if parts:
-            content.append({"type": "text", "text": parts})
-    else:
-        content.append({"type": "text", "text": text})
+    # Add remaining text
+    if pos < len(text):
+        content.append({"type": "text", "text": text[pos:]})
 
     return {
         "version": 1,
@@ -161,6 +418,461 @@ def build_adf_comment(text: str, mentions: Optional[list] = None) -> dict:
     }
 
 
+def adf_to_text(adf, max_chars: Optional[int] = None) -> str:
+    """
+    Extract plain text from an Atlassian Document Format (ADF) node
+
+    Walks the document with an explicit stack (no recursion), joining the
+    text nodes with spaces in document order.
+
+    Args:
+        adf: ADF document, node, or list of nodes
+        max_chars: Stop once this much text is collected and truncate to it
+                   (default: no limit)
+
+    Returns:
+        str: Space-joined text ("" if there is none)
+    """
+    texts = []
+    length = -1     # No separator before the first text node
+    stack = [adf]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if node.get("type") == "text":
+                text = node.get("text", "")
+                texts.append(text)
+                if max_chars is not None:
+                    length += len(text) + 1
+                    if length >= max_chars:
+                        break
+            content = node.get("content")
+            if content:
+                stack.extend(reversed(content))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+    text = " ".join(texts)
+    return text if max_chars is None else text[:max_chars]
+
+
+def encode_json(payload: dict):
+    """
+    Serialize a request payload for the data= argument
+
+    Args:
+        payload: JSON-serializable request body
+
+    Returns:
+        bytes or str: Encoded JSON (bytes when orjson is installed)
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload)
+
+
+def encode_json_body(payload: dict, compress: Optional[bool] = None) -> tuple:
+    """
+    Serialize a request payload, gzipping it when it's large
+
+    Args:
+        payload: JSON-serializable request body
+        compress: Override ATLASSIAN_GZIP_REQUESTS
+
+    Returns:
+        tuple: (data, headers) - headers is {"Content-Encoding": "gzip"}
+               when the body was compressed, else None
+    """
+    data = encode_json(payload)
+    if not (ATLASSIAN_GZIP_REQUESTS if compress is None else compress):
+        return data, None
+
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if len(data) < GZIP_MIN_BYTES:
+        return data, None
+
+    # Level 1: most of the size win on HTML for a fraction of the CPU
+    return gzip.compress(data, compresslevel=1), {"Content-Encoding": "gzip"}
+
+
+def format_output(result, pretty: bool = False) -> str:
+    """
+    Render a tool result for CLI output
+
+    Args:
+        result: JSON-serializable tool result
+        pretty: Indent for humans (default is compact, for pipelines)
+
+    Returns:
+        str: JSON text
+    """
+    if HAS_ORJSON:
+        if pretty:
+            return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+        return orjson.dumps(result).decode()
+    if pretty:
+        return json.dumps(result, indent=2)
+    return json.dumps(result, separators=(",", ":"))
+
+
+def write_output(result, pretty: bool = False) -> None:
+    """
+    Write a tool result to stdout as JSON (same format as format_output)
+
+    Encodes straight to bytes for stdout when orjson is available, and
+    streams with json.dump otherwise, so large results aren't first built
+    into one big string.
+
+    Args:
+        result: JSON-serializable tool result
+        pretty: Indent for humans (default is compact, for pipelines)
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if HAS_ORJSON and buffer is not None:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+        sys.stdout.flush()
+        buffer.write(orjson.dumps(result, option=option))
+        buffer.flush()
+        return
+
+    if pretty:
+        json.dump(result, sys.stdout, indent=2)
+    else:
+        json.dump(result, sys.stdout, separators=(",", ":"))
+    sys.stdout.write("\n")
+
+
+def decode_json(response: requests.Response):
+    """
+    Parse a JSON response body
+
+    Args:
+        response: Response from the shared session
+
+    Returns:
+        The decoded JSON value
+
+    Raises:
+        requests.exceptions.InvalidJSONError: If the body isn't valid JSON
+    """
+    if not HAS_ORJSON:
+        return response.json()
+
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.InvalidJSONError(str(e), response=response)
+
+
+def confluence_web_url(path: str) -> str:
+    """
+    Make a Confluence webui link absolute
+
+    Args:
+        path: "_links.webui" value (relative "/spaces/..." or already absolute)
+
+    Returns:
+        str: Absolute URL (empty string if path is empty)
+    """
+    if path and path[0] == "/":
+        return CONFLUENCE_WIKI_URL + path
+    return path
+
+
+def ttl_cache(seconds, maxsize: int = 128):
+    """
+    Memoize a tool function's results for a short time
+
+    Entries expire after `seconds` (monotonic clock) and the least recently
+    used entry is evicted past `maxsize`. Error results (dicts with
+    "error") are never cached. Concurrent calls with the same arguments
+    share one underlying call: the others wait for it and get its result.
+    The wrapper gains cache_clear() and cache_invalidate(*args, **kwargs),
+    which drops a single entry.
+
+    Args:
+        seconds: How long a result stays fresh, or a callable taking the
+                 result and returning that (e.g. shorter for empty results)
+        maxsize: Maximum number of cached argument combinations
+
+    Returns:
+        Decorator
+    """
+    lifetime = seconds if callable(seconds) else (lambda value: seconds)
+
+    def decorator(fn):
+        cache = OrderedDict()
+        in_flight = {}      # key -> (done event, [result]) of the call being made
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = args + tuple(sorted(kwargs.items())) if kwargs else args
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    cache.move_to_end(key)
+                    return entry[1]
+
+                call = in_flight.get(key)
+                leader = call is None
+                if leader:
+                    call = in_flight[key] = (threading.Event(), [])
+
+            done, shared = call
+            if not leader:
+                done.wait()
+                if shared:
+                    return shared[0]
+                # The shared call raised; make our own
+                return fn(*args, **kwargs)
+
+            try:
+                value = fn(*args, **kwargs)
+                shared.append(value)
+                if not (isinstance(value, dict) and value.get("error")):
+                    with lock:
+                        cache[key] = (time.monotonic() + lifetime(value), value)
+                        cache.move_to_end(key)
+                        while len(cache) > maxsize:
+                            cache.popitem(last=False)
+                return value
+            finally:
+                with lock:
+                    in_flight.pop(key, None)
+                done.set()
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        def cache_invalidate(*args, **kwargs):
+            key = args + tuple(sorted(kwargs.items())) if kwargs else args
+            with lock:
+                cache.pop(key, None)
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_invalidate = cache_invalidate
+        return wrapper
+
+    return decorator
+
+
+# Default worker count for batched tool calls (stays under the session pool)
+DEFAULT_CONCURRENCY = 8
+
+
+def run_parallel(fn, items, concurrency: int = DEFAULT_CONCURRENCY) -> list:
+    """
+    Call fn on each item concurrently, returning results in item order
+
+    Tool calls are network-bound, so a small thread pool overlaps their
+    round trips. 429s are still handled per request by the session's
+    retry policy.
+
+    Args:
+        fn: Single-argument callable (use a lambda to unpack arguments)
+        items: Iterable of arguments
+        concurrency: Maximum simultaneous calls
+
+    Returns:
+        list: fn(item) for each item
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as pool:
+        return list(pool.map(fn, items))
+
+
+def async_tool(fn):
+    """
+    Async variant of a blocking tool function
+
+    The call runs on the event loop's default thread pool, so async callers
+    (e.g. the webhook app) don't block the loop. It still goes through the
+    shared session and rate limiter.
+
+    Example:
+        add_jira_comment_async = async_tool(add_jira_comment)
+        await add_jira_comment_async("ECD-123", "Done")
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        import asyncio
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    return wrapper
+
+
+async def run_parallel_async(fn, items, concurrency: int = DEFAULT_CONCURRENCY) -> list:
+    """
+    Async counterpart of run_parallel: fn(item) for each item, in item order
+
+    Args:
+        fn: Single-argument blocking callable
+        items: Iterable of arguments
+        concurrency: Maximum simultaneous calls
+
+    Returns:
+        list: fn(item) for each item
+    """
+    # asyncio is imported here rather than at module level: it roughly
+    # doubles the import time of every tool, and only async callers need it
+    import asyncio
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(item):
+        async with semaphore:
+            return await asyncio.to_thread(fn, item)
+
+    return list(await asyncio.gather(*(call(item) for item in items)))
+
+
+# Largest page Jira serves for JQL search and Agile lists
+JIRA_PAGE_SIZE = 100
+
+
+def iter_jql_pages(payload: dict, max_results: Optional[int] = None):
+    """
+    Yield /search/jql result pages, following nextPageToken
+
+    The enhanced search endpoint only hands out one page token at a time,
+    so pages can't be fetched in parallel. Instead the next page is
+    requested in the background as soon as its token is known, while the
+    caller works through the current one.
+
+    Args:
+        payload: Search body (jql, fields, ...); maxResults is set per page
+        max_results: Maximum issues to yield in total (default: all)
+
+    Yields:
+        list: Raw issues of each page
+
+    Raises:
+        requests.HTTPError: For the first failed page (the response is
+                            attached as .response)
+    """
+    session = get_jira_session()
+    remaining = max_results if max_results is not None else float("inf")
+
+    def fetch(token):
+        body = dict(payload, maxResults=int(min(JIRA_PAGE_SIZE, remaining)))
+        if token:
+            body["nextPageToken"] = token
+        return session.post(
+            f"{JIRA_BASE_URL}/rest/api/3/search/jql",
+            data=encode_json(body),
+            timeout=DEFAULT_TIMEOUT
+        )
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(fetch, None)
+        while pending is not None:
+            response = pending.result()
+            if response.status_code != 200:
+                raise requests.HTTPError(f"Jira search failed ({response.status_code})", response=response)
+
+            data = decode_json(response)
+            page = data.get("issues", [])
+            if len(page) > remaining:
+                page = page[:remaining]
+            remaining -= len(page)
+
+            token = data.get("nextPageToken")
+            pending = None
+            if token and not data.get("isLast") and remaining > 0:
+                pending = pool.submit(fetch, token)
+
+            yield page
+
+
+def search_jql_pages(payload: dict, max_results: int) -> tuple:
+    """
+    Run a /search/jql query, following nextPageToken up to max_results issues
+
+    Args:
+        payload: Search body (jql, fields, ...); maxResults is set per page
+        max_results: Maximum issues to return
+
+    Returns:
+        tuple: (issues, None), or (None, response) for the first failed page
+    """
+    issues = []
+    try:
+        for page in iter_jql_pages(payload, max_results):
+            issues.extend(page)
+    except requests.HTTPError as e:
+        if e.response is None:
+            raise
+        return None, e.response
+    return issues, None
+
+
+def get_agile_pages(url: str, params: dict, max_results: int, items_key: str = "values") -> tuple:
+    """
+    GET a paginated Jira Agile list (startAt/maxResults) up to max_results items
+
+    When the first page reports a total, the remaining pages are fetched
+    concurrently; otherwise pages are followed until isLast.
+
+    Args:
+        url: Agile API list URL
+        params: Query parameters (startAt and maxResults are set per page)
+        max_results: Maximum items to return
+        items_key: Key holding the page's items ("values" or "issues")
+
+    Returns:
+        tuple: (items, total, None) - total is the server's count when it
+               reports one, else len(items) - or (None, None, response) for
+               the first failed page
+    """
+    session = get_jira_session()
+
+    def fetch(start: int, count: int):
+        return session.get(
+            url,
+            params={**params, "startAt": start, "maxResults": min(JIRA_PAGE_SIZE, count)},
+            timeout=DEFAULT_TIMEOUT
+        )
+
+    response = fetch(0, max_results)
+    if response.status_code != 200:
+        return None, None, response
+
+    data = decode_json(response)
+    items = list(data.get(items_key, []))
+    # The server may cap pages below JIRA_PAGE_SIZE; step by what it sent
+    step = len(items)
+
+    if step and data.get("total") is not None:
+        end = min(data["total"], max_results)
+        responses = run_parallel(
+            lambda start: fetch(start, min(step, end - start)),
+            range(step, end, step)
+        )
+        for response in responses:
+            if response.status_code != 200:
+                return None, None, response
+            items.extend(decode_json(response).get(items_key, []))
+    else:
+        while step and not data.get("isLast", True) and len(items) < max_results:
+            response = fetch(len(items), max_results - len(items))
+            if response.status_code != 200:
+                return None, None, response
+            data = decode_json(response)
+            page = data.get(items_key, [])
+            if not page:
+                break
+            items.extend(page)
+
+    items = items[:max_results]
+    return items, data.get("total", len(items)), None
+
+
 def format_error(status_code: int, message: str) -> dict:
     """
     Format a standardized error response
@@ -177,3 +889,31 @@ def format_error(status_code: int, message: str) -> dict:
         "status_code": status_code,
         "message": message
     }
+
+
+def format_response_error(response: requests.Response) -> dict:
+    """
+    Format a standardized error response from a failed API response
+
+    Throttled (429) and unavailable (503) responses are already retried by
+    the shared session, honoring Retry-After. If one still comes back, its
+    Retry-After is passed on as "retry_after" (seconds) so the caller can
+    wait that long instead of retrying straight away.
+
+    Args:
+        response: The non-success response
+
+    Returns:
+        dict: Error response structure
+    """
+    error = format_error(response.status_code, response.content.decode("utf-8", "replace"))
+
+    if response.status_code in (429, 503):
+        header = response.headers.get("Retry-After")
+        if header:
+            try:
+                error["retry_after"] = _RETRY_AFTER_PARSER.parse_retry_after(header)
+            except InvalidHeader:
+                pass
+
+    return error
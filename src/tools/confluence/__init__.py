@@ -6,13 +6,16 @@ Uses service account authentication for reliability.
 """
 
 from .get_page import get_confluence_page
-from .search import search_confluence
+from .search import SearchHit, search_confluence, search_confluence_all
 from .create_page import create_confluence_page
-from .update_page import update_confluence_page
+from .update_page import update_confluence_page, update_confluence_page_async
 
 __all__ = [
     "get_confluence_page",
+    "SearchHit",
     "search_confluence",
+    "search_confluence_all",
     "create_confluence_page",
-    "update_confluence_page"
+    "update_confluence_page",
+    "update_confluence_page_async"
 ]
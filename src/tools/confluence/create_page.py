@@ -9,14 +9,34 @@ Usage:
     python -m src.tools.confluence.create_page "Child Page" --parent-id 217088023 --body "<p>Content</p>"
 """
 
-import argparse
-import json
-import sys
 from typing import Optional
 
 import requests
 
-from ..base import get_confluence_auth_headers, CONFLUENCE_BASE_URL, format_error
+from ..base import get_confluence_session, CONFLUENCE_BASE_URL, confluence_web_url, decode_json, encode_json, DEFAULT_TIMEOUT, format_error, format_response_error, write_output
+
+
+# Initial body for new customer release notes pages
+DEFAULT_RELEASE_TEMPLATE = """
+<h2>Overview</h2>
+<p>This release includes new features and improvements to Evidence Cloud.</p>
+
+<h2>What's New</h2>
+<p><em>Features will be added as they are completed during the sprint.</em></p>
+
+<h2>Details by Module</h2>
+<table>
+<tr>
+<th>Module</th>
+<th>Feature</th>
+<th>Description</th>
+<th>Jira Key</th>
+</tr>
+</table>
+
+<h2>Known Issues</h2>
+<p>None reported.</p>
+"""
 
 
 def create_confluence_page(
@@ -70,17 +90,16 @@ def create_confluence_page(
         if parent_id:
             payload["ancestors"] = [{"id": parent_id}]
 
-        response = requests.post(
+        response = get_confluence_session().post(
             url,
-            headers=get_confluence_auth_headers(),
-            json=payload,
-            timeout=30
+            data=encode_json(payload),
+            timeout=DEFAULT_TIMEOUT
         )
 
         if response.status_code not in [200, 201]:
-            return format_error(response.status_code, response.text)
+            return format_response_error(response)
 
-        data = response.json()
+        data = decode_json(response)
 
         result = {
             "id": data.get("id"),
@@ -88,13 +107,9 @@ def create_confluence_page(
             "space_key": data.get("space", {}).get("key"),
             "version": data.get("version", {}).get("number", 1),
             "status": data.get("status"),
-            "url": data.get("_links", {}).get("webui", "")
+            "url": confluence_web_url(data.get("_links", {}).get("webui", ""))
         }
 
-        # Add base URL to relative links
-        if result["url"] and not result["url"].startswith("http"):
-            result["url"] = f"https://citemed.atlassian.net/wiki{result['url']}"
-
         return result
 
     except requests.exceptions.Timeout:
@@ -124,26 +139,7 @@ def create_release_notes_page(
     title = f"Customer Release Notes – Evidence Cloud {version}"
 
     if initial_content is None:
-        initial_content = f"""
-<h2>Overview</h2>
-<p>This release includes new features and improvements to Evidence Cloud.</p>
-
-<h2>What's New</h2>
-<p><em>Features will be added as they are completed during the sprint.</em></p>
-
-<h2>Details by Module</h2>
-<table>
-<tr>
-<th>Module</th>
-<th>Feature</th>
-<th>Description</th>
-<th>Jira Key</th>
-</tr>
-</table>
-
-<h2>Known Issues</h2>
-<p>None reported.</p>
-"""
+        initial_content = DEFAULT_RELEASE_TEMPLATE
 
     return create_confluence_page(
         title=title,
@@ -155,6 +151,11 @@ def create_release_notes_page(
 
 
 def main():
+    # CLI-only imports, kept out of the library import path
+    import argparse
+    import json
+    import sys
+
     parser = argparse.ArgumentParser(
         description="Create a Confluence page",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -176,6 +177,7 @@ Examples:
     parser.add_argument("--parent-id", help="Parent page ID")
     parser.add_argument("--format", choices=["storage"], default="storage")
     parser.add_argument("--status", choices=["current", "draft"], default="current")
+    parser.add_argument("--pretty", action="store_true", help="Indent JSON output (default: compact)")
 
     args = parser.parse_args()
 
@@ -188,7 +190,7 @@ Examples:
             content_format=args.format,
             status=args.status
         )
-        print(json.dumps(result, indent=2))
+        write_output(result, pretty=args.pretty)
 
         if result.get("error"):
             sys.exit(1)
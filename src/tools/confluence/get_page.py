@@ -9,14 +9,79 @@ Usage:
     python -m src.tools.confluence.get_page 217088023 --format adf
 """
 
-import argparse
-import json
-import sys
-from typing import Optional
-
 import requests
 
-from ..base import get_confluence_auth_headers, CONFLUENCE_BASE_URL, format_error
+from ..base import get_confluence_session, CONFLUENCE_BASE_URL, confluence_web_url, decode_json, DEFAULT_TIMEOUT, format_error, format_response_error, write_output, ttl_cache
+
+# Optional: stream-parse page responses instead of loading the whole body
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# How long read-only page lookups are served from cache
+PAGE_CACHE_SECONDS = 60
+
+# Expand strings per body format (unknown formats are built on demand)
+PAGE_EXPAND_COMMON = "version,space,history,ancestors"
+PAGE_EXPAND = {
+    fmt: f"body.{fmt},{PAGE_EXPAND_COMMON}"
+    for fmt in ("storage", "view", "export_view", "atlas_doc_format")
+}
+
+# Shared default for missing sub-objects (read-only, never mutated)
+_EMPTY = {}
+
+# Scalar fields read from the page response, as ijson prefixes
+PAGE_FIELDS = (
+    "id", "title", "status",
+    "space.key", "space.id",
+    "version.number", "version.when",
+    "history.createdDate", "history.createdBy.displayName",
+    "_links.webui",
+)
+
+
+def _stream_page(response: requests.Response, content_format: str) -> dict:
+    """
+    Stream-parse a page response, keeping only the fields we return
+
+    Builds a sparse dict with the same nesting as the full response, so
+    large sections we don't use (history, expandable links, etc.) are
+    never materialized.
+
+    Args:
+        response: Streamed response (stream=True)
+        content_format: Body format requested in the expand
+
+    Returns:
+        dict: Sparse page data
+    """
+    wanted = set(PAGE_FIELDS)
+    wanted.add(f"body.{content_format}.value")
+
+    data = {}
+    ancestors = []
+    response.raw.decode_content = True
+    try:
+        for prefix, event, value in ijson.parse(response.raw, use_float=True):
+            if event in ("start_map", "end_map", "start_array", "end_array", "map_key"):
+                continue
+            if prefix == "ancestors.item.id":
+                ancestors.append({"id": value})
+            elif prefix in wanted:
+                *parents, leaf = prefix.split(".")
+                node = data
+                for key in parents:
+                    node = node.setdefault(key, {})
+                node[leaf] = value
+    except ijson.JSONError as e:
+        raise requests.exceptions.InvalidJSONError(str(e), response=response)
+
+    if ancestors:
+        data["ancestors"] = ancestors
+    return data
 
 
 def get_confluence_page(
@@ -30,7 +95,8 @@ def get_confluence_page(
     Args:
         page_id: The numeric page ID
         content_format: Format for body content - "storage" (HTML), "view", or "export_view"
-        include_version: Include version info (needed for updates)
+        include_version: Include version info (needed for updates). When False,
+            a copy of a result fetched in the last PAGE_CACHE_SECONDS may be returned.
 
     Returns:
         dict: {
@@ -47,24 +113,32 @@ def get_confluence_page(
             "updated_by": "Name"
         }
     """
+    if include_version:
+        return _fetch_confluence_page(page_id, content_format)
+    return dict(_fetch_confluence_page_cached(page_id, content_format))
+
+
+def _fetch_confluence_page(page_id: str, content_format: str) -> dict:
+    """Fetch and simplify a page (uncached; see get_confluence_page)"""
     try:
         # Use v1 API which has broader permissions with service account
         url = f"{CONFLUENCE_BASE_URL}/wiki/rest/api/content/{page_id}"
-        params = {
-            "expand": f"body.{content_format},version,space,history,ancestors"
-        }
+        expand = PAGE_EXPAND.get(content_format) or f"body.{content_format},{PAGE_EXPAND_COMMON}"
+        params = {"expand": expand}
 
-        response = requests.get(
+        with get_confluence_session().get(
             url,
-            headers=get_confluence_auth_headers(),
             params=params,
-            timeout=30
-        )
-
-        if response.status_code != 200:
-            return format_error(response.status_code, response.text)
+            stream=HAS_IJSON,
+            timeout=DEFAULT_TIMEOUT
+        ) as response:
+            if response.status_code != 200:
+                return format_response_error(response)
 
-        data = response.json()
+            if HAS_IJSON:
+                data = _stream_page(response, content_format)
+            else:
+                data = decode_json(response)
 
         # Extract body content
         body_content = ""
@@ -76,25 +150,25 @@ def get_confluence_page(
         if data.get("ancestors"):
             parent_id = data["ancestors"][-1].get("id")
 
+        space = data.get("space") or _EMPTY
+        version = data.get("version") or _EMPTY
+        history = data.get("history") or _EMPTY
+
         result = {
             "id": data.get("id"),
             "title": data.get("title"),
-            "space_key": data.get("space", {}).get("key"),
-            "space_id": data.get("space", {}).get("id"),
+            "space_key": space.get("key"),
+            "space_id": space.get("id"),
             "parent_id": parent_id,
-            "version": data.get("version", {}).get("number"),
+            "version": version.get("number"),
             "body": body_content,
             "status": data.get("status"),
-            "created_at": data.get("history", {}).get("createdDate"),
-            "updated_at": data.get("version", {}).get("when"),
-            "created_by": data.get("history", {}).get("createdBy", {}).get("displayName"),
-            "url": data.get("_links", {}).get("webui", "")
+            "created_at": history.get("createdDate"),
+            "updated_at": version.get("when"),
+            "created_by": (history.get("createdBy") or _EMPTY).get("displayName"),
+            "url": confluence_web_url((data.get("_links") or _EMPTY).get("webui", ""))
         }
 
-        # Add base URL to relative links
-        if result["url"] and not result["url"].startswith("http"):
-            result["url"] = f"https://citemed.atlassian.net/wiki{result['url']}"
-
         return result
 
     except requests.exceptions.Timeout:
@@ -103,7 +177,21 @@ def get_confluence_page(
         return format_error(500, str(e))
 
 
+# Read-only lookups (include_version=False) share a short-lived cache
+_fetch_confluence_page_cached = ttl_cache(seconds=PAGE_CACHE_SECONDS, maxsize=256)(_fetch_confluence_page)
+
+
+def clear_page_cache():
+    """Forget cached page lookups (call after updating a page)"""
+    _fetch_confluence_page_cached.cache_clear()
+
+
 def main():
+    # CLI-only imports, kept out of the library import path
+    import argparse
+    import json
+    import sys
+
     parser = argparse.ArgumentParser(
         description="Get a Confluence page by ID",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -126,12 +214,13 @@ Examples:
         default="storage",
         help="Body content format (default: storage)"
     )
+    parser.add_argument("--pretty", action="store_true", help="Indent JSON output (default: compact)")
 
     args = parser.parse_args()
 
     try:
         result = get_confluence_page(args.page_id, args.format)
-        print(json.dumps(result, indent=2))
+        write_output(result, pretty=args.pretty)
 
         if result.get("error"):
             sys.exit(1)
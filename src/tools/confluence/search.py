@@ -7,23 +7,76 @@ Mirrors: mcp__atlassian__searchConfluenceUsingCql
 Usage:
     python -m src.tools.confluence.search "title ~ 'Release Notes'"
     python -m src.tools.confluence.search "space = ECD AND type = page" --limit 20
+    python -m src.tools.confluence.search "space = ECD AND type = page" --all
 """
 
-import argparse
-import json
-import sys
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import requests
 
-from ..base import get_confluence_auth_headers, CONFLUENCE_BASE_URL, format_error
+from ..base import get_confluence_session, CONFLUENCE_BASE_URL, confluence_web_url, decode_json, DEFAULT_TIMEOUT, format_error, format_response_error, write_output, run_parallel
+
+
+# Shared default for missing sub-objects (read-only, never mutated)
+_EMPTY = {}
+
+# Fields returned by search_pages_by_title
+TITLE_SEARCH_FIELDS = frozenset({"id", "title", "url"})
+
+
+class SearchHit(NamedTuple):
+    """A simplified search result (returned by search_confluence(hits=True))"""
+    id: Optional[str]
+    title: Optional[str]
+    type: Optional[str]
+    status: Optional[str]
+    space_key: Optional[str]
+    url: str
+    excerpt: Optional[str]
+
+    def to_dict(self, fields: Optional[frozenset] = None) -> dict:
+        """
+        JSON-friendly dict; excerpt is only included when present
+
+        Args:
+            fields: Optional projection (id and title are always included)
+        """
+        if fields is None:
+            simplified = self._asdict()
+        else:
+            simplified = {
+                name: value for name, value in zip(self._fields, self)
+                if name in fields or name in ("id", "title")
+            }
+        if not self.excerpt:
+            simplified.pop("excerpt", None)
+        return simplified
+
+
+# Every optional SearchHit field (the default projection)
+ALL_SEARCH_FIELDS = frozenset(SearchHit._fields)
+
+
+def _simplify_result(result: dict, fields: frozenset = ALL_SEARCH_FIELDS) -> SearchHit:
+    """Reduce a raw search result to the fields the tools return (None if not requested)"""
+    return SearchHit(
+        result.get("id"),
+        result.get("title"),
+        result.get("type") if "type" in fields else None,
+        result.get("status") if "status" in fields else None,
+        (result.get("space") or _EMPTY).get("key") if "space_key" in fields else None,
+        confluence_web_url((result.get("_links") or _EMPTY).get("webui", "")) if "url" in fields else "",
+        (result.get("excerpt") or None) if "excerpt" in fields else None
+    )
 
 
 def search_confluence(
     cql: str,
     limit: int = 25,
     start: int = 0,
-    expand: Optional[list] = None
+    expand: Optional[list] = None,
+    hits: bool = False,
+    fields: Optional[frozenset] = None
 ) -> dict:
     """
     Search Confluence using CQL (Confluence Query Language)
@@ -33,6 +86,8 @@ def search_confluence(
         limit: Maximum results to return (default 25, max 250)
         start: Starting index for pagination
         expand: List of properties to expand (e.g., ["body.storage", "version"])
+        hits: Return results as SearchHit tuples instead of dicts (in-process callers)
+        fields: Only build these result fields (id and title are always included)
 
     Returns:
         dict: {
@@ -61,39 +116,21 @@ def search_confluence(
         if expand:
             params["expand"] = ",".join(expand)
 
-        response = requests.get(
+        response = get_confluence_session().get(
             url,
-            headers=get_confluence_auth_headers(),
             params=params,
-            timeout=30
+            timeout=DEFAULT_TIMEOUT
         )
 
         if response.status_code != 200:
-            return format_error(response.status_code, response.text)
-
-        data = response.json()
+            return format_response_error(response)
 
-        # Simplify results
-        simplified_results = []
-        for result in data.get("results", []):
-            simplified = {
-                "id": result.get("id"),
-                "title": result.get("title"),
-                "type": result.get("type"),
-                "status": result.get("status"),
-                "space_key": result.get("space", {}).get("key") if result.get("space") else None,
-                "url": result.get("_links", {}).get("webui", "")
-            }
+        data = decode_json(response)
 
-            # Add base URL to relative links
-            if simplified["url"] and not simplified["url"].startswith("http"):
-                simplified["url"] = f"https://citemed.atlassian.net/wiki{simplified['url']}"
-
-            # Include excerpt if available
-            if result.get("excerpt"):
-                simplified["excerpt"] = result.get("excerpt")
-
-            simplified_results.append(simplified)
+        projection = ALL_SEARCH_FIELDS if fields is None else fields
+        simplified_results = [_simplify_result(result, projection) for result in data.get("results", [])]
+        if not hits:
+            simplified_results = [hit.to_dict(fields) for hit in simplified_results]
 
         return {
             "total": data.get("totalSize", len(simplified_results)),
@@ -107,6 +144,63 @@ def search_confluence(
         return format_error(500, str(e))
 
 
+def search_confluence_all(
+    cql: str,
+    page_size: int = 250,
+    expand: Optional[list] = None,
+    hits: bool = False,
+    fields: Optional[frozenset] = None
+) -> dict:
+    """
+    Fetch every result for a CQL query
+
+    Fetches the first page to learn the total and the page size the
+    server actually returns (Confluence caps `limit`, lower when bodies
+    are expanded), then requests the remaining pages concurrently over
+    the shared session.
+
+    Args:
+        cql: CQL query string
+        page_size: Results per request (max 250)
+        expand: List of properties to expand
+        hits: Return results as SearchHit tuples instead of dicts
+        fields: Only build these result fields (id and title are always included)
+
+    Returns:
+        dict: Same shape as search_confluence, with all results
+    """
+    page_size = min(page_size, 250)
+    first = search_confluence(cql, limit=page_size, start=0, expand=expand, hits=hits, fields=fields)
+    if first.get("error"):
+        return first
+
+    # Step by what came back, not what was asked for, so no results are skipped
+    step = len(first["results"])
+    if not step:
+        return first
+
+    starts = range(step, first["total"], step)
+    if not starts:
+        return first
+
+    pages = run_parallel(
+        lambda start: search_confluence(cql, limit=step, start=start, expand=expand, hits=hits, fields=fields),
+        starts
+    )
+
+    results = first["results"]
+    for page in pages:
+        if page.get("error"):
+            return page
+        results.extend(page["results"])
+
+    return {
+        "total": first["total"],
+        "count": len(results),
+        "results": results
+    }
+
+
 def search_pages_by_title(title: str, space_key: Optional[str] = None, limit: int = 10) -> dict:
     """
     Convenience function to search pages by title
@@ -123,10 +217,15 @@ def search_pages_by_title(title: str, space_key: Optional[str] = None, limit: in
     if space_key:
         cql += f' AND space = "{space_key}"'
 
-    return search_confluence(cql, limit=limit)
+    return search_confluence(cql, limit=limit, fields=TITLE_SEARCH_FIELDS)
 
 
 def main():
+    # CLI-only imports, kept out of the library import path
+    import argparse
+    import json
+    import sys
+
     parser = argparse.ArgumentParser(
         description="Search Confluence using CQL",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -143,17 +242,25 @@ Examples:
 
     # Search recently modified
     python -m src.tools.confluence.search "lastModified >= now('-7d')" --limit 20
+
+    # Fetch every matching page
+    python -m src.tools.confluence.search "space = ECD AND type = page" --all
         """
     )
     parser.add_argument("cql", help="CQL query string")
     parser.add_argument("--limit", type=int, default=25, help="Maximum results (default: 25)")
     parser.add_argument("--start", type=int, default=0, help="Starting index for pagination")
+    parser.add_argument("--all", action="store_true", help="Fetch every page of results (--limit sets the page size)")
+    parser.add_argument("--pretty", action="store_true", help="Indent JSON output (default: compact)")
 
     args = parser.parse_args()
 
     try:
-        result = search_confluence(args.cql, args.limit, args.start)
-        print(json.dumps(result, indent=2))
+        if args.all:
+            result = search_confluence_all(args.cql, page_size=args.limit)
+        else:
+            result = search_confluence(args.cql, args.limit, args.start)
+        write_output(result, pretty=args.pretty)
 
         if result.get("error"):
             sys.exit(1)
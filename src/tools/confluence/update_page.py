@@ -9,15 +9,63 @@ Usage:
     python -m src.tools.confluence.update_page 217088023 --title "New Title" --body "<p>Content</p>"
 """
 
-import argparse
-import json
-import sys
+import functools
+import re
+import threading
+from collections import OrderedDict
+from operator import itemgetter
 from typing import Optional
 
 import requests
 
-from ..base import get_confluence_auth_headers, CONFLUENCE_BASE_URL, format_error
-from .get_page import get_confluence_page
+from ..base import async_tool, get_confluence_session, CONFLUENCE_BASE_URL, confluence_web_url, decode_json, encode_json, encode_json_body, DEFAULT_TIMEOUT, format_error, format_response_error, write_output
+from .get_page import clear_page_cache, get_confluence_page
+
+# Release-notes anchors: the named sections, any other h2, and table ends
+RELEASE_NOTES_ANCHORS = r"<h2>(?P<section>What's New|Known Issues)</h2>|<h2>|</table>"
+
+# Pages as we last wrote them, so edit helpers can skip re-fetching a page
+# they just updated. Keyed by page ID; holds the storage body, title and
+# the version our write created. A stale entry (someone else edited the
+# page) makes the next PUT fail with a version conflict, which drops it.
+WRITTEN_PAGES_MAX = 500
+
+# Responses to a PUT based on an outdated page version
+VERSION_CONFLICT_CODES = (409, 412)
+_written_pages = OrderedDict()
+_written_pages_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=256)
+def _release_notes_scanner(jira_key: str) -> re.Pattern:
+    """
+    Single-pass scanner for a release-notes page: the release-notes anchors
+    plus the whole Jira key (ECD-12 but not inside ECD-123 or XECD-12) as
+    the "key" group
+    """
+    return re.compile(rf"(?P<key>(?<![\w-]){re.escape(jira_key)}(?!\d))|{RELEASE_NOTES_ANCHORS}")
+
+
+def _page_for_edit(page_id: str) -> dict:
+    """Current storage-format page: our last write if known, else fetched"""
+    with _written_pages_lock:
+        page = _written_pages.get(page_id)
+        if page is not None:
+            _written_pages.move_to_end(page_id)
+            return dict(page)
+    return get_confluence_page(page_id, content_format="storage")
+
+
+def _remember_written_page(page_id: str, page: Optional[dict]):
+    """Record (or, with page=None, forget) the page as last written"""
+    with _written_pages_lock:
+        if page is None:
+            _written_pages.pop(page_id, None)
+            return
+        _written_pages[page_id] = page
+        _written_pages.move_to_end(page_id)
+        while len(_written_pages) > WRITTEN_PAGES_MAX:
+            _written_pages.popitem(last=False)
 
 
 def update_confluence_page(
@@ -48,15 +96,38 @@ def update_confluence_page(
         }
     """
     try:
-        # If version not provided, fetch current page to get it
+        # If version not provided, fetch current page to get it (always live:
+        # our last write may have been edited since)
+        live_page = None
         if version is None or title is None:
-            current_page = get_confluence_page(page_id)
-            if current_page.get("error"):
-                return current_page
+            live_page = get_confluence_page(page_id, content_format="storage")
+            if live_page.get("error"):
+                return live_page
             if version is None:
-                version = current_page.get("version", 1)
+                version = live_page.get("version", 1)
             if title is None:
-                title = current_page.get("title", "Untitled")
+                title = live_page.get("title", "Untitled")
+
+        # Skip the PUT (and the version bump) when nothing would change. Only
+        # a page fetched by this call can show that; with a caller-supplied
+        # version, the PUT's version check decides.
+        if (
+            live_page
+            and content_format == "storage"
+            and live_page.get("version") == version
+            and live_page.get("title") == title
+            and live_page.get("body") == body
+        ):
+            return {
+                "skipped": True,
+                "message": "Page content is unchanged",
+                "page_id": page_id,
+                "id": page_id,
+                "title": title,
+                "version": version,
+                "space_key": live_page.get("space_key"),
+                "url": live_page.get("url")
+            }
 
         # Use v1 API which has broader permissions with service account
         url = f"{CONFLUENCE_BASE_URL}/wiki/rest/api/content/{page_id}"
@@ -78,116 +149,186 @@ def update_confluence_page(
         if version_message:
             payload["version"]["message"] = version_message
 
-        response = requests.put(
+        data, headers = encode_json_body(payload)
+        response = get_confluence_session().put(
             url,
-            headers=get_confluence_auth_headers(),
-            json=payload,
-            timeout=30
+            data=data,
+            headers=headers,
+            timeout=DEFAULT_TIMEOUT
         )
 
-        if response.status_code not in [200, 204]:
-            return format_error(response.status_code, response.text)
+        if response.status_code == 415 and headers:
+            # Endpoint doesn't take compressed bodies; send it plain
+            response = get_confluence_session().put(
+                url,
+                data=encode_json(payload),
+                timeout=DEFAULT_TIMEOUT
+            )
 
-        data = response.json()
+        if response.status_code not in [200, 204]:
+            _remember_written_page(page_id, None)
+            if response.status_code in VERSION_CONFLICT_CODES:
+                # Someone else changed the page; cached copies are stale too
+                clear_page_cache()
+            return format_response_error(response)
+
+        # Drop cached read-only copies of the old content
+        clear_page_cache()
+
+        data = decode_json(response)
+
+        if content_format == "storage":
+            _remember_written_page(page_id, {
+                "id": page_id,
+                "title": title,
+                "version": data.get("version", {}).get("number", version + 1),
+                "body": body
+            })
+        else:
+            _remember_written_page(page_id, None)
 
         result = {
             "id": data.get("id"),
             "title": data.get("title"),
             "version": data.get("version", {}).get("number", version + 1),
             "space_key": data.get("space", {}).get("key"),
-            "url": data.get("_links", {}).get("webui", "")
+            "url": confluence_web_url(data.get("_links", {}).get("webui", ""))
         }
 
-        if result["url"] and not result["url"].startswith("http"):
-            result["url"] = f"https://citemed.atlassian.net/wiki{result['url']}"
-
         return result
 
     except requests.exceptions.Timeout:
+        _remember_written_page(page_id, None)
         return format_error(408, "Request timed out")
     except requests.exceptions.RequestException as e:
+        _remember_written_page(page_id, None)
         return format_error(500, str(e))
 
 
-def append_to_page(
-    page_id: str,
-    content_to_append: str,
-    section_marker: Optional[str] = None
-) -> dict:
+update_confluence_page_async = async_tool(update_confluence_page)
+
+
+def _splice_body(body: str, inserts: list) -> str:
     """
-    Append content to an existing page, optionally at a specific section
+    Insert text into a page body, building the new body in one join
+
+    Args:
+        body: Current page body
+        inserts: (offset, text) pairs in offset order; equal offsets keep
+                 their list order
+
+    Returns:
+        str: The new body
+    """
+    parts = []
+    pos = 0
+    for insert_at, text in inserts:
+        if insert_at > pos:
+            parts.append(body[pos:insert_at])
+            pos = insert_at
+        parts.append(text)
+    parts.append(body[pos:])
+    return "".join(parts)
+
+
+def _apply_page_edit(page_id: str, edit, version_message: str) -> dict:
+    """
+    Apply edit(current_body) to a page, retrying once on a version conflict
+
+    If someone else changed the page since we read it, the PUT fails with
+    409/412; the page is then re-read and the edit re-applied to the new
+    content.
 
     Args:
         page_id: The numeric page ID
-        content_to_append: HTML content to append
-        section_marker: Optional HTML marker to insert before (e.g., "<h2>Known Issues</h2>")
+        edit: Returns the new body, or a result dict to return without
+              updating (e.g. a skip)
+        version_message: Message for the new page version
 
     Returns:
         dict: Updated page info
     """
-    # Get current page content
-    current_page = get_confluence_page(page_id, content_format="storage")
-    if current_page.get("error"):
-        return current_page
+    for _ in range(2):
+        current_page = _page_for_edit(page_id)
+        if current_page.get("error"):
+            return current_page
 
-    current_body = current_page.get("body", "")
-    current_version = current_page.get("version", 1)
-    title = current_page.get("title")
+        new_body = edit(current_page.get("body", ""))
+        if isinstance(new_body, dict):
+            return new_body
 
-    # Insert content
-    if section_marker and section_marker in current_body:
-        # Insert before the section marker
-        new_body = current_body.replace(
-            section_marker,
-            f"{content_to_append}\n\n{section_marker}"
+        result = update_confluence_page(
+            page_id=page_id,
+            body=new_body,
+            title=current_page.get("title"),
+            version=current_page.get("version", 1),
+            version_message=version_message
         )
+        if result.get("status_code") not in VERSION_CONFLICT_CODES:
+            break
+
+    return result
+
+
+def _appended_body(current_body: str, content_to_append: str, section_marker: Optional[str]) -> str:
+    """Page body with content inserted before section_marker, or at the end"""
+    marker_idx = current_body.find(section_marker) if section_marker else -1
+    if marker_idx != -1:
+        # Insert before the section marker
+        inserts = [(marker_idx, content_to_append), (marker_idx, "\n\n")]
     else:
         # Append to end
-        new_body = f"{current_body}\n\n{content_to_append}"
-
-    return update_confluence_page(
-        page_id=page_id,
-        body=new_body,
-        title=title,
-        version=current_version,
-        version_message="Added new content"
-    )
+        inserts = [(len(current_body), "\n\n"), (len(current_body), content_to_append)]
 
+    return _splice_body(current_body, inserts)
 
-def add_feature_to_release_notes(
+
+def append_to_page(
     page_id: str,
-    jira_key: str,
-    feature_title: str,
-    description: str,
-    module: str = "General"
+    content_to_append: str,
+    section_marker: Optional[str] = None
 ) -> dict:
     """
-    Add a feature entry to a release notes page
+    Append content to an existing page, optionally at a specific section
 
     Args:
-        page_id: Release notes page ID
-        jira_key: Jira ticket key (e.g., "ECD-123")
-        feature_title: Short feature title
-        description: Marketing-style description of the feature
-        module: Which module/area the feature belongs to
+        page_id: The numeric page ID
+        content_to_append: HTML content to append
+        section_marker: Optional HTML marker to insert before (e.g., "<h2>Known Issues</h2>")
 
     Returns:
         dict: Updated page info
     """
-    # Get current page
-    current_page = get_confluence_page(page_id, content_format="storage")
-    if current_page.get("error"):
-        return current_page
-
-    current_body = current_page.get("body", "")
-
-    # Check if this Jira key is already in the page
-    if jira_key in current_body:
-        return {
-            "skipped": True,
-            "message": f"{jira_key} already exists in the release notes",
-            "page_id": page_id
-        }
+    return _apply_page_edit(
+        page_id,
+        lambda current_body: _appended_body(current_body, content_to_append, section_marker),
+        "Added new content"
+    )
+
+
+def _release_notes_body(
+    current_body: str,
+    jira_key: str,
+    feature_title: str,
+    description: str,
+    module: str
+) -> Optional[str]:
+    """Release notes body with the feature added, or None if jira_key is already there"""
+    # One scan for the Jira key, the section headers and the first table
+    whats_new_end = next_h2 = known_issues = table_end = None
+    for match in _release_notes_scanner(jira_key).finditer(current_body):
+        if match.group("key"):
+            return None
+        elif match.group() == "</table>":
+            if table_end is None:
+                table_end = match.start()
+        elif whats_new_end is not None:
+            if next_h2 is None:
+                next_h2 = match.start()
+        elif match.group("section") == "What's New":
+            whats_new_end = match.end()
+        elif match.group("section") == "Known Issues" and known_issues is None:
+            known_issues = match.start()
 
     # Create the feature entry HTML
     feature_html = f"""
@@ -204,46 +345,65 @@ def add_feature_to_release_notes(
 <td><a href="https://citemed.atlassian.net/browse/{jira_key}">{jira_key}</a></td>
 </tr>"""
 
-    # Try to insert into "What's New" section
-    if "<h2>What's New</h2>" in current_body:
-        # Find the next h2 after "What's New"
-        whats_new_idx = current_body.index("<h2>What's New</h2>")
-        rest_of_page = current_body[whats_new_idx + len("<h2>What's New</h2>"):]
-
-        # Find next section header
-        next_h2 = rest_of_page.find("<h2>")
-        if next_h2 != -1:
-            insert_point = whats_new_idx + len("<h2>What's New</h2>") + next_h2
-            new_body = current_body[:insert_point] + feature_html + "\n" + current_body[insert_point:]
+    if whats_new_end is not None:
+        # Insert at the end of the "What's New" section
+        if next_h2 is not None:
+            inserts = [(next_h2, f"{feature_html}\n")]
         else:
-            new_body = current_body.replace(
-                "<h2>What's New</h2>",
-                f"<h2>What's New</h2>\n{feature_html}"
-            )
+            inserts = [(whats_new_end, f"\n{feature_html}")]
+    elif known_issues is not None:
+        # Otherwise before Known Issues
+        inserts = [(known_issues, f"{feature_html}\n\n")]
     else:
-        # Append before Known Issues if exists, otherwise at end
-        if "<h2>Known Issues</h2>" in current_body:
-            new_body = current_body.replace(
-                "<h2>Known Issues</h2>",
-                f"{feature_html}\n\n<h2>Known Issues</h2>"
-            )
-        else:
-            new_body = f"{current_body}\n\n{feature_html}"
+        inserts = [(len(current_body), f"\n\n{feature_html}")]
 
     # Add table row if table exists
-    if "</table>" in new_body:
-        new_body = new_body.replace("</table>", f"{table_row}\n</table>")
-
-    return update_confluence_page(
-        page_id=page_id,
-        body=new_body,
-        title=current_page.get("title"),
-        version=current_page.get("version"),
-        version_message=f"Added feature: {jira_key} - {feature_title}"
-    )
+    if table_end is not None:
+        inserts.append((table_end, f"{table_row}\n"))
+    inserts.sort(key=itemgetter(0))
+
+    return _splice_body(current_body, inserts)
+
+
+def add_feature_to_release_notes(
+    page_id: str,
+    jira_key: str,
+    feature_title: str,
+    description: str,
+    module: str = "General"
+) -> dict:
+    """
+    Add a feature entry to a release notes page
+
+    Args:
+        page_id: Release notes page ID
+        jira_key: Jira ticket key (e.g., "ECD-123")
+        feature_title: Short feature title
+        description: Marketing-style description of the feature
+        module: Which module/area the feature belongs to
+
+    Returns:
+        dict: Updated page info
+    """
+    def edit(current_body):
+        new_body = _release_notes_body(current_body, jira_key, feature_title, description, module)
+        if new_body is None:
+            return {
+                "skipped": True,
+                "message": f"{jira_key} already exists in the release notes",
+                "page_id": page_id
+            }
+        return new_body
+
+    return _apply_page_edit(page_id, edit, f"Added feature: {jira_key} - {feature_title}")
 
 
 def main():
+    # CLI-only imports, kept out of the library import path
+    import argparse
+    import json
+    import sys
+
     parser = argparse.ArgumentParser(
         description="Update a Confluence page",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -265,6 +425,7 @@ Examples:
     parser.add_argument("--version", type=int, help="Current version number (auto-fetched if not provided)")
     parser.add_argument("--format", choices=["storage", "atlas_doc_format"], default="storage")
     parser.add_argument("--message", help="Version message describing the update")
+    parser.add_argument("--pretty", action="store_true", help="Indent JSON output (default: compact)")
 
     args = parser.parse_args()
 
@@ -277,7 +438,7 @@ Examples:
             content_format=args.format,
             version_message=args.message
         )
-        print(json.dumps(result, indent=2))
+        write_output(result, pretty=args.pretty)
 
         if result.get("error"):
             sys.exit(1)
@@ -4,22 +4,32 @@ Jira API Tools
 Direct REST API tools for Jira operations.
 """
 
-from .search import search_jira
-from .get_issue import get_jira_issue
-from .add_comment import add_jira_comment
-from .edit_issue import edit_jira_issue
-from .transition_issue import transition_jira_issue
-from .get_transitions import get_jira_transitions
-from .lookup_user import lookup_jira_user
-from .list_projects import list_jira_projects
+import importlib
 
-__all__ = [
-    "search_jira",
-    "get_jira_issue",
-    "add_jira_comment",
-    "edit_jira_issue",
-    "transition_jira_issue",
-    "get_jira_transitions",
-    "lookup_jira_user",
-    "list_jira_projects",
-]
+# Public name -> defining module; imported on first use, so the CLIs'
+# daemon client (client.py) doesn't load every tool and requests
+_EXPORTS = {
+    "search_jira": ".search",
+    "iter_search_jira": ".search",
+    "get_jira_issue": ".get_issue",
+    "add_jira_comment": ".add_comment",
+    "add_jira_comment_async": ".add_comment",
+    "batch_add_jira_comments": ".add_comment",
+    "edit_jira_issue": ".edit_issue",
+    "edit_jira_issue_async": ".edit_issue",
+    "bulk_edit_jira_issues": ".edit_issue",
+    "transition_jira_issue": ".transition_issue",
+    "transition_jira_issue_async": ".transition_issue",
+    "bulk_transition_jira_issues": ".transition_issue",
+    "get_jira_transitions": ".get_transitions",
+    "lookup_jira_user": ".lookup_user",
+    "list_jira_projects": ".list_projects",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -17,7 +17,7 @@ from typing import Optional
 
 import requests
 
-from ..base import get_jira_auth_headers, JIRA_BASE_URL, build_adf_comment, format_error
+from ..base import async_tool, get_jira_session, JIRA_BASE_URL, build_adf_comment, DEFAULT_TIMEOUT, decode_json, encode_json, format_error, format_response_error, run_parallel, write_output
 
 
 def add_jira_comment(
@@ -55,17 +55,16 @@ def add_jira_comment(
         payload["visibility"] = visibility
 
     try:
-        response = requests.post(
+        response = get_jira_session().post(
             f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}/comment",
-            headers=get_jira_auth_headers(),
-            json=payload,
-            timeout=30
+            data=encode_json(payload),
+            timeout=DEFAULT_TIMEOUT
         )
 
         if response.status_code not in [200, 201]:
-            return format_error(response.status_code, response.text)
+            return format_response_error(response)
 
-        data = response.json()
+        data = decode_json(response)
 
         return {
             "success": True,
@@ -83,6 +82,23 @@ def add_jira_comment(
         return format_error(500, str(e))
 
 
+add_jira_comment_async = async_tool(add_jira_comment)
+
+
+def batch_add_jira_comments(comments: list) -> list:
+    """
+    Add several comments concurrently
+
+    Args:
+        comments: List of add_jira_comment kwargs dicts
+                  Example: [{"issue_key": "ECD-1", "comment_text": "Done"}]
+
+    Returns:
+        list: add_jira_comment result per comment, in order
+    """
+    return run_parallel(lambda kwargs: add_jira_comment(**kwargs), comments)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Add a comment to a Jira issue with @mentions",
@@ -121,7 +137,7 @@ Note: Use --mention with two arguments: account_id and display_name
 
     try:
         result = add_jira_comment(args.issue_key, args.comment, mentions)
-        print(json.dumps(result, indent=2))
+        write_output(result, pretty=True)
 
         if result.get("error"):
             sys.exit(1)
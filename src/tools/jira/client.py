@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Jira Tool Daemon Client - Hand tool calls to a running daemon
+
+Standard library only: a CLI whose call the daemon answers never imports
+requests or src.tools.base, so it skips their startup cost as well as the
+TLS handshake. The server side is in daemon.py.
+"""
+
+import importlib
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Optional
+
+# Owner-only socket next to the other bot state (the daemon runs tools with
+# our credentials). Read from the environment only, since .env is loaded by
+# src.tools.base.
+SOCKET_PATH = Path(os.getenv("JIRA_TOOL_SOCKET", ".claude/data/bot-state/jira-tool.sock"))
+
+# Tool calls can page through large searches; don't hang forever on a stuck daemon
+CLIENT_TIMEOUT = 300
+
+# Tool name -> (module, function); imported on first use
+TOOLS = {
+    "search": (".search", "search_jira"),
+    "list_projects": (".list_projects", "list_jira_projects"),
+    "get_transitions": (".get_transitions", "get_jira_transitions"),
+    "lookup_user": (".lookup_user", "lookup_jira_user"),
+    "transition_issue": (".transition_issue", "transition_jira_issue"),
+}
+
+
+def _error(status_code: int, message: str) -> dict:
+    # Same shape as base.format_error
+    return {"error": True, "status_code": status_code, "message": message}
+
+
+def run_tool(tool: str, args: dict) -> dict:
+    """Run a tool in this process"""
+    import inspect
+
+    if tool not in TOOLS:
+        return _error(400, f"Unknown tool '{tool}'. Available: {', '.join(TOOLS)}")
+
+    module, function = TOOLS[tool]
+    fn = getattr(importlib.import_module(module, __package__), function)
+    try:
+        inspect.signature(fn).bind(**args)
+    except TypeError as e:
+        return _error(400, f"Invalid arguments for {tool}: {e}")
+    return fn(**args)
+
+
+def call_tool(tool: str, **args) -> dict:
+    """
+    Run a tool through the daemon when it's up, otherwise in this process
+
+    Only a failed connect falls back to running locally; once the request
+    is sent, a transport error is reported instead, so a write (e.g. a
+    transition) is never applied twice.
+
+    Args:
+        tool: Name from TOOLS
+        **args: Keyword arguments for the tool function
+
+    Returns:
+        dict: The tool's result
+    """
+    result = _call_daemon({"tool": tool, "args": args})
+    return run_tool(tool, args) if result is None else result
+
+
+def forward_cli(tool: str) -> None:
+    """
+    Run this command line on the daemon and exit, if the daemon is running
+
+    Called by the tool CLIs before their own imports. Returns (so the CLI
+    carries on in this process) when no daemon is running or it leaves the
+    command line to the local CLI (--help, usage errors, --batch files).
+
+    Args:
+        tool: Name from TOOLS
+    """
+    reply = _call_daemon({"tool": tool, "argv": sys.argv[1:]})
+    if reply is None or reply.get("run_locally"):
+        return
+
+    if "exit_code" not in reply:
+        # Transport error after the request was sent; don't run it again
+        reply = {"stdout": json.dumps(reply, indent=2) + "\n", "exit_code": 1}
+
+    sys.stdout.write(reply.get("stdout", ""))
+    sys.stderr.write(reply.get("stderr", ""))
+    sys.exit(reply["exit_code"])
+
+
+def _call_daemon(request: dict) -> Optional[dict]:
+    """Send one request to the daemon; None if it isn't running"""
+    if not hasattr(socket, "AF_UNIX") or not SOCKET_PATH.exists():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CLIENT_TIMEOUT)
+        try:
+            sock.connect(str(SOCKET_PATH))
+        except OSError:
+            # Stale socket file or daemon shutting down
+            return None
+
+        try:
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as reply:
+                line = reply.readline()
+            if not line:
+                return _error(502, "Jira tool daemon closed the connection")
+            return json.loads(line)
+        except socket.timeout:
+            return _error(504, "Jira tool daemon timed out")
+        except (OSError, ValueError) as e:
+            return _error(502, f"Jira tool daemon error: {e}")
+    finally:
+        sock.close()
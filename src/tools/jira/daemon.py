@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Jira Tool Daemon - Serve the Jira tools from one warm process
+
+Each `python -m src.tools.jira.*` call otherwise imports requests and the
+tool modules and opens a new TLS connection to Atlassian. While the daemon
+is running, the CLIs hand their command line to it over a local UNIX
+socket (see client.py) before those imports, and print what it returns;
+it parses and runs the command in a long-lived process whose shared
+session (and in-memory caches) stay warm. Without the daemon the CLIs run
+in-process as before.
+
+Usage:
+    python -m src.tools.jira.daemon
+    JIRA_TOOL_SOCKET=/path/to/jira-tool.sock python -m src.tools.jira.daemon
+"""
+
+import argparse
+import importlib
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+from pathlib import Path
+
+from ..base import HAS_ORJSON, encode_json, format_error, format_output
+from .client import SOCKET_PATH, TOOLS, run_tool
+
+if HAS_ORJSON:
+    import orjson
+
+
+def _dumps(value) -> bytes:
+    data = encode_json(value)
+    return (data if isinstance(data, bytes) else data.encode()) + b"\n"
+
+
+def _loads(data: bytes):
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+class _RunLocally(Exception):
+    """The command line needs the caller's terminal or files"""
+
+
+def _decline(*args, **kwargs):
+    raise _RunLocally()
+
+
+def run_cli(tool: str, argv: list) -> dict:
+    """
+    Run a tool CLI command line the way its main() would
+
+    Args:
+        tool: Name from TOOLS
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        dict: {"stdout", "stderr", "exit_code"} to reproduce the CLI's
+        output, or {"run_locally": True} for --help, usage errors and
+        anything else the CLI has to run itself
+    """
+    if tool not in TOOLS:
+        return {"run_locally": True}
+
+    module = importlib.import_module(TOOLS[tool][0], __package__)
+    parser = module._build_parser()
+    # Usage output and exits belong to the caller's terminal
+    parser.error = parser.exit = _decline
+    parser.print_help = parser.print_usage = _decline
+    try:
+        args = parser.parse_args(argv)
+        kwargs = module._tool_kwargs(parser, args)
+    except _RunLocally:
+        return {"run_locally": True}
+    if kwargs is None:
+        return {"run_locally": True}
+
+    try:
+        result = run_tool(tool, kwargs)
+    except Exception as e:
+        return {"stderr": json.dumps({"error": True, "message": str(e)}) + "\n", "exit_code": 1}
+
+    reply = {"stdout": format_output(result, pretty=True) + "\n", "exit_code": 1 if result.get("error") else 0}
+    note = getattr(module, "_success_note", None)
+    if note and not reply["exit_code"]:
+        reply["stderr"] = note(args, result) + "\n"
+    return reply
+
+
+class _ToolHandler(socketserver.StreamRequestHandler):
+    """One newline-delimited JSON call per connection"""
+
+    def handle(self):
+        try:
+            request = _loads(self.rfile.readline())
+            tool, args, argv = request["tool"], request.get("args") or {}, request.get("argv")
+        except (ValueError, KeyError, TypeError) as e:
+            result = format_error(400, f"Invalid request: {e}")
+        else:
+            try:
+                result = run_tool(tool, args) if argv is None else run_cli(tool, argv)
+            except Exception as e:
+                # Same shape the CLIs print for an unexpected failure
+                result = {"error": True, "message": str(e)}
+
+        self.wfile.write(_dumps(result))
+
+
+class _ToolServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def serve(path: Path = SOCKET_PATH):
+    """Serve tool calls on a UNIX socket until interrupted"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+
+    # Create the socket owner-only from the start
+    old_umask = os.umask(0o177)
+    try:
+        server = _ToolServer(str(path), _ToolHandler)
+    finally:
+        os.umask(old_umask)
+
+    # Shut down cleanly (and remove the socket) when stopped by a service manager
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    print(f"Jira tool daemon listening on {path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve the Jira CLI tools from one warm process",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    # Start the daemon (the tool CLIs use it automatically while it runs)
+    python -m src.tools.jira.daemon
+
+Set JIRA_TOOL_SOCKET (for the daemon and the CLIs) to use another socket
+path than .claude/data/bot-state/jira-tool.sock.
+        """
+    )
+    parser.parse_args()
+
+    if not hasattr(socket, "AF_UNIX"):
+        print(json.dumps({"error": True, "message": "UNIX sockets are not available on this platform"}), file=sys.stderr)
+        sys.exit(1)
+
+    serve()
+
+
+if __name__ == "__main__":
+    main()
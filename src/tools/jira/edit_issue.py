@@ -9,22 +9,33 @@ Usage:
     python -m src.tools.jira.edit_issue ECD-123 --priority High
     python -m src.tools.jira.edit_issue ECD-123 --labels "backend,urgent"
     python -m src.tools.jira.edit_issue ECD-123 --summary "New title"
+    python -m src.tools.jira.edit_issue --bulk edits.json
 """
 
 import argparse
 import json
 import sys
-from typing import Optional
+from typing import Iterable, Optional, Union
 
 import requests
 
-from ..base import get_jira_auth_headers, JIRA_BASE_URL, format_error
+from ..base import async_tool, get_jira_session, JIRA_BASE_URL, DEFAULT_TIMEOUT, encode_json, format_error, format_response_error, run_parallel, write_output
+
+
+def _labels(value: Union[str, Iterable[str]]) -> list:
+    """Labels from a comma-separated string or an iterable, stripped, without blanks or repeats"""
+    if isinstance(value, str):
+        value = value.split(",")
+    return list(dict.fromkeys(filter(None, (label.strip() for label in value))))
 
 
 def edit_jira_issue(
     issue_key: str,
     fields: Optional[dict] = None,
-    update: Optional[dict] = None
+    update: Optional[dict] = None,
+    labels: Optional[Union[str, Iterable[str]]] = None,
+    add_labels: Optional[Union[str, Iterable[str]]] = None,
+    remove_labels: Optional[Union[str, Iterable[str]]] = None
 ) -> dict:
     """
     Update fields on a Jira issue
@@ -35,6 +46,9 @@ def edit_jira_issue(
                 Example: {"summary": "New title", "priority": {"name": "High"}}
         update: Dict of field operations (add, set, remove)
                 Example: {"labels": [{"add": "urgent"}]}
+        labels: Labels to set, replacing existing ones (list or "a,b")
+        add_labels: Labels to add (list or "a,b")
+        remove_labels: Labels to remove (list or "a,b")
 
     Returns:
         dict: {
@@ -43,6 +57,15 @@ def edit_jira_issue(
             "fields_updated": ["summary", "priority"]
         }
     """
+    if labels is not None:
+        fields = {**(fields or {}), "labels": _labels(labels)}
+
+    if add_labels or remove_labels:
+        operations = list((update or {}).get("labels", []))
+        operations.extend({"add": label} for label in _labels(add_labels or ()))
+        operations.extend({"remove": label} for label in _labels(remove_labels or ()))
+        update = {**(update or {}), "labels": operations}
+
     if not fields and not update:
         return format_error(400, "No fields or updates provided")
 
@@ -53,11 +76,10 @@ def edit_jira_issue(
         payload["update"] = update
 
     try:
-        response = requests.put(
+        response = get_jira_session().put(
             f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}",
-            headers=get_jira_auth_headers(),
-            json=payload,
-            timeout=30
+            data=encode_json(payload),
+            timeout=DEFAULT_TIMEOUT
         )
 
         # 204 No Content means success
@@ -69,7 +91,7 @@ def edit_jira_issue(
                 "updates_applied": list(update.keys()) if update else [],
             }
 
-        return format_error(response.status_code, response.text)
+        return format_response_error(response)
 
     except requests.exceptions.Timeout:
         return format_error(408, "Request timed out")
@@ -77,6 +99,56 @@ def edit_jira_issue(
         return format_error(500, str(e))
 
 
+edit_jira_issue_async = async_tool(edit_jira_issue)
+
+
+def bulk_edit_jira_issues(edits: list) -> dict:
+    """
+    Apply many field edits with one PUT per issue
+
+    Edits for the same issue are merged first: later "fields" values win,
+    and "update" operations are concatenated in order. The per-issue PUTs
+    then run concurrently (see run_parallel).
+
+    Args:
+        edits: List of {"issue_key": "ECD-123", "fields": {...}, "update": {...}}
+
+    Returns:
+        dict: {
+            "success": True,
+            "updated": 2,
+            "failed": 0,
+            "results": [...]  # edit_jira_issue result per issue
+        }
+    """
+    merged = {}
+    for edit in edits:
+        issue_key = edit.get("issue_key")
+        if not issue_key:
+            return format_error(400, "Each edit needs an issue_key")
+
+        entry = merged.setdefault(issue_key, {"fields": {}, "update": {}})
+        entry["fields"].update(edit.get("fields") or {})
+        for field, operations in (edit.get("update") or {}).items():
+            entry["update"].setdefault(field, []).extend(operations)
+
+    if not merged:
+        return format_error(400, "No edits provided")
+
+    results = run_parallel(
+        lambda item: edit_jira_issue(item[0], item[1]["fields"] or None, item[1]["update"] or None),
+        merged.items()
+    )
+
+    failed = sum(1 for result in results if result.get("error"))
+    return {
+        "success": failed == 0,
+        "updated": len(results) - failed,
+        "failed": failed,
+        "results": results
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Update fields on a Jira issue",
@@ -103,9 +175,12 @@ Examples:
 
     # Raw JSON fields
     python -m src.tools.jira.edit_issue ECD-123 --json '{"summary": "New title"}'
+
+    # Many edits from a file: [{"issue_key": "ECD-1", "fields": {...}, "update": {...}}, ...]
+    python -m src.tools.jira.edit_issue --bulk edits.json
         """
     )
-    parser.add_argument("issue_key", help="Issue key (e.g., ECD-123)")
+    parser.add_argument("issue_key", nargs="?", help="Issue key (e.g., ECD-123)")
     parser.add_argument("--assignee", help="Account ID of assignee (use 'none' to unassign)")
     parser.add_argument("--priority", help="Priority name (e.g., High, Medium, Low)")
     parser.add_argument("--summary", help="New summary/title")
@@ -113,11 +188,27 @@ Examples:
     parser.add_argument("--add-labels", help="Comma-separated labels to add")
     parser.add_argument("--remove-labels", help="Comma-separated labels to remove")
     parser.add_argument("--json", help="Raw JSON fields dict")
+    parser.add_argument("--bulk", help="JSON file with a list of edits (one PUT per issue)")
 
     args = parser.parse_args()
 
+    if args.bulk:
+        try:
+            with open(args.bulk) as f:
+                edits = json.load(f)
+            result = bulk_edit_jira_issues(edits)
+            write_output(result, pretty=True)
+            if not result.get("success"):
+                sys.exit(1)
+        except (OSError, json.JSONDecodeError) as e:
+            print(json.dumps({"error": True, "message": f"Could not read {args.bulk}: {e}"}), file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if not args.issue_key:
+        parser.error("issue_key is required unless --bulk is given")
+
     fields = {}
-    update = {}
 
     # Handle raw JSON
     if args.json:
@@ -140,24 +231,18 @@ Examples:
     if args.summary:
         fields["summary"] = args.summary
 
-    if args.labels:
-        fields["labels"] = [l.strip() for l in args.labels.split(",")]
-
-    # Handle label operations
-    if args.add_labels:
-        update["labels"] = [{"add": l.strip()} for l in args.add_labels.split(",")]
-
-    if args.remove_labels:
-        if "labels" not in update:
-            update["labels"] = []
-        update["labels"].extend([{"remove": l.strip()} for l in args.remove_labels.split(",")])
-
-    if not fields and not update:
+    if not fields and not (args.labels or args.add_labels or args.remove_labels):
         parser.error("At least one field update is required")
 
     try:
-        result = edit_jira_issue(args.issue_key, fields if fields else None, update if update else None)
-        print(json.dumps(result, indent=2))
+        result = edit_jira_issue(
+            args.issue_key,
+            fields if fields else None,
+            labels=args.labels or None,
+            add_labels=args.add_labels,
+            remove_labels=args.remove_labels
+        )
+        write_output(result, pretty=True)
 
         if result.get("error"):
             sys.exit(1)
@@ -9,16 +9,66 @@ Usage:
 
 import argparse
 import json
+import os
 import sys
+import threading
+import time
+from pathlib import Path
 from typing import Optional
 
 import requests
 
-from ..base import get_jira_auth_headers, ATLASSIAN_CLOUD_ID, format_error
+from ..base import get_jira_session, ATLASSIAN_CLOUD_ID, DEFAULT_TIMEOUT, decode_json, format_error, format_response_error, run_parallel, write_output
 
 # Agile API uses a different base URL
 AGILE_BASE_URL = f"https://api.atlassian.com/ex/jira/{ATLASSIAN_CLOUD_ID}/rest/agile/1.0"
 
+# Board lists rarely change: reuse a result for an hour, then revalidate
+# it with its ETag (a 304 keeps the stored result). Persisted so CLI and
+# script runs share it.
+BOARDS_CACHE_FILE = Path(".claude/data/bot-state/jira_boards_cache.json")
+BOARDS_CACHE_SECONDS = 3600
+
+_boards_cache = None
+_boards_cache_lock = threading.Lock()
+
+
+def _load_boards_cache() -> dict:
+    """Board results by request key, read from disk on first use"""
+    global _boards_cache
+
+    if _boards_cache is None:
+        try:
+            with open(BOARDS_CACHE_FILE) as f:
+                _boards_cache = json.load(f)
+        except (OSError, ValueError):
+            _boards_cache = {}
+    return _boards_cache
+
+
+def _save_boards_cache():
+    """Write the cache atomically; a failed write only costs a refetch"""
+    try:
+        BOARDS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = BOARDS_CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(_boards_cache, f)
+        os.replace(tmp_file, BOARDS_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def clear_boards_cache():
+    """Forget cached board lists (in memory and on disk)"""
+    global _boards_cache
+
+    with _boards_cache_lock:
+        _boards_cache = {}
+        try:
+            BOARDS_CACHE_FILE.unlink()
+        except OSError:
+            pass
+
 
 def get_boards(
     project_key: Optional[str] = None,
@@ -33,6 +83,9 @@ def get_boards(
         board_type: Filter by type ("scrum" or "kanban")
         max_results: Maximum results to return
 
+    Results are cached per filter for BOARDS_CACHE_SECONDS and then
+    revalidated with If-None-Match.
+
     Returns:
         dict: {
             "total": int,
@@ -59,17 +112,34 @@ def get_boards(
         if board_type:
             params["type"] = board_type
 
-        response = requests.get(
+        cache_key = f"{project_key or ''}|{board_type or ''}|{params['maxResults']}"
+        with _boards_cache_lock:
+            cached = _load_boards_cache().get(cache_key)
+
+        headers = None
+        if cached:
+            if time.time() - cached["fetched_at"] < BOARDS_CACHE_SECONDS:
+                return dict(cached["result"])
+            if cached.get("etag"):
+                headers = {"If-None-Match": cached["etag"]}
+
+        response = get_jira_session().get(
             url,
-            headers=get_jira_auth_headers(),
             params=params,
-            timeout=30
+            headers=headers,
+            timeout=DEFAULT_TIMEOUT
         )
 
+        if response.status_code == 304 and cached:
+            with _boards_cache_lock:
+                cached["fetched_at"] = time.time()
+                _save_boards_cache()
+            return dict(cached["result"])
+
         if response.status_code != 200:
-            return format_error(response.status_code, response.text)
+            return format_response_error(response)
 
-        data = response.json()
+        data = decode_json(response)
 
         boards = []
         for board in data.get("values", []):
@@ -77,21 +147,46 @@ def get_boards(
                 "id": board.get("id"),
                 "name": board.get("name"),
                 "type": board.get("type"),
-                "project_key": board.get("location", {}).get("projectKey") if board.get("location") else None
+                "project_key": (board.get("location") or {}).get("projectKey")
             })
 
-        return {
+        result = {
             "total": data.get("total", len(boards)),
             "count": len(boards),
             "boards": boards
         }
 
+        with _boards_cache_lock:
+            _load_boards_cache()[cache_key] = {
+                "fetched_at": time.time(),
+                "etag": response.headers.get("ETag"),
+                "result": result
+            }
+            _save_boards_cache()
+
+        return dict(result)
+
     except requests.exceptions.Timeout:
         return format_error(408, "Request timed out")
     except requests.exceptions.RequestException as e:
         return format_error(500, str(e))
 
 
+def batch_get_boards(project_keys: list, board_type: Optional[str] = None) -> dict:
+    """
+    Get boards for several projects concurrently
+
+    Args:
+        project_keys: Project keys (e.g., ["ECD", "OPS"])
+        board_type: Optional filter ("scrum" or "kanban")
+
+    Returns:
+        dict: {project_key: get_boards result}
+    """
+    results = run_parallel(lambda key: get_boards(key, board_type), project_keys)
+    return dict(zip(project_keys, results))
+
+
 def main():
     parser = argparse.ArgumentParser(description="List Jira Agile boards")
     parser.add_argument("--project", help="Filter by project key")
@@ -101,7 +196,7 @@ def main():
     args = parser.parse_args()
 
     result = get_boards(args.project, args.type, args.max_results)
-    print(json.dumps(result, indent=2))
+    write_output(result, pretty=True)
 
     if result.get("error"):
         sys.exit(1)
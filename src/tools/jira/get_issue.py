@@ -13,16 +13,28 @@ Usage:
 import argparse
 import json
 import sys
-from typing import Optional
+from typing import Optional, Union
 
 import requests
 
-from ..base import get_jira_auth_headers, JIRA_BASE_URL, format_error
+from ..base import adf_to_text, get_jira_session, JIRA_BASE_URL, DEFAULT_TIMEOUT, decode_json, format_error, format_response_error, write_output
+
+# Most recent comments returned with include_comments
+COMMENTS_MAX = 20
+
+# Fields the simplified response reads (requested when fields isn't given)
+DEFAULT_FIELDS = [
+    "summary", "description", "status", "assignee", "reporter", "priority",
+    "issuetype", "labels", "created", "updated", "resolution", "parent",
+    "customfield_10016",  # Story points
+    "customfield_10020",  # Sprint
+]
+_DEFAULT_FIELDS_PARAM = ",".join(DEFAULT_FIELDS)
 
 
 def get_jira_issue(
     issue_key: str,
-    fields: Optional[list] = None,
+    fields: Optional[Union[list, str]] = None,
     expand: Optional[list] = None,
     include_comments: bool = False
 ) -> dict:
@@ -31,71 +43,67 @@ def get_jira_issue(
 
     Args:
         issue_key: Issue key (e.g., "ECD-123") or issue ID
-        fields: List of fields to return (default: all)
+        fields: List of fields to return, or an already comma-joined string
+                (default: DEFAULT_FIELDS, the ones the simplified response
+                uses; ["*all"] for everything). When given, only the
+                simplified keys built from these fields are returned.
         expand: List of expansions (e.g., ["changelog", "renderedFields"])
         include_comments: Whether to include comments (default: False)
 
     Returns:
         dict: Issue details with simplified structure
     """
-    params = {}
+    if isinstance(fields, str):
+        field_param = fields
+    else:
+        field_param = ",".join(fields) if fields else _DEFAULT_FIELDS_PARAM
 
+    # Explicit fields limit the simplified keys too; defaults and *all build every key
+    requested = None
     if fields:
-        params["fields"] = ",".join(fields)
+        requested = set(field_param.split(","))
+        if any(name.startswith("*") for name in requested):
+            requested = None
 
-    expand_list = expand or []
-    if include_comments and "renderedFields" not in expand_list:
-        expand_list.append("renderedFields")
+    # Comments come back inline in the "comment" field, saving a second request
+    if include_comments:
+        padded = f",{field_param},"
+        if ",comment," not in padded and ",*all," not in padded:
+            field_param += ",comment"
 
-    if expand_list:
-        params["expand"] = ",".join(expand_list)
+    params = {"fields": field_param}
+
+    if expand:
+        params["expand"] = ",".join(expand)
 
     try:
-        response = requests.get(
+        response = get_jira_session().get(
             f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}",
-            headers=get_jira_auth_headers(),
             params=params,
-            timeout=30
+            timeout=DEFAULT_TIMEOUT
         )
 
         if response.status_code != 200:
-            return format_error(response.status_code, response.text)
+            return format_response_error(response)
 
-        data = response.json()
+        data = decode_json(response)
         fields_data = data.get("fields", {})
 
-        # Build simplified response
+        # Build simplified response, only from the fields that were asked for
         result = {
             "key": data.get("key"),
             "id": data.get("id"),
             "self": data.get("self"),
-            "summary": fields_data.get("summary"),
-            "description": _extract_text_from_adf(fields_data.get("description")),
-            "status": fields_data.get("status", {}).get("name") if fields_data.get("status") else None,
-            "status_category": fields_data.get("status", {}).get("statusCategory", {}).get("name") if fields_data.get("status") else None,
-            "assignee": {
-                "name": fields_data.get("assignee", {}).get("displayName") if fields_data.get("assignee") else "Unassigned",
-                "account_id": fields_data.get("assignee", {}).get("accountId") if fields_data.get("assignee") else None,
-                "email": fields_data.get("assignee", {}).get("emailAddress") if fields_data.get("assignee") else None,
-            },
-            "reporter": {
-                "name": fields_data.get("reporter", {}).get("displayName") if fields_data.get("reporter") else None,
-                "account_id": fields_data.get("reporter", {}).get("accountId") if fields_data.get("reporter") else None,
-            },
-            "priority": fields_data.get("priority", {}).get("name") if fields_data.get("priority") else None,
-            "type": fields_data.get("issuetype", {}).get("name") if fields_data.get("issuetype") else None,
-            "labels": fields_data.get("labels", []),
-            "created": fields_data.get("created"),
-            "updated": fields_data.get("updated"),
-            "resolution": fields_data.get("resolution", {}).get("name") if fields_data.get("resolution") else None,
-            "sprint": _extract_sprint_info(fields_data),
-            "epic_key": fields_data.get("parent", {}).get("key") if fields_data.get("parent") else None,
-            "story_points": fields_data.get("customfield_10016"),  # Common story points field
         }
+        for key, source, extract in _RESULT_KEYS:
+            if requested is None or source in requested:
+                result[key] = extract(fields_data)
 
         # Include comments if requested
         if include_comments:
-            result["comments"] = _get_issue_comments(issue_key)
+            result["comments"] = _inline_comments(fields_data.get("comment"))
+            if result["comments"] is None:
+                result["comments"] = _get_issue_comments(issue_key)
 
         return result
 
@@ -109,21 +117,7 @@ def _extract_text_from_adf(adf: Optional[dict]) -> Optional[str]:
     """Extract plain text from Atlassian Document Format"""
     if not adf:
         return None
-
-    text_parts = []
-
-    def extract_recursive(content):
-        if isinstance(content, dict):
-            if content.get("type") == "text":
-                text_parts.append(content.get("text", ""))
-            for child in content.get("content", []):
-                extract_recursive(child)
-        elif isinstance(content, list):
-            for item in content:
-                extract_recursive(item)
-
-    extract_recursive(adf)
-    return " ".join(text_parts) if text_parts else None
+    return adf_to_text(adf) or None
 
 
 def _extract_sprint_info(fields_data: dict) -> Optional[dict]:
@@ -141,33 +135,93 @@ def _extract_sprint_info(fields_data: dict) -> Optional[dict]:
     return None
 
 
-def _get_issue_comments(issue_key: str, max_results: int = 20) -> list:
+def _person(person: Optional[dict], unassigned: Optional[str] = None) -> dict:
+    """Name/account of a user field (null when unset)"""
+    person = person or {}
+    return {
+        "name": person.get("displayName") if person else unassigned,
+        "account_id": person.get("accountId"),
+    }
+
+
+def _assignee(fields_data: dict) -> dict:
+    assignee = fields_data.get("assignee")
+    return {**_person(assignee, "Unassigned"), "email": (assignee or {}).get("emailAddress")}
+
+
+def _name_of(field: str, attr: str = "name"):
+    """Extractor for an attribute of a nested object field (null when unset)"""
+    return lambda fields_data: (fields_data.get(field) or {}).get(attr)
+
+
+def _status_category(fields_data: dict) -> Optional[str]:
+    return ((fields_data.get("status") or {}).get("statusCategory") or {}).get("name")
+
+
+# Simplified result keys: (key, Jira field it is built from, extractor)
+_RESULT_KEYS = [
+    ("summary", "summary", lambda f: f.get("summary")),
+    ("description", "description", lambda f: _extract_text_from_adf(f.get("description"))),
+    ("status", "status", _name_of("status")),
+    ("status_category", "status", _status_category),
+    ("assignee", "assignee", _assignee),
+    ("reporter", "reporter", lambda f: _person(f.get("reporter"))),
+    ("priority", "priority", _name_of("priority")),
+    ("type", "issuetype", _name_of("issuetype")),
+    ("labels", "labels", lambda f: f.get("labels", [])),
+    ("created", "created", lambda f: f.get("created")),
+    ("updated", "updated", lambda f: f.get("updated")),
+    ("resolution", "resolution", _name_of("resolution")),
+    ("sprint", "customfield_10020", _extract_sprint_info),
+    ("epic_key", "parent", _name_of("parent", "key")),
+    ("story_points", "customfield_10016", lambda f: f.get("customfield_10016")),  # Common story points field
+]
+
+
+def _simplify_comment(comment: dict) -> dict:
+    """Flatten a Jira comment to the fields we return"""
+    return {
+        "id": comment.get("id"),
+        "author": comment.get("author", {}).get("displayName"),
+        "author_id": comment.get("author", {}).get("accountId"),
+        "body": _extract_text_from_adf(comment.get("body")),
+        "created": comment.get("created"),
+        "updated": comment.get("updated"),
+    }
+
+
+def _inline_comments(comment_field: Optional[dict], max_results: int = COMMENTS_MAX) -> Optional[list]:
+    """
+    Newest-first comments from an issue's inline "comment" field
+
+    Returns None when the field is missing or doesn't hold every comment,
+    so the caller can fall back to the comment endpoint.
+    """
+    if not comment_field:
+        return None
+
+    comments = comment_field.get("comments", [])
+    if comment_field.get("total", len(comments)) > len(comments):
+        return None
+
+    # Inline comments are oldest-first; match the endpoint's -created order
+    return [_simplify_comment(comment) for comment in reversed(comments[-max_results:])]
+
+
+def _get_issue_comments(issue_key: str, max_results: int = COMMENTS_MAX) -> list:
     """Get comments for an issue"""
     try:
-        response = requests.get(
+        response = get_jira_session().get(
             f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}/comment",
-            headers=get_jira_auth_headers(),
             params={"maxResults": max_results, "orderBy": "-created"},
-            timeout=30
+            timeout=DEFAULT_TIMEOUT
         )
 
         if response.status_code != 200:
             return []
 
-        data = response.json()
-        comments = []
-
-        for comment in data.get("comments", []):
-            comments.append({
-                "id": comment.get("id"),
-                "author": comment.get("author", {}).get("displayName"),
-                "author_id": comment.get("author", {}).get("accountId"),
-                "body": _extract_text_from_adf(comment.get("body")),
-                "created": comment.get("created"),
-                "updated": comment.get("updated"),
-            })
-
-        return comments
+        data = decode_json(response)
+        return [_simplify_comment(comment) for comment in data.get("comments", [])]
 
     except Exception:
         return []
@@ -195,15 +249,13 @@ Examples:
 
     args = parser.parse_args()
 
-    fields = args.fields.split(",") if args.fields else None
-
     try:
         result = get_jira_issue(
             args.issue_key,
-            fields=fields,
+            fields=args.fields,
             include_comments=args.include_comments
         )
-        print(json.dumps(result, indent=2))
+        write_output(result, pretty=True)
 
         if result.get("error"):
             sys.exit(1)
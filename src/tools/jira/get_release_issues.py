@@ -14,14 +14,27 @@ Usage:
 """
 
 import argparse
-import json
 import sys
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Optional, List
 
 import requests
 
-from ..base import get_jira_auth_headers, JIRA_BASE_URL, format_error
+from ..base import adf_to_text, format_error, format_response_error, write_output, run_parallel, search_jql_pages
+
+# Fields the release-issue rows read
+RELEASE_ISSUE_FIELDS = [
+    "summary", "description", "status", "issuetype",
+    "assignee", "labels", "priority", "updated",
+    "fixVersions", "customfield_10016"  # Story points
+]
+
+# Release-note rows keep the start of the description only
+DESCRIPTION_MAX_CHARS = 500
+
+# Issue types left out of release notes by default
+DEFAULT_EXCLUDED_TYPES = frozenset({"Sub-task", "Epic"})
 
 
 def get_release_issues(
@@ -40,7 +53,7 @@ def get_release_issues(
         sprint_name: Filter by sprint name (e.g., "Sprint 45")
         days: Look back N days for completed issues (default 14)
         project: Project key (default "ECD")
-        exclude_types: Issue types to exclude (default: ["Sub-task", "Epic"])
+        exclude_types: Issue types to exclude (default: DEFAULT_EXCLUDED_TYPES)
         max_results: Maximum results
 
     Returns:
@@ -66,7 +79,7 @@ def get_release_issues(
         }
     """
     if exclude_types is None:
-        exclude_types = ["Sub-task", "Epic"]
+        exclude_types = DEFAULT_EXCLUDED_TYPES
 
     # Build JQL query
     jql_parts = [
@@ -83,80 +96,32 @@ def get_release_issues(
         jql_parts.append(f"status CHANGED TO Complete AFTER -{days}d")
 
     if exclude_types:
-        types_str = ", ".join([f'"{t}"' for t in exclude_types])
-        jql_parts.append(f"issuetype NOT IN ({types_str})")
+        jql_parts.append(_excluded_types_clause(exclude_types))
 
     jql_parts.append("ORDER BY updated DESC")
     jql = " AND ".join(jql_parts[:-1]) + " " + jql_parts[-1]
 
     try:
-        payload = {
-            "jql": jql,
-            "maxResults": min(max_results, 100),
-            "fields": [
-                "summary", "description", "status", "issuetype",
-                "assignee", "labels", "priority", "updated",
-                "fixVersions", "customfield_10016"  # Story points
-            ]
-        }
-
-        response = requests.post(
-            f"{JIRA_BASE_URL}/rest/api/3/search/jql",
-            headers=get_jira_auth_headers(),
-            json=payload,
-            timeout=30
-        )
-
-        if response.status_code != 200:
-            return format_error(response.status_code, response.text)
-
-        data = response.json()
+        raw_issues, failed = search_jql_pages({"jql": jql, "fields": RELEASE_ISSUE_FIELDS}, max_results)
+        if failed is not None:
+            return format_response_error(failed)
 
         issues = []
-        by_type = {}
-
-        for issue in data.get("issues", []):
-            fields = issue.get("fields", {})
-            issue_type = fields.get("issuetype", {}).get("name") if fields.get("issuetype") else "Other"
-
-            # Parse description (can be ADF format)
-            description = ""
-            if fields.get("description"):
-                desc = fields["description"]
-                if isinstance(desc, dict):
-                    # ADF format - extract text
-                    description = extract_text_from_adf(desc)
-                else:
-                    description = str(desc)
-
-            issue_data = {
-                "key": issue.get("key"),
-                "id": issue.get("id"),
-                "summary": fields.get("summary"),
-                "description": description[:500] if description else "",
-                "status": fields.get("status", {}).get("name") if fields.get("status") else None,
-                "type": issue_type,
-                "assignee": fields.get("assignee", {}).get("displayName") if fields.get("assignee") else "Unassigned",
-                "priority": fields.get("priority", {}).get("name") if fields.get("priority") else None,
-                "story_points": fields.get("customfield_10016"),
-                "labels": fields.get("labels", []),
-                "fix_versions": [v.get("name") for v in fields.get("fixVersions", [])],
-                "updated": fields.get("updated")
-            }
+        by_type = defaultdict(list)
 
+        for issue in raw_issues:
+            issue_data = _build_issue_row(issue)
             issues.append(issue_data)
 
             # Group by type
-            if issue_type not in by_type:
-                by_type[issue_type] = []
-            by_type[issue_type].append(issue_data)
+            by_type[issue_data["type"]].append(issue_data)
 
         return {
             "jql": jql,
-            "total": data.get("total", len(issues)),
+            "total": len(issues),
             "count": len(issues),
             "issues": issues,
-            "by_type": by_type
+            "by_type": dict(by_type)
         }
 
     except requests.exceptions.Timeout:
@@ -165,112 +130,92 @@ def get_release_issues(
         return format_error(500, str(e))
 
 
-def extract_text_from_adf(adf: dict) -> str:
+def _build_issue_row(issue: dict) -> dict:
+    """Flatten a search result issue into a release-notes row"""
+    fields = issue.get("fields", {})
+    issuetype = fields.get("issuetype")
+
+    # Parse description (can be ADF format)
+    description = ""
+    if fields.get("description"):
+        desc = fields["description"]
+        if isinstance(desc, dict):
+            # ADF format - extract text
+            description = extract_text_from_adf(desc, max_chars=DESCRIPTION_MAX_CHARS)
+        else:
+            description = str(desc)
+
+    assignee = fields.get("assignee") or {}
+    return {
+        "key": issue.get("key"),
+        "id": issue.get("id"),
+        "summary": fields.get("summary"),
+        "description": description[:DESCRIPTION_MAX_CHARS],
+        "status": (fields.get("status") or {}).get("name"),
+        "type": issuetype.get("name") if issuetype else "Other",
+        "assignee": assignee.get("displayName") if assignee else "Unassigned",
+        "priority": (fields.get("priority") or {}).get("name"),
+        "story_points": fields.get("customfield_10016"),
+        "labels": fields.get("labels", []),
+        "fix_versions": [v.get("name") for v in fields.get("fixVersions", [])],
+        "updated": fields.get("updated")
+    }
+
+
+def _excluded_types_clause(exclude_types) -> str:
+    """JQL clause leaving out the given issue types"""
+    types_str = ", ".join([f'"{t}"' for t in sorted(exclude_types)])
+    return f"issuetype NOT IN ({types_str})"
+
+
+def extract_text_from_adf(adf: dict, max_chars: Optional[int] = None) -> str:
     """Extract plain text from Atlassian Document Format"""
-    texts = []
-
-    def extract(node):
-        if isinstance(node, dict):
-            if node.get("type") == "text":
-                texts.append(node.get("text", ""))
-            for child in node.get("content", []):
-                extract(child)
-        elif isinstance(node, list):
-            for item in node:
-                extract(item)
+    return adf_to_text(adf, max_chars)
 
-    extract(adf)
-    return " ".join(texts)
 
-
-def get_current_sprint_completed(project: str = "ECD") -> dict:
+def get_current_sprint_completed(project: str = "ECD", max_results: int = 100) -> dict:
     """
     Get completed issues from the current active sprint
 
     Args:
         project: Project key
+        max_results: Maximum results
 
     Returns:
         dict: Release issues from current sprint
     """
     # First try to find issues in open sprints that are complete
-    jql = f"project = {project} AND sprint in openSprints() AND statusCategory = Done ORDER BY updated DESC"
+    jql = (
+        f"project = {project} AND sprint in openSprints() AND statusCategory = Done"
+        f" AND {_excluded_types_clause(DEFAULT_EXCLUDED_TYPES)} ORDER BY updated DESC"
+    )
 
     try:
-        payload = {
-            "jql": jql,
-            "maxResults": 100,
-            "fields": [
-                "summary", "description", "status", "issuetype",
-                "assignee", "labels", "priority", "updated",
-                "fixVersions", "customfield_10016"
-            ]
-        }
+        # Run the fallback (recent completions) alongside the sprint query,
+        # so an empty sprint doesn't cost a second round trip in sequence
+        (raw_issues, failed), recent = run_parallel(lambda query: query(), [
+            lambda: search_jql_pages({"jql": jql, "fields": RELEASE_ISSUE_FIELDS}, max_results),
+            lambda: get_release_issues(days=14, project=project),
+        ])
 
-        response = requests.post(
-            f"{JIRA_BASE_URL}/rest/api/3/search/jql",
-            headers=get_jira_auth_headers(),
-            json=payload,
-            timeout=30
-        )
+        if failed is not None or not raw_issues:
+            # Sprint query failed or found nothing; use recent completions
+            return recent
 
-        if response.status_code != 200:
-            # Fall back to recent completions if sprint query fails
-            return get_release_issues(days=14, project=project)
-
-        data = response.json()
-
-        if data.get("total", 0) == 0:
-            # No completed issues in current sprint, fall back to recent
-            return get_release_issues(days=14, project=project)
-
-        # Process issues same as get_release_issues
         issues = []
-        by_type = {}
-
-        for issue in data.get("issues", []):
-            fields = issue.get("fields", {})
-            issue_type = fields.get("issuetype", {}).get("name") if fields.get("issuetype") else "Other"
-
-            # Skip sub-tasks and epics
-            if issue_type in ["Sub-task", "Epic"]:
-                continue
-
-            description = ""
-            if fields.get("description"):
-                desc = fields["description"]
-                if isinstance(desc, dict):
-                    description = extract_text_from_adf(desc)
-                else:
-                    description = str(desc)
-
-            issue_data = {
-                "key": issue.get("key"),
-                "id": issue.get("id"),
-                "summary": fields.get("summary"),
-                "description": description[:500] if description else "",
-                "status": fields.get("status", {}).get("name") if fields.get("status") else None,
-                "type": issue_type,
-                "assignee": fields.get("assignee", {}).get("displayName") if fields.get("assignee") else "Unassigned",
-                "priority": fields.get("priority", {}).get("name") if fields.get("priority") else None,
-                "story_points": fields.get("customfield_10016"),
-                "labels": fields.get("labels", []),
-                "fix_versions": [v.get("name") for v in fields.get("fixVersions", [])],
-                "updated": fields.get("updated")
-            }
+        by_type = defaultdict(list)
 
+        for issue in raw_issues:
+            issue_data = _build_issue_row(issue)
             issues.append(issue_data)
-
-            if issue_type not in by_type:
-                by_type[issue_type] = []
-            by_type[issue_type].append(issue_data)
+            by_type[issue_data["type"]].append(issue_data)
 
         return {
             "jql": jql,
             "total": len(issues),
             "count": len(issues),
             "issues": issues,
-            "by_type": by_type,
+            "by_type": dict(by_type),
             "source": "current_sprint"
         }
 
@@ -317,7 +262,7 @@ Examples:
             max_results=args.max_results
         )
 
-    print(json.dumps(result, indent=2))
+    write_output(result, pretty=True)
 
     if result.get("error"):
         sys.exit(1)
@@ -9,16 +9,23 @@ Usage:
 """
 
 import argparse
-import json
 import sys
+from collections import defaultdict
 from typing import Optional, List
 
 import requests
 
-from ..base import get_jira_auth_headers, ATLASSIAN_CLOUD_ID, format_error
+from ..base import adf_to_text, ATLASSIAN_CLOUD_ID, format_error, format_response_error, write_output, get_agile_pages
 
 AGILE_BASE_URL = f"https://api.atlassian.com/ex/jira/{ATLASSIAN_CLOUD_ID}/rest/agile/1.0"
 
+# Fields the sprint-issue rows read
+SPRINT_ISSUE_FIELDS = ",".join([
+    "summary", "status", "issuetype", "assignee", "priority",
+    "customfield_10016",  # Story points
+    "resolution", "labels", "description"
+])
+
 
 def get_sprint_issues(
     sprint_id: int,
@@ -48,6 +55,7 @@ def get_sprint_issues(
                     "type": "Story",
                     "assignee": "Name",
                     "priority": "High",
+                    "description": "Plain text",
                     "story_points": 5,
                     "resolution": "Done",
                     "labels": ["feature", "v5.5.6"]
@@ -58,8 +66,7 @@ def get_sprint_issues(
     try:
         url = f"{AGILE_BASE_URL}/sprint/{sprint_id}/issue"
         params = {
-            "maxResults": min(max_results, 100),
-            "fields": "summary,status,issuetype,assignee,priority,customfield_10016,resolution,labels,description"
+            "fields": SPRINT_ISSUE_FIELDS
         }
 
         # Build JQL filter
@@ -73,38 +80,31 @@ def get_sprint_issues(
         if jql_parts:
             params["jql"] = " AND ".join(jql_parts)
 
-        response = requests.get(
-            url,
-            headers=get_jira_auth_headers(),
-            params=params,
-            timeout=30
-        )
-
-        if response.status_code != 200:
-            return format_error(response.status_code, response.text)
-
-        data = response.json()
+        raw_issues, total, failed = get_agile_pages(url, params, max_results, items_key="issues")
+        if failed is not None:
+            return format_response_error(failed)
 
         issues = []
-        for issue in data.get("issues", []):
+        for issue in raw_issues:
             fields = issue.get("fields", {})
+            assignee = fields.get("assignee") or {}
             issues.append({
                 "key": issue.get("key"),
                 "id": issue.get("id"),
                 "summary": fields.get("summary"),
-                "description": fields.get("description"),
-                "status": fields.get("status", {}).get("name") if fields.get("status") else None,
-                "type": fields.get("issuetype", {}).get("name") if fields.get("issuetype") else None,
-                "assignee": fields.get("assignee", {}).get("displayName") if fields.get("assignee") else "Unassigned",
-                "priority": fields.get("priority", {}).get("name") if fields.get("priority") else None,
+                "description": _description_text(fields.get("description")),
+                "status": (fields.get("status") or {}).get("name"),
+                "type": (fields.get("issuetype") or {}).get("name"),
+                "assignee": assignee.get("displayName") if assignee else "Unassigned",
+                "priority": (fields.get("priority") or {}).get("name"),
                 "story_points": fields.get("customfield_10016"),  # Story Points field
-                "resolution": fields.get("resolution", {}).get("name") if fields.get("resolution") else None,
+                "resolution": (fields.get("resolution") or {}).get("name"),
                 "labels": fields.get("labels", [])
             })
 
         return {
             "sprint_id": sprint_id,
-            "total": data.get("total", len(issues)),
+            "total": total,
             "count": len(issues),
             "issues": issues
         }
@@ -115,6 +115,13 @@ def get_sprint_issues(
         return format_error(500, str(e))
 
 
+def _description_text(description) -> Optional[str]:
+    """Plain-text description (Jira returns ADF from the agile API)"""
+    if isinstance(description, dict):
+        return adf_to_text(description)
+    return description
+
+
 def get_completed_sprint_issues(
     sprint_id: int,
     exclude_types: Optional[List[str]] = None
@@ -136,21 +143,20 @@ def get_completed_sprint_issues(
 
     # Filter out excluded types
     if exclude_types:
+        excluded = frozenset(exclude_types)
         result["issues"] = [
             issue for issue in result["issues"]
-            if issue["type"] not in exclude_types
+            if issue["type"] not in excluded
         ]
         result["count"] = len(result["issues"])
 
     # Categorize by type
-    by_type = {}
+    by_type = defaultdict(list)
     for issue in result["issues"]:
         issue_type = issue["type"] or "Other"
-        if issue_type not in by_type:
-            by_type[issue_type] = []
         by_type[issue_type].append(issue)
 
-    result["by_type"] = by_type
+    result["by_type"] = dict(by_type)
 
     return result
 
@@ -170,7 +176,7 @@ def main():
     else:
         result = get_sprint_issues(args.sprint_id, args.status, args.types, args.max_results)
 
-    print(json.dumps(result, indent=2))
+    write_output(result, pretty=True)
 
     if result.get("error"):
         sys.exit(1)
@@ -9,16 +9,20 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from typing import Optional
 
 import requests
 
-from ..base import get_jira_auth_headers, ATLASSIAN_CLOUD_ID, format_error
+from ..base import ATLASSIAN_CLOUD_ID, format_error, format_response_error, write_output, get_agile_pages, ttl_cache
 
 AGILE_BASE_URL = f"https://api.atlassian.com/ex/jira/{ATLASSIAN_CLOUD_ID}/rest/agile/1.0"
 
+# Sprint lists barely change within a run; the active sprint is looked up
+# by other tools on every call, so it gets its own (shorter) cache
+SPRINTS_CACHE_SECONDS = 60
+ACTIVE_SPRINT_CACHE_SECONDS = 30
+
 
 def get_sprints(
     board_id: int,
@@ -47,30 +51,28 @@ def get_sprints(
                 }
             ]
         }
+
+        A copy of a result fetched in the last SPRINTS_CACHE_SECONDS may be
+        returned.
     """
+    return dict(_fetch_sprints_cached(board_id, state, max_results))
+
+
+def _fetch_sprints(board_id: int, state: Optional[str], max_results: int) -> dict:
+    """Fetch and simplify a board's sprints (uncached; see get_sprints)"""
     try:
         url = f"{AGILE_BASE_URL}/board/{board_id}/sprint"
-        params = {
-            "maxResults": min(max_results, 100)
-        }
+        params = {}
 
         if state:
             params["state"] = state
 
-        response = requests.get(
-            url,
-            headers=get_jira_auth_headers(),
-            params=params,
-            timeout=30
-        )
-
-        if response.status_code != 200:
-            return format_error(response.status_code, response.text)
-
-        data = response.json()
+        values, _, failed = get_agile_pages(url, params, max_results)
+        if failed is not None:
+            return format_response_error(failed)
 
         sprints = []
-        for sprint in data.get("values", []):
+        for sprint in values:
             sprints.append({
                 "id": sprint.get("id"),
                 "name": sprint.get("name"),
@@ -103,7 +105,12 @@ def get_active_sprint(board_id: int) -> dict:
     Returns:
         dict: Sprint details or error
     """
-    result = get_sprints(board_id, state="active", max_results=1)
+    return dict(_fetch_active_sprint_cached(board_id))
+
+
+def _fetch_active_sprint(board_id: int) -> dict:
+    """Look up the active sprint (uncached; see get_active_sprint)"""
+    result = _fetch_sprints(board_id, "active", 1)
 
     if result.get("error"):
         return result
@@ -120,6 +127,16 @@ def get_active_sprint(board_id: int) -> dict:
     }
 
 
+_fetch_sprints_cached = ttl_cache(seconds=SPRINTS_CACHE_SECONDS)(_fetch_sprints)
+_fetch_active_sprint_cached = ttl_cache(seconds=ACTIVE_SPRINT_CACHE_SECONDS)(_fetch_active_sprint)
+
+
+def clear_sprint_cache():
+    """Forget cached sprint lookups"""
+    _fetch_sprints_cached.cache_clear()
+    _fetch_active_sprint_cached.cache_clear()
+
+
 def main():
     parser = argparse.ArgumentParser(description="List sprints for a Jira board")
     parser.add_argument("board_id", type=int, help="Board ID")
@@ -129,7 +146,7 @@ def main():
     args = parser.parse_args()
 
     result = get_sprints(args.board_id, args.state, args.max_results)
-    print(json.dumps(result, indent=2))
+    write_output(result, pretty=True)
 
     if result.get("error"):
         sys.exit(1)
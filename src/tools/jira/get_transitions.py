@@ -8,13 +8,30 @@ Usage:
     python -m src.tools.jira.get_transitions ECD-123
 """
 
+if __name__ == "__main__":
+    # A running tool daemon answers before the slower imports below
+    from .client import forward_cli
+    forward_cli("get_transitions")
+
 import argparse
 import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
 
 import requests
 
-from ..base import get_jira_auth_headers, JIRA_BASE_URL, format_error
+from ..base import get_jira_session, JIRA_BASE_URL, DEFAULT_TIMEOUT, decode_json, format_error, format_response_error, ttl_cache, write_output
+
+# Workflows rarely change; transition_jira_issue drops an issue's entry
+# whenever it moves (or fails to move) the issue
+TRANSITIONS_CACHE_SECONDS = 300
+
+# Background workers for prefetch_transitions (threads start on first use)
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="jira-transitions-prefetch")
+_prefetching = set()
+_prefetching_lock = threading.Lock()
 
 
 def get_jira_transitions(issue_key: str) -> dict:
@@ -38,47 +55,27 @@ def get_jira_transitions(issue_key: str) -> dict:
                 ...
             ]
         }
+
+        A copy of a result fetched in the last TRANSITIONS_CACHE_SECONDS
+        may be returned.
     """
-    try:
-        # First get current status
-        issue_response = requests.get(
-            f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}",
-            headers=get_jira_auth_headers(),
-            params={"fields": "status"},
-            timeout=30
-        )
+    return dict(_fetch_transitions_cached(issue_key))
 
-        current_status = None
-        if issue_response.status_code == 200:
-            issue_data = issue_response.json()
-            current_status = issue_data.get("fields", {}).get("status", {}).get("name")
 
-        # Get available transitions
-        response = requests.get(
-            f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}/transitions",
-            headers=get_jira_auth_headers(),
-            timeout=30
+def _fetch_transitions(issue_key: str) -> dict:
+    """Fetch an issue's status and transitions (uncached; see get_jira_transitions)"""
+    try:
+        # One request: the issue's status with its transitions expanded
+        response = get_jira_session().get(
+            f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}",
+            params={"fields": "status", "expand": "transitions"},
+            timeout=DEFAULT_TIMEOUT
         )
 
         if response.status_code != 200:
-            return format_error(response.status_code, response.text)
-
-        data = response.json()
-
-        transitions = []
-        for t in data.get("transitions", []):
-            transitions.append({
-                "id": t.get("id"),
-                "name": t.get("name"),
-                "to_status": t.get("to", {}).get("name"),
-                "to_category": t.get("to", {}).get("statusCategory", {}).get("name"),
-            })
-
-        return {
-            "issue_key": issue_key,
-            "current_status": current_status,
-            "transitions": transitions
-        }
+            return format_response_error(response)
+
+        return _simplify_transitions(issue_key, decode_json(response))
 
     except requests.exceptions.Timeout:
         return format_error(408, "Request timed out")
@@ -86,7 +83,64 @@ def get_jira_transitions(issue_key: str) -> dict:
         return format_error(500, str(e))
 
 
-def main():
+def _simplify_transitions(issue_key: str, data: dict) -> dict:
+    """Build the get_jira_transitions result from an issue with expanded transitions"""
+    transitions = []
+    for t in data.get("transitions", []):
+        to = t.get("to") or {}
+        transitions.append({
+            "id": t.get("id"),
+            "name": t.get("name"),
+            "to_status": to.get("name"),
+            "to_category": (to.get("statusCategory") or {}).get("name"),
+        })
+
+    return {
+        "issue_key": issue_key,
+        "current_status": ((data.get("fields") or {}).get("status") or {}).get("name"),
+        "transitions": transitions
+    }
+
+
+_fetch_transitions_cached = ttl_cache(seconds=TRANSITIONS_CACHE_SECONDS)(_fetch_transitions)
+
+
+def clear_transitions_cache(issue_key: Optional[str] = None):
+    """Forget cached transitions for one issue (or all issues)"""
+    if issue_key is None:
+        _fetch_transitions_cached.cache_clear()
+    else:
+        _fetch_transitions_cached.cache_invalidate(issue_key)
+
+
+def prefetch_transitions(issue_keys: Iterable[str]):
+    """
+    Warm the transitions cache for issues the caller is likely to act on next
+
+    Lookups run in the background and this returns immediately; a key that
+    is already being fetched is skipped. Only useful in a long-running
+    process, since the cache lives in memory.
+
+    Args:
+        issue_keys: Issue keys (e.g., the top results of a search)
+    """
+    for issue_key in issue_keys:
+        with _prefetching_lock:
+            if issue_key in _prefetching:
+                continue
+            _prefetching.add(issue_key)
+        _PREFETCH_POOL.submit(_prefetch_one, issue_key)
+
+
+def _prefetch_one(issue_key: str):
+    try:
+        _fetch_transitions_cached(issue_key)
+    finally:
+        with _prefetching_lock:
+            _prefetching.discard(issue_key)
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Get available status transitions for a Jira issue",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -100,12 +154,23 @@ Examples:
         """
     )
     parser.add_argument("issue_key", help="Issue key (e.g., ECD-123)")
+    return parser
+
+
+def _tool_kwargs(parser: argparse.ArgumentParser, args: argparse.Namespace) -> dict:
+    """get_jira_transitions arguments for a parsed command line"""
+    return {"issue_key": args.issue_key}
+
+
+def main():
+    from .client import call_tool
 
+    parser = _build_parser()
     args = parser.parse_args()
 
     try:
-        result = get_jira_transitions(args.issue_key)
-        print(json.dumps(result, indent=2))
+        result = call_tool("get_transitions", **_tool_kwargs(parser, args))
+        write_output(result, pretty=True)
 
         if result.get("error"):
             sys.exit(1)
@@ -9,6 +9,11 @@ Usage:
     python -m src.tools.jira.list_projects --search "ECD"
 """
 
+if __name__ == "__main__":
+    # A running tool daemon answers before the slower imports below
+    from .client import forward_cli
+    forward_cli("list_projects")
+
 import argparse
 import json
 import sys
@@ -16,7 +21,7 @@ from typing import Optional
 
 import requests
 
-from ..base import get_jira_auth_headers, JIRA_BASE_URL, format_error
+from ..base import get_jira_session, JIRA_BASE_URL, DEFAULT_TIMEOUT, decode_json, format_error, format_response_error, write_output
 
 
 def list_jira_projects(
@@ -52,17 +57,16 @@ def list_jira_projects(
         params["query"] = search
 
     try:
-        response = requests.get(
+        response = get_jira_session().get(
             f"{JIRA_BASE_URL}/rest/api/3/project/search",
-            headers=get_jira_auth_headers(),
             params=params,
-            timeout=30
+            timeout=DEFAULT_TIMEOUT
         )
 
         if response.status_code != 200:
-            return format_error(response.status_code, response.text)
+            return format_response_error(response)
 
-        data = response.json()
+        data = decode_json(response)
 
         projects = []
         for project in data.get("values", []):
@@ -72,7 +76,7 @@ def list_jira_projects(
                 "id": project.get("id"),
                 "project_type": project.get("projectTypeKey"),
                 "description": project.get("description"),
-                "lead": project.get("lead", {}).get("displayName") if project.get("lead") else None,
+                "lead": (project.get("lead") or {}).get("displayName"),
             })
 
         return {
@@ -87,7 +91,7 @@ def list_jira_projects(
         return format_error(500, str(e))
 
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="List visible Jira projects",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -103,12 +107,23 @@ Examples:
     )
     parser.add_argument("--search", help="Filter projects by name/key")
     parser.add_argument("--max-results", type=int, default=50, help="Maximum results (default: 50)")
+    return parser
+
+
+def _tool_kwargs(parser: argparse.ArgumentParser, args: argparse.Namespace) -> dict:
+    """list_jira_projects arguments for a parsed command line"""
+    return {"search": args.search, "max_results": args.max_results}
+
+
+def main():
+    from .client import call_tool
 
+    parser = _build_parser()
     args = parser.parse_args()
 
     try:
-        result = list_jira_projects(args.search, args.max_results)
-        print(json.dumps(result, indent=2))
+        result = call_tool("list_projects", **_tool_kwargs(parser, args))
+        write_output(result, pretty=True)
 
         if result.get("error"):
             sys.exit(1)
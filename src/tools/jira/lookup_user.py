@@ -10,13 +10,23 @@ Usage:
     python -m src.tools.jira.lookup_user "Mohamed" --max-results 5
 """
 
+if __name__ == "__main__":
+    # A running tool daemon answers before the slower imports below
+    from .client import forward_cli
+    forward_cli("lookup_user")
+
 import argparse
 import json
 import sys
 
 import requests
 
-from ..base import get_jira_auth_headers, JIRA_BASE_URL, format_error
+from ..base import get_jira_session, JIRA_BASE_URL, DEFAULT_TIMEOUT, decode_json, format_error, format_response_error, ttl_cache, write_output
+
+# The same people are looked up over and over; a miss is kept briefly so a
+# retry loop on an unknown name doesn't hammer /user/search
+USER_CACHE_SECONDS = 600
+EMPTY_USER_CACHE_SECONDS = 60
 
 
 def lookup_jira_user(query: str, max_results: int = 10) -> dict:
@@ -40,22 +50,29 @@ def lookup_jira_user(query: str, max_results: int = 10) -> dict:
                 }
             ]
         }
+
+        A copy of a result fetched in the last USER_CACHE_SECONDS (or
+        EMPTY_USER_CACHE_SECONDS, for no matches) may be returned.
     """
+    return dict(_lookup_users_cached(query, max_results))
+
+
+def _lookup_users(query: str, max_results: int) -> dict:
+    """Search /user/search (uncached; see lookup_jira_user)"""
     try:
-        response = requests.get(
+        response = get_jira_session().get(
             f"{JIRA_BASE_URL}/rest/api/3/user/search",
-            headers=get_jira_auth_headers(),
             params={
                 "query": query,
                 "maxResults": max_results
             },
-            timeout=30
+            timeout=DEFAULT_TIMEOUT
         )
 
         if response.status_code != 200:
-            return format_error(response.status_code, response.text)
+            return format_response_error(response)
 
-        data = response.json()
+        data = decode_json(response)
 
         users = []
         for user in data:
@@ -79,7 +96,17 @@ def lookup_jira_user(query: str, max_results: int = 10) -> dict:
         return format_error(500, str(e))
 
 
-def main():
+_lookup_users_cached = ttl_cache(
+    seconds=lambda result: USER_CACHE_SECONDS if result["users"] else EMPTY_USER_CACHE_SECONDS
+)(_lookup_users)
+
+
+def clear_user_cache():
+    """Forget cached user lookups"""
+    _lookup_users_cached.cache_clear()
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Search for Jira users by name or email",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -102,12 +129,23 @@ The account_id returned can be used for:
     )
     parser.add_argument("query", help="Search string (name or email)")
     parser.add_argument("--max-results", type=int, default=10, help="Maximum results (default: 10)")
+    return parser
+
+
+def _tool_kwargs(parser: argparse.ArgumentParser, args: argparse.Namespace) -> dict:
+    """lookup_jira_user arguments for a parsed command line"""
+    return {"query": args.query, "max_results": args.max_results}
+
+
+def main():
+    from .client import call_tool
 
+    parser = _build_parser()
     args = parser.parse_args()
 
     try:
-        result = lookup_jira_user(args.query, args.max_results)
-        print(json.dumps(result, indent=2))
+        result = call_tool("lookup_user", **_tool_kwargs(parser, args))
+        write_output(result, pretty=True)
 
         if result.get("error"):
             sys.exit(1)
@@ -10,6 +10,11 @@ Usage:
     python -m src.tools.jira.search "project = ECD" --fields summary,status,assignee
 """
 
+if __name__ == "__main__":
+    # A running tool daemon answers before the slower imports below
+    from .client import forward_cli
+    forward_cli("search")
+
 import argparse
 import json
 import sys
@@ -17,23 +22,37 @@ from typing import Optional
 
 import requests
 
-from ..base import get_jira_auth_headers, JIRA_BASE_URL, format_error
+from ..base import format_error, format_response_error, iter_jql_pages, search_jql_pages, write_output
+from .get_transitions import prefetch_transitions
+
+
+# Fields requested when the caller doesn't name any
+DEFAULT_SEARCH_FIELDS = [
+    "summary", "status", "assignee", "priority",
+    "created", "updated", "issuetype", "labels",
+    "reporter", "description"
+]
 
 
 def search_jira(
     jql: str,
     max_results: int = 50,
     fields: Optional[list] = None,
-    expand: Optional[list] = None
+    expand: Optional[list] = None,
+    prefetch: int = 0
 ) -> dict:
     """
     Search Jira issues using JQL (Jira Query Language)
 
     Args:
         jql: JQL query string (e.g., "project = ECD AND status = 'In Progress'")
-        max_results: Maximum number of results to return (default 50, max 100)
+        max_results: Maximum number of results to return (default 50; more
+                     than 100 are fetched page by page)
         fields: List of fields to return (default: common fields)
         expand: List of expansions (e.g., ["changelog", "renderedFields"])
+        prefetch: Fetch transitions for this many top results in the
+                  background, for in-process callers about to transition
+                  them (default 0, off)
 
     Returns:
         dict: {
@@ -53,59 +72,24 @@ def search_jira(
             ]
         }
     """
-    if fields is None:
-        fields = [
-            "summary", "status", "assignee", "priority",
-            "created", "updated", "issuetype", "labels",
-            "reporter", "description"
-        ]
-
-    payload = {
-        "jql": jql,
-        "maxResults": min(max_results, 100),
-        "fields": fields
-    }
-
+    payload = {"jql": jql, "fields": fields or DEFAULT_SEARCH_FIELDS}
     if expand:
         payload["expand"] = expand
 
     try:
         # Use the new JQL search endpoint (api/3/search is deprecated)
-        response = requests.post(
-            f"{JIRA_BASE_URL}/rest/api/3/search/jql",
-            headers=get_jira_auth_headers(),
-            json=payload,
-            timeout=30
-        )
-
-        if response.status_code != 200:
-            return format_error(response.status_code, response.text)
-
-        data = response.json()
+        raw_issues, failed = search_jql_pages(payload, max_results)
+        if failed is not None:
+            return format_response_error(failed)
 
         # Simplify the response for easier consumption
-        simplified_issues = []
-        for issue in data.get("issues", []):
-            fields_data = issue.get("fields", {})
-
-            simplified = {
-                "key": issue.get("key"),
-                "id": issue.get("id"),
-                "summary": fields_data.get("summary"),
-                "status": fields_data.get("status", {}).get("name") if fields_data.get("status") else None,
-                "assignee": fields_data.get("assignee", {}).get("displayName") if fields_data.get("assignee") else "Unassigned",
-                "assignee_id": fields_data.get("assignee", {}).get("accountId") if fields_data.get("assignee") else None,
-                "reporter": fields_data.get("reporter", {}).get("displayName") if fields_data.get("reporter") else None,
-                "priority": fields_data.get("priority", {}).get("name") if fields_data.get("priority") else None,
-                "type": fields_data.get("issuetype", {}).get("name") if fields_data.get("issuetype") else None,
-                "labels": fields_data.get("labels", []),
-                "created": fields_data.get("created"),
-                "updated": fields_data.get("updated"),
-            }
-            simplified_issues.append(simplified)
+        simplified_issues = [_simplify_issue(issue) for issue in raw_issues]
+
+        if prefetch:
+            prefetch_transitions(issue["key"] for issue in simplified_issues[:prefetch])
 
         return {
-            "total": data.get("total", 0),
+            "total": len(simplified_issues),
             "count": len(simplified_issues),
             "issues": simplified_issues
         }
@@ -116,7 +100,57 @@ def search_jira(
         return format_error(500, str(e))
 
 
-def main():
+def iter_search_jira(
+    jql: str,
+    fields: Optional[list] = None,
+    max_results: Optional[int] = None
+):
+    """
+    Iterate over every issue matching a JQL query, page by page
+
+    The next page is requested while the caller handles the current one
+    (see iter_jql_pages), so large result sets don't wait on each page in
+    turn.
+
+    Args:
+        jql: JQL query string
+        fields: List of fields to return (default: common fields)
+        max_results: Stop after this many issues (default: all)
+
+    Yields:
+        dict: Simplified issue, as in search_jira's "issues"
+
+    Raises:
+        requests.RequestException: If a page fails (HTTPError carries the response)
+    """
+    payload = {"jql": jql, "fields": fields or DEFAULT_SEARCH_FIELDS}
+    for page in iter_jql_pages(payload, max_results):
+        for issue in page:
+            yield _simplify_issue(issue)
+
+
+def _simplify_issue(issue: dict) -> dict:
+    """Flatten a search result issue to the fields we return"""
+    fields_data = issue.get("fields", {})
+    assignee = fields_data.get("assignee")
+
+    return {
+        "key": issue.get("key"),
+        "id": issue.get("id"),
+        "summary": fields_data.get("summary"),
+        "status": (fields_data.get("status") or {}).get("name"),
+        "assignee": assignee.get("displayName") if assignee else "Unassigned",
+        "assignee_id": assignee.get("accountId") if assignee else None,
+        "reporter": (fields_data.get("reporter") or {}).get("displayName"),
+        "priority": (fields_data.get("priority") or {}).get("name"),
+        "type": (fields_data.get("issuetype") or {}).get("name"),
+        "labels": fields_data.get("labels", []),
+        "created": fields_data.get("created"),
+        "updated": fields_data.get("updated"),
+    }
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Search Jira issues using JQL",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -138,14 +172,24 @@ Examples:
     parser.add_argument("jql", help="JQL query string")
     parser.add_argument("--max-results", type=int, default=50, help="Maximum results (default: 50)")
     parser.add_argument("--fields", help="Comma-separated list of fields to return")
+    return parser
 
-    args = parser.parse_args()
 
+def _tool_kwargs(parser: argparse.ArgumentParser, args: argparse.Namespace) -> dict:
+    """search_jira arguments for a parsed command line"""
     fields = args.fields.split(",") if args.fields else None
+    return {"jql": args.jql, "max_results": args.max_results, "fields": fields}
+
+
+def main():
+    from .client import call_tool
+
+    parser = _build_parser()
+    args = parser.parse_args()
 
     try:
-        result = search_jira(args.jql, args.max_results, fields)
-        print(json.dumps(result, indent=2))
+        result = call_tool("search", **_tool_kwargs(parser, args))
+        write_output(result, pretty=True)
 
         if result.get("error"):
             sys.exit(1)
@@ -10,6 +10,11 @@ Usage:
     python -m src.tools.jira.transition_issue ECD-123 --transition-id 21
 """
 
+if __name__ == "__main__":
+    # A running tool daemon answers before the slower imports below
+    from .client import forward_cli
+    forward_cli("transition_issue")
+
 import argparse
 import json
 import sys
@@ -17,8 +22,8 @@ from typing import Optional
 
 import requests
 
-from ..base import get_jira_auth_headers, JIRA_BASE_URL, format_error
-from .get_transitions import get_jira_transitions
+from ..base import async_tool, get_jira_session, JIRA_BASE_URL, DEFAULT_TIMEOUT, decode_json, encode_json, format_error, format_response_error, run_parallel, write_output
+from .get_transitions import clear_transitions_cache, get_jira_transitions
 
 
 def transition_jira_issue(
@@ -88,25 +93,26 @@ def transition_jira_issue(
         }
 
     try:
-        response = requests.post(
+        response = get_jira_session().post(
             f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}/transitions",
-            headers=get_jira_auth_headers(),
-            json=payload,
-            timeout=30
+            data=encode_json(payload),
+            timeout=DEFAULT_TIMEOUT
         )
 
+        # The status moved (or the cached transition list was stale)
+        clear_transitions_cache(issue_key)
+
         # 204 No Content means success
         if response.status_code == 204:
             # Get new status
-            issue_response = requests.get(
+            issue_response = get_jira_session().get(
                 f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}",
-                headers=get_jira_auth_headers(),
                 params={"fields": "status"},
-                timeout=30
+                timeout=DEFAULT_TIMEOUT
             )
             new_status = None
             if issue_response.status_code == 200:
-                new_status = issue_response.json().get("fields", {}).get("status", {}).get("name")
+                new_status = decode_json(issue_response).get("fields", {}).get("status", {}).get("name")
 
             return {
                 "success": True,
@@ -115,7 +121,7 @@ def transition_jira_issue(
                 "new_status": new_status,
             }
 
-        return format_error(response.status_code, response.text)
+        return format_response_error(response)
 
     except requests.exceptions.Timeout:
         return format_error(408, "Request timed out")
@@ -123,7 +129,56 @@ def transition_jira_issue(
         return format_error(500, str(e))
 
 
-def main():
+transition_jira_issue_async = async_tool(transition_jira_issue)
+
+
+def bulk_transition_jira_issues(
+    issue_keys: list,
+    transition_name: Optional[str] = None,
+    transition_id: Optional[str] = None,
+    comment: Optional[str] = None
+) -> dict:
+    """
+    Apply the same transition to many issues concurrently
+
+    Each issue still resolves the transition name against its own status,
+    so issues that can't make the transition fail individually.
+
+    Args:
+        issue_keys: Issue keys (duplicates are transitioned once)
+        transition_name: Name of the transition (e.g., "Done")
+        transition_id: ID of the transition (takes precedence over name)
+        comment: Optional comment to add on each issue
+
+    Returns:
+        dict: {
+            "success": True,
+            "transitioned": 2,
+            "failed": 0,
+            "results": [...]  # transition_jira_issue result per issue, in key order
+        }
+    """
+    issue_keys = list(dict.fromkeys(issue_keys))
+    if not issue_keys:
+        return format_error(400, "No issue keys provided")
+
+    results = run_parallel(
+        lambda issue_key: transition_jira_issue(
+            issue_key, transition_name=transition_name, transition_id=transition_id, comment=comment
+        ),
+        issue_keys
+    )
+
+    failed = sum(1 for result in results if result.get("error"))
+    return {
+        "success": failed == 0,
+        "transitioned": len(results) - failed,
+        "failed": failed,
+        "results": results
+    }
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Transition a Jira issue to a new status",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -139,32 +194,82 @@ Examples:
     # Transition with comment
     python -m src.tools.jira.transition_issue ECD-123 "Done" --comment "Completed review"
 
+    # Transition every issue listed in a file (one key per line)
+    python -m src.tools.jira.transition_issue --batch keys.txt "Done"
+
 Tip: Use get_transitions.py first to see available transitions
         """
     )
-    parser.add_argument("issue_key", help="Issue key (e.g., ECD-123)")
+    parser.add_argument("issue_key", nargs="?", help="Issue key (e.g., ECD-123)")
     parser.add_argument("transition", nargs="?", help="Transition name (e.g., 'Done', 'In Progress')")
     parser.add_argument("--transition-id", help="Transition ID (takes precedence over name)")
     parser.add_argument("--comment", help="Comment to add during transition")
+    parser.add_argument("--batch", help="File of issue keys, one per line (transitioned concurrently)")
+    return parser
 
-    args = parser.parse_args()
+
+def _tool_kwargs(parser: argparse.ArgumentParser, args: argparse.Namespace) -> Optional[dict]:
+    """transition_jira_issue arguments for a parsed command line (None for --batch)"""
+    if args.batch:
+        return None
+
+    if not args.issue_key:
+        parser.error("issue_key is required unless --batch is given")
 
     if not args.transition and not args.transition_id:
         parser.error("Either transition name or --transition-id is required")
 
-    try:
-        result = transition_jira_issue(
-            args.issue_key,
-            transition_name=args.transition,
+    return {
+        "issue_key": args.issue_key,
+        "transition_name": args.transition,
+        "transition_id": args.transition_id,
+        "comment": args.comment
+    }
+
+
+def _success_note(args: argparse.Namespace, result: dict) -> str:
+    return f"Transitioned {args.issue_key} to {result.get('new_status')}"
+
+
+def main():
+    from .client import call_tool
+
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    if args.batch:
+        # With --batch the only positional argument is the transition name
+        transition = args.transition or args.issue_key
+        if not transition and not args.transition_id:
+            parser.error("Either transition name or --transition-id is required")
+        try:
+            with open(args.batch) as f:
+                issue_keys = [line.strip() for line in f if line.strip()]
+        except OSError as e:
+            print(json.dumps({"error": True, "message": f"Could not read {args.batch}: {e}"}), file=sys.stderr)
+            sys.exit(1)
+
+        result = bulk_transition_jira_issues(
+            issue_keys,
+            transition_name=transition,
             transition_id=args.transition_id,
             comment=args.comment
         )
-        print(json.dumps(result, indent=2))
+        write_output(result, pretty=True)
+        if not result.get("success"):
+            sys.exit(1)
+        return
+
+    kwargs = _tool_kwargs(parser, args)
+
+    try:
+        result = call_tool("transition_issue", **kwargs)
+        write_output(result, pretty=True)
 
         if result.get("error"):
             sys.exit(1)
         else:
-            print(f"Transitioned {args.issue_key} to {result.get('new_status')}", file=sys.stderr)
+            print(_success_note(args, result), file=sys.stderr)
 
     except Exception as e:
         print(json.dumps({"error": True, "message": str(e)}), file=sys.stderr)
@@ -5,16 +5,79 @@ Centralized Slack Logging Utility
 Posts heartbeats, activity logs, errors, and reports to #pm-agent-logs channel.
 """
 
+import json
 import os
+import queue
+import threading
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any
+from pathlib import Path
+from typing import Optional, Dict, Any, List
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
+# Keep each batched post under Slack's recommended message length
+SLACK_MESSAGE_LIMIT = 4000
+
+# Messages waiting for the writer thread; the oldest are dropped past this
+SLACK_QUEUE_MAXSIZE = 1000
+
+# Channels that passed conversations_info recently, so short-lived runs
+# skip the check (channel id -> {"name", "ts"})
+CHANNEL_CACHE_FILE = Path(".claude/data/bot-state/slack_channel_verified.json")
+CHANNEL_CACHE_SECONDS = 86400
+
+
+def _join_messages(messages: List[str]) -> List[str]:
+    """
+    Join messages with blank lines into as few posts as fit SLACK_MESSAGE_LIMIT
+
+    Args:
+        messages: Message texts in posting order
+
+    Returns:
+        Post texts (a single over-long message is kept as its own post)
+    """
+    posts = []
+    current = ""
+    for text in messages:
+        if current and len(current) + 2 + len(text) > SLACK_MESSAGE_LIMIT:
+            posts.append(current)
+            current = text
+        else:
+            current = f"{current}\n\n{text}" if current else text
+
+    if current:
+        posts.append(current)
+    return posts
+
+
+def _load_channel_cache() -> dict:
+    try:
+        with open(CHANNEL_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_channel_cache(cache: dict):
+    """Write the cache atomically; a failed write only costs a re-check"""
+    try:
+        CHANNEL_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = CHANNEL_CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, CHANNEL_CACHE_FILE)
+    except OSError:
+        pass
+
 
 class SlackLogger:
     """Centralized logging to Slack #pm-agent-logs channel"""
 
+    # Channels already verified by this process
+    _verified_channels = set()
+
     def __init__(self):
         self.token = os.getenv("SLACK_BOT_TOKEN")
         self.log_channel = os.getenv("SLACK_PM_AGENT_LOG_CHANNEL")
@@ -26,15 +89,100 @@ class SlackLogger:
             raise ValueError("SLACK_PM_AGENT_LOG_CHANNEL not set in environment")
 
         self.client = WebClient(token=self.token)
+        self._queue = None
+        self.dropped_messages = 0
         self._verify_channel()
+        self.start_batching()
 
     def _verify_channel(self):
-        """Verify the logging channel exists and bot has access"""
+        """
+        Verify the logging channel exists and bot has access
+
+        Skipped when this process or a run within CHANNEL_CACHE_SECONDS
+        already verified it; failures are not cached.
+        """
+        if self.log_channel in SlackLogger._verified_channels:
+            return
+
+        cache = _load_channel_cache()
+        cached = cache.get(self.log_channel)
+        if cached and time.time() - cached.get("ts", 0) < CHANNEL_CACHE_SECONDS:
+            SlackLogger._verified_channels.add(self.log_channel)
+            return
+
         try:
             response = self.client.conversations_info(channel=self.log_channel)
-            print(f"✅ Slack logging channel verified: #{response['channel']['name']}")
         except SlackApiError as e:
             print(f"⚠️ Warning: Cannot access Slack logging channel {self.log_channel}: {e.response['error']}")
+            return
+
+        name = response['channel']['name']
+        print(f"✅ Slack logging channel verified: #{name}")
+        SlackLogger._verified_channels.add(self.log_channel)
+        cache[self.log_channel] = {"name": name, "ts": time.time()}
+        _save_channel_cache(cache)
+
+    def start_batching(self, window: float = 1.0, max_messages: int = 20):
+        """
+        Queue messages and post them from a background writer thread
+
+        Started by the constructor, so callers never wait on the Slack API.
+        Messages queued within `window` seconds of each other are combined
+        into one Slack post. Calling it again only changes the batch settings.
+
+        Args:
+            window: Seconds to wait for more messages before posting a batch
+            max_messages: Max messages combined into one batch
+        """
+        self._batch_window = window
+        self._batch_max = max_messages
+        if self._queue is not None:
+            return
+
+        self._queue = queue.Queue(maxsize=SLACK_QUEUE_MAXSIZE)
+        self._writer = threading.Thread(target=self._drain_queue, name="slack-logger", daemon=True)
+        self._writer.start()
+
+    def _drain_queue(self):
+        """Post queued messages in batches (runs on the writer thread)"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._batch_window
+
+            while len(batch) < self._batch_max:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                for text in _join_messages(batch):
+                    self._send(text)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Wait for queued messages to be posted (e.g. before shutdown)
+
+        Args:
+            timeout: Max seconds to wait
+
+        Returns:
+            True if the queue drained, False if messages are still pending
+        """
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
 
     def post_heartbeat(self, metrics: Dict[str, Any]) -> bool:
         """
@@ -182,6 +330,29 @@ class SlackLogger:
         """
         Internal method to post message to Slack
 
+        Args:
+            text: Message text (supports markdown)
+
+        Returns:
+            True once queued for the writer thread
+        """
+        while True:
+            try:
+                self._queue.put_nowait(text)
+                return True
+            except queue.Full:
+                # Slack is down or throttling us; keep the newest messages
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                    self.dropped_messages += 1
+                except queue.Empty:
+                    pass
+
+    def _send(self, text: str) -> bool:
+        """
+        Post one message to the log channel
+
         Args:
             text: Message text (supports markdown)
 
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Activity Tracker's batched writes
+
+Uses a temporary SQLite database.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src import activity_tracker
+from src.activity_tracker import ActivityTracker
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return ActivityTracker(db_path=str(tmp_path / "activity.db"))
+
+
+def count_rows(tracker):
+    with sqlite3.connect(tracker.db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM activities").fetchone()[0]
+
+
+class TestBatchedLogging:
+    """Test log_async batching"""
+
+    def test_rows_are_queued_until_flush(self, tracker):
+        tracker.log_async("polling_slack", "Polled Slack, found 0 mentions")
+        tracker.log_async("polling_jira", "Polled Jira, found 0 comments")
+
+        assert count_rows(tracker) == 0
+
+        tracker.flush()
+
+        assert count_rows(tracker) == 2
+
+    def test_reads_include_queued_rows(self, tracker):
+        tracker.log("sla_check", "Checked SLAs")
+        tracker.log_async("heartbeat", "Posted heartbeat")
+
+        activities = tracker.get_recent_activities()
+
+        assert {a["type"] for a in activities} == {"sla_check", "heartbeat"}
+        assert tracker.get_last_activity("heartbeat") is not None
+
+    def test_full_batch_is_written_immediately(self, tracker, monkeypatch):
+        monkeypatch.setattr(activity_tracker, "ACTIVITY_BATCH_SIZE", 3)
+
+        for _ in range(3):
+            tracker.log_async("polling_bitbucket")
+
+        assert count_rows(tracker) == 3
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Confluence page editing helpers
+
+The page fetch and update calls are mocked; no pages are modified.
+"""
+
+import json
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.tools.confluence import search as confluence_search, update_page
+from src.tools.confluence.create_page import DEFAULT_RELEASE_TEMPLATE
+
+
+@pytest.fixture
+def edit_page():
+    """Run an edit helper against a fake page; returns the body it would write"""
+    def run(helper, body, *args, **kwargs):
+        written = {}
+        page = {"id": "1", "title": "Release Notes", "version": 3, "body": body}
+
+        with patch.object(update_page, "_page_for_edit", return_value=page), \
+             patch.object(update_page, "update_confluence_page",
+                          side_effect=lambda **call: written.update(call) or {"id": "1"}):
+            result = helper("1", *args, **kwargs)
+
+        return written.get("body"), result
+
+    return run
+
+
+class TestSearchConfluenceAll:
+    """Test fetching every page of a CQL search"""
+
+    def test_short_first_page_sets_the_step(self):
+        # The server caps limit at 100 whatever was asked for
+        def search(cql, limit, start, **kwargs):
+            ids = list(range(start, min(start + min(limit, 100), 250)))
+            return {"total": 250, "count": len(ids), "results": [{"id": str(n)} for n in ids]}
+
+        with patch.object(confluence_search, "search_confluence", side_effect=search) as mock_search:
+            result = confluence_search.search_confluence_all("type = page", page_size=250)
+
+        assert [r["id"] for r in result["results"]] == [str(n) for n in range(250)]
+        assert sorted(call.kwargs["start"] for call in mock_search.call_args_list) == [0, 100, 200]
+
+
+class TestAddFeatureToReleaseNotes:
+    """Test splicing a feature into a release notes page"""
+
+    def test_feature_goes_at_end_of_whats_new(self, edit_page):
+        body, _ = edit_page(
+            update_page.add_feature_to_release_notes, DEFAULT_RELEASE_TEMPLATE,
+            "ECD-9", "Bulk export", "Export many documents at once", "Documents"
+        )
+
+        whats_new = body.index("<h2>What's New</h2>")
+        feature = body.index("<h3>Bulk export</h3>")
+        details = body.index("<h2>Details by Module</h2>")
+        row = body.index("<td>Documents</td>")
+
+        assert whats_new < feature < details < row < body.index("</table>")
+        assert body.count("ECD-9</a>") == 2
+
+    def test_falls_back_to_known_issues_then_end(self, edit_page):
+        body, _ = edit_page(
+            update_page.add_feature_to_release_notes,
+            "<h2>Overview</h2>\n<h2>Known Issues</h2>", "ECD-9", "Feature", "Desc"
+        )
+        assert body.index("<h3>Feature</h3>") < body.index("<h2>Known Issues</h2>")
+
+        body, _ = edit_page(
+            update_page.add_feature_to_release_notes,
+            "<h2>Overview</h2>", "ECD-9", "Feature", "Desc"
+        )
+        assert body.startswith("<h2>Overview</h2>\n\n")
+        assert "<h3>Feature</h3>" in body
+
+    def test_existing_key_is_skipped(self, edit_page):
+        body, result = edit_page(
+            update_page.add_feature_to_release_notes,
+            "<p>ECD-9 shipped</p>", "ECD-9", "Feature", "Desc"
+        )
+
+        assert body is None
+        assert result["skipped"] is True
+
+    def test_longer_key_is_not_a_match(self, edit_page):
+        body, _ = edit_page(
+            update_page.add_feature_to_release_notes,
+            "<p>ECD-123 shipped</p>", "ECD-12", "Feature", "Desc"
+        )
+
+        assert "<h3>Feature</h3>" in body
+
+
+class TestAppendToPage:
+    """Test appending content to a page"""
+
+    def test_inserts_before_first_marker(self, edit_page):
+        body, _ = edit_page(
+            update_page.append_to_page,
+            "<p>a</p><h2>Known Issues</h2><p>b</p>", "<p>new</p>", "<h2>Known Issues</h2>"
+        )
+
+        assert body == "<p>a</p><p>new</p>\n\n<h2>Known Issues</h2><p>b</p>"
+
+    def test_appends_without_marker(self, edit_page):
+        body, _ = edit_page(update_page.append_to_page, "<p>a</p>", "<p>new</p>", "<h2>Missing</h2>")
+
+        assert body == "<p>a</p>\n\n<p>new</p>"
+
+
+class TestVersionConflictRetry:
+    """Test re-applying an edit after a concurrent change"""
+
+    def test_conflict_rereads_and_retries_once(self):
+        pages = [
+            {"id": "1", "title": "Notes", "version": 3, "body": "<p>a</p>"},
+            {"id": "1", "title": "Notes", "version": 4, "body": "<p>b</p>"},
+        ]
+        conflict = {"error": True, "status_code": 409, "message": "version conflict"}
+        updates = []
+
+        with patch.object(update_page, "_page_for_edit", side_effect=pages), \
+             patch.object(update_page, "update_confluence_page",
+                          side_effect=lambda **call: updates.append(call) or (conflict if len(updates) == 1 else {"id": "1"})):
+            result = update_page.append_to_page("1", "<p>new</p>")
+
+        assert result == {"id": "1"}
+        assert [(call["version"], call["body"]) for call in updates] == [
+            (3, "<p>a</p>\n\n<p>new</p>"),
+            (4, "<p>b</p>\n\n<p>new</p>"),
+        ]
+
+
+class TestUpdateConfluencePage:
+    """Test update_confluence_page against our last write"""
+
+    def test_unchanged_live_page_skips_put(self):
+        page = {"id": "1", "title": "Release Notes", "version": 4, "body": "<p>a</p>",
+                "space_key": "ECD", "url": "https://example.atlassian.net/wiki/x/1"}
+
+        with patch.object(update_page, "_written_pages", OrderedDict()), \
+             patch.object(update_page, "get_confluence_page", return_value=page), \
+             patch.object(update_page, "get_confluence_session") as mock_session:
+            result = update_page.update_confluence_page("1", "<p>a</p>")
+
+            assert result["skipped"] is True
+            assert {k: result[k] for k in ("id", "title", "version", "space_key", "url")} == {
+                "id": "1", "title": "Release Notes", "version": 4,
+                "space_key": "ECD", "url": "https://example.atlassian.net/wiki/x/1"
+            }
+            mock_session.return_value.put.assert_not_called()
+
+    def test_our_last_write_does_not_skip_put(self):
+        # Someone may have edited the page since; let the PUT's version check decide
+        page = {"id": "1", "title": "Release Notes", "version": 4, "body": "<p>a</p>"}
+
+        with patch.object(update_page, "_written_pages", OrderedDict([("1", page)])), \
+             patch.object(update_page, "get_confluence_session") as mock_session:
+            mock_session.return_value.put.return_value = MagicMock(status_code=409, content=b"conflict")
+
+            result = update_page.update_confluence_page("1", "<p>a</p>", title="Release Notes", version=4)
+
+            assert result["status_code"] == 409
+            mock_session.return_value.put.assert_called_once()
+
+    def test_direct_update_fetches_live_version(self):
+        # Our last write was version 4; someone has edited the page since
+        written = {"id": "1", "title": "Release Notes", "version": 4, "body": "<p>a</p>"}
+        live = {"id": "1", "title": "Release Notes", "version": 5, "body": "<p>edited</p>"}
+
+        with patch.object(update_page, "_written_pages", OrderedDict([("1", written)])), \
+             patch.object(update_page, "get_confluence_page", return_value=live), \
+             patch.object(update_page, "get_confluence_session") as mock_session:
+            mock_session.return_value.put.return_value = MagicMock(
+                status_code=200, content=b'{"id": "1", "title": "Release Notes", "version": {"number": 6}}'
+            )
+
+            result = update_page.update_confluence_page("1", "<p>a</p>")
+
+            assert result["version"] == 6
+            put_body = json.loads(mock_session.return_value.put.call_args.kwargs["data"])
+            assert put_body["version"]["number"] == 6
@@ -24,12 +24,12 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from src.tools.jira.search import search_jira
 from src.tools.jira.get_issue import get_jira_issue
 from src.tools.jira.add_comment import add_jira_comment
-from src.tools.jira.edit_issue import edit_jira_issue
+from src.tools.jira.edit_issue import edit_jira_issue, bulk_edit_jira_issues
 from src.tools.jira.transition_issue import transition_jira_issue
 from src.tools.jira.get_transitions import get_jira_transitions
 from src.tools.jira.lookup_user import lookup_jira_user
 from src.tools.jira.list_projects import list_jira_projects
-from src.tools.base import get_jira_auth_headers, build_adf_comment, JIRA_BASE_URL
+from src.tools.base import get_jira_auth_headers, adf_to_text, build_adf_comment, JIRA_BASE_URL
 
 
 class TestJiraAuthentication:
@@ -81,6 +81,22 @@ class TestADFBuilder:
         assert "mention" in content_str, "Should contain mention node"
         assert "712020:abc123" in content_str, "Should contain account ID"
 
+    def test_adf_mentions_in_text_order(self):
+        """Test mentions are matched in text order, including repeats"""
+        mentions = [
+            {"id": "712020:mo", "name": "Mo"},
+            {"id": "712020:ethan", "name": "Ethan Drower"},
+            {"id": "712020:e", "name": "Ethan"},
+        ]
+        adf = build_adf_comment("Hi @Ethan Drower and @Mo, cc @Ethan Drower", mentions)
+
+        nodes = adf["content"][0]["content"]
+        assert [n["attrs"]["id"] for n in nodes if n["type"] == "mention"] == [
+            "712020:ethan", "712020:mo", "712020:ethan"
+        ]
+        assert nodes[0] == {"type": "text", "text": "Hi "}
+        assert nodes[-1]["type"] == "mention"
+
     def test_adf_multiline(self):
         """Test building ADF with multiple lines"""
         text = "Line 1\n\nLine 2\n\nLine 3"
@@ -89,6 +105,17 @@ class TestADFBuilder:
         # Should have multiple paragraphs
         assert len(adf["content"]) >= 1
 
+    def test_adf_to_text_in_document_order(self):
+        """Test extracting text from nested ADF"""
+        adf = build_adf_comment("first")
+        adf["content"].append({"type": "bulletList", "content": [
+            {"type": "listItem", "content": [{"type": "paragraph", "content": [{"type": "text", "text": "second"}]}]}
+        ]})
+        adf["content"].append({"type": "paragraph", "content": [{"type": "text", "text": "third"}]})
+
+        assert adf_to_text(adf) == "first second third"
+        assert adf_to_text(None) == ""
+
 
 class TestSearchJira:
     """Test Jira search functionality"""
@@ -161,6 +188,29 @@ class TestGetIssue:
         # Should return error, not raise exception
         assert result.get("error") is True or "error" in result
 
+    def test_comments_come_from_the_issue_response(self):
+        """Test include_comments reads the inline comment field (one request)"""
+        comment_field = {"total": 2, "comments": [
+            {"id": "1", "author": {"displayName": "A"}, "body": {"type": "doc", "content": [{"type": "text", "text": "old"}]}},
+            {"id": "2", "author": {"displayName": "B"}, "body": {"type": "doc", "content": [{"type": "text", "text": "new"}]}},
+        ]}
+        with patch('src.tools.jira.get_issue.get_jira_session') as mock_session:
+            mock_get = mock_session.return_value.get
+            mock_get.return_value = MagicMock(
+                status_code=200,
+                content=json.dumps({"key": "ECD-1", "fields": {"comment": comment_field}}).encode()
+            )
+
+            result = get_jira_issue("ECD-1", fields=["summary"], include_comments=True)
+
+            mock_get.assert_called_once()
+            assert mock_get.call_args[1]["params"]["fields"] == "summary,comment"
+            assert [c["body"] for c in result["comments"]] == ["new", "old"]
+            assert set(result) == {"key", "id", "self", "summary", "comments"}
+
+            get_jira_issue("ECD-1", fields="summary,comment", include_comments=True)
+            assert mock_get.call_args[1]["params"]["fields"] == "summary,comment"
+
 
 class TestLookupUser:
     """Test Jira user lookup"""
@@ -240,6 +290,47 @@ class TestGetTransitions:
                 assert "name" in transition
 
 
+class TestToolDaemon:
+    """Test CLI dispatch through the tool daemon"""
+
+    def test_runs_in_process_without_daemon(self, tmp_path):
+        from src.tools.jira import client
+
+        with patch.object(client, "SOCKET_PATH", tmp_path / "missing.sock"), \
+             patch('src.tools.jira.lookup_user.lookup_jira_user', return_value={"count": 0}) as mock_lookup:
+            assert client.call_tool("lookup_user", query="ethan") == {"count": 0}
+            mock_lookup.assert_called_once_with(query="ethan")
+
+            assert client.call_tool("nope")["status_code"] == 400
+
+    def test_daemon_runs_cli_command_lines(self):
+        from src.tools.jira import daemon
+
+        with patch('src.tools.jira.lookup_user.lookup_jira_user', return_value={"count": 0}) as mock_lookup:
+            reply = daemon.run_cli("lookup_user", ["ethan", "--max-results", "3"])
+
+            mock_lookup.assert_called_once_with(query="ethan", max_results=3)
+            assert json.loads(reply["stdout"]) == {"count": 0}
+            assert reply["exit_code"] == 0
+
+            # Usage output and local files stay with the caller
+            assert daemon.run_cli("lookup_user", ["--help"]) == {"run_locally": True}
+            assert daemon.run_cli("lookup_user", []) == {"run_locally": True}
+            assert daemon.run_cli("transition_issue", ["--batch", "keys.txt", "Done"]) == {"run_locally": True}
+
+    def test_client_skips_requests_import(self):
+        result = subprocess.run(
+            [sys.executable, "-c",
+             "import sys, src.tools.jira.client; print('requests' in sys.modules, 'src.tools.base' in sys.modules)"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+
+        assert result.stdout.split() == ["False", "False"]
+
+
 class TestCLIInterface:
     """Test command-line interface for tools"""
 
@@ -335,7 +426,8 @@ class TestWriteOperations:
         """Test add_comment builds correct request structure"""
         # This tests the function signature and return type
         # without actually posting to Jira
-        with patch('src.tools.jira.add_comment.requests.post') as mock_post:
+        with patch('src.tools.jira.add_comment.get_jira_session') as mock_session:
+            mock_post = mock_session.return_value.post
             mock_response = MagicMock()
             mock_response.status_code = 201
             mock_response.json.return_value = {"id": "12345"}
@@ -352,7 +444,8 @@ class TestWriteOperations:
 
     def test_edit_issue_structure(self):
         """Test edit_issue builds correct request structure"""
-        with patch('src.tools.jira.edit_issue.requests.put') as mock_put:
+        with patch('src.tools.jira.edit_issue.get_jira_session') as mock_session:
+            mock_put = mock_session.return_value.put
             mock_response = MagicMock()
             mock_response.status_code = 204
             mock_put.return_value = mock_response
@@ -365,10 +458,42 @@ class TestWriteOperations:
             call_url = mock_put.call_args[0][0]
             assert "ECD-TEST" in call_url
 
+    def test_edit_issue_label_helpers(self):
+        """Test label arguments are normalized into fields/update"""
+        with patch('src.tools.jira.edit_issue.get_jira_session') as mock_session:
+            mock_put = mock_session.return_value.put
+            mock_put.return_value = MagicMock(status_code=204)
+
+            edit_jira_issue("ECD-TEST", labels=" ui, ,ui,backend", add_labels=["urgent"], remove_labels="old")
+
+            payload = json.loads(mock_put.call_args[1]["data"])
+            assert payload["fields"] == {"labels": ["ui", "backend"]}
+            assert payload["update"] == {"labels": [{"add": "urgent"}, {"remove": "old"}]}
+
+    def test_bulk_edit_merges_per_issue(self):
+        """Test bulk_edit sends one merged PUT per issue"""
+        with patch('src.tools.jira.edit_issue.get_jira_session') as mock_session:
+            mock_put = mock_session.return_value.put
+            mock_put.return_value = MagicMock(status_code=204)
+
+            result = bulk_edit_jira_issues([
+                {"issue_key": "ECD-TEST", "fields": {"summary": "Updated summary"}},
+                {"issue_key": "ECD-OTHER", "update": {"labels": [{"add": "backend"}]}},
+                {"issue_key": "ECD-TEST", "fields": {"priority": {"name": "High"}}},
+            ])
+
+            assert result["success"] is True
+            assert result["updated"] == 2
+            assert mock_put.call_count == 2
+            payloads = {call[0][0].rsplit("/", 1)[-1]: json.loads(call[1]["data"]) for call in mock_put.call_args_list}
+            assert payloads["ECD-TEST"] == {"fields": {"summary": "Updated summary", "priority": {"name": "High"}}}
+            assert payloads["ECD-OTHER"] == {"update": {"labels": [{"add": "backend"}]}}
+
     def test_transition_issue_structure(self):
         """Test transition_issue builds correct request structure"""
         with patch('src.tools.jira.transition_issue.get_jira_transitions') as mock_get:
-            with patch('src.tools.jira.transition_issue.requests.post') as mock_post:
+            with patch('src.tools.jira.transition_issue.get_jira_session') as mock_session:
+                mock_post = mock_session.return_value.post
                 mock_get.return_value = {
                     "transitions": [{"id": "21", "name": "In Progress"}]
                 }
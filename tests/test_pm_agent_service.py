@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the PM agent service's polling and scheduling
+
+Monitors, orchestrator and post pool are mocked; nothing is posted.
+"""
+
+import itertools
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# The service imports every monitor, including the Bitbucket CLI client
+pytest.importorskip("bitbucket_cli")
+
+from src import pm_agent_service
+from src.pm_agent_service import PMAgentService
+
+
+@pytest.fixture
+def service():
+    """PMAgentService with mocked collaborators; posts run inline"""
+    svc = PMAgentService.__new__(PMAgentService)
+    svc.seen_jira_events = OrderedDict()
+    svc.seen_events_lock = threading.Lock()
+    svc.slack_logger = None
+    svc.jira_browse_prefix = "https://example.atlassian.net/browse/"
+
+    svc.jira_monitor = MagicMock()
+    svc.jira_monitor.poll_for_mentions.return_value = [{
+        "issue_key": "ECD-1",
+        "comment_id": "10",
+        "comment_text": "@pm is this on track?",
+        "author": "Ethan",
+    }]
+
+    svc.orchestrator = MagicMock()
+    svc.orchestrator.detect_pm_intent.return_value = {"is_pm_request": False, "confidence": 0}
+    svc.orchestrator.process_jira_comment.return_value = {"response": "Yes, on track"}
+
+    svc.jira_post_pool = MagicMock()
+    svc.jira_post_pool.submit.side_effect = lambda fn, *args: fn(*args)
+
+    with patch.object(pm_agent_service, "get_tracker"), \
+         patch.object(pm_agent_service, "get_pm_requests_db") as mock_db:
+        mock_db.return_value.get_request_by_source.return_value = None
+        yield svc
+
+
+class TestJiraResponsePosting:
+    """Test retrying Jira replies whose post failed"""
+
+    @pytest.mark.parametrize("failure", [False, RuntimeError("Jira unavailable")])
+    def test_failed_post_is_retried_on_next_poll(self, service, failure):
+        add_comment = service.jira_monitor.add_comment
+        add_comment.side_effect = [failure, True]
+
+        service.poll_jira()
+        assert ("ECD-1", "10") not in service.seen_jira_events
+        service.jira_monitor.mark_processed.assert_not_called()
+
+        service.poll_jira()
+        service.poll_jira()     # handled now; skipped
+
+        assert add_comment.call_count == 2
+        service.jira_monitor.mark_processed.assert_called_once_with("ECD-1", "10")
+
+
+class TestScheduler:
+    """Test that slow jobs don't hold up the scheduler thread"""
+
+    def test_slow_jira_poll_does_not_delay_slack_poll(self):
+        svc = PMAgentService.__new__(PMAgentService)
+        svc.running = True
+        svc.stop_event = threading.Event()
+        svc.jobs = []
+        svc._job_seq = itertools.count()
+        svc.background_runs = {}
+
+        release = threading.Event()
+        slack_polls = []
+        svc.jira_monitor = MagicMock(polling_interval=60)
+        svc.poll_jira = lambda: release.wait(5)     # e.g. a reply going through Claude
+        svc.start_jira_polling()
+        svc._schedule_job("Slack polling", lambda: slack_polls.append(time.monotonic()), 0.05)
+
+        scheduler = threading.Thread(target=svc._scheduler_loop, daemon=True)
+        scheduler.start()
+        try:
+            time.sleep(0.5)
+            assert not release.is_set()
+            assert len(slack_polls) >= 3
+        finally:
+            svc.stop_event.set()
+            release.set()
+            scheduler.join(timeout=5)
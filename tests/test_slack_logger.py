@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Slack logger's batching writer
+
+The Slack client is mocked; no messages are posted.
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.utils import slack_logger as slack_logger_module
+from src.utils.slack_logger import SlackLogger, SLACK_MESSAGE_LIMIT, _join_messages
+
+
+@pytest.fixture
+def slack_logger(monkeypatch, tmp_path):
+    """SlackLogger with a mocked WebClient and an empty channel cache"""
+    monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+    monkeypatch.setenv("SLACK_PM_AGENT_LOG_CHANNEL", "C123")
+    monkeypatch.setattr(slack_logger_module, "CHANNEL_CACHE_FILE", tmp_path / "slack_channel_verified.json")
+    monkeypatch.setattr(SlackLogger, "_verified_channels", set())
+
+    with patch("src.utils.slack_logger.WebClient") as client_cls:
+        client = client_cls.return_value
+        client.chat_postMessage.return_value = {"ok": True}
+        client.conversations_info.return_value = {"channel": {"name": "pm-agent-logs"}}
+        yield SlackLogger()
+
+
+class TestJoinMessages:
+    """Test packing messages into Slack-sized posts"""
+
+    def test_small_messages_share_one_post(self):
+        assert _join_messages(["one", "two", "three"]) == ["one\n\ntwo\n\nthree"]
+
+    def test_splits_before_limit(self):
+        half = "x" * (SLACK_MESSAGE_LIMIT // 2)
+
+        posts = _join_messages([half, half, "tail"])
+
+        assert posts == [half, f"{half}\n\ntail"]
+        assert all(len(post) <= SLACK_MESSAGE_LIMIT for post in posts)
+
+    def test_oversized_message_is_posted_alone(self):
+        huge = "y" * (SLACK_MESSAGE_LIMIT + 10)
+
+        assert _join_messages(["a", huge, "b"]) == ["a", huge, "b"]
+
+
+class TestVerifyChannel:
+    """Test skipping the channel check once it has passed"""
+
+    def test_verified_channel_is_cached(self, slack_logger):
+        client = slack_logger.client
+        client.conversations_info.reset_mock()
+        SlackLogger._verified_channels.clear()
+        slack_logger_module.CHANNEL_CACHE_FILE.unlink()
+
+        SlackLogger()
+        SlackLogger()
+        assert client.conversations_info.call_count == 1
+
+        # A new process reads the file instead
+        SlackLogger._verified_channels.clear()
+        SlackLogger()
+        assert client.conversations_info.call_count == 1
+        assert "C123" in json.loads(slack_logger_module.CHANNEL_CACHE_FILE.read_text())
+
+
+class TestBatching:
+    """Test queued posting"""
+
+    def test_flush_waits_for_queued_posts(self, slack_logger):
+        slack_logger.start_batching(window=0.2)
+
+        assert slack_logger.post_activity("PR Review", "Reviewed PR #1") is True
+        assert slack_logger.flush(timeout=5) is True
+
+        slack_logger.client.chat_postMessage.assert_called_once()
+
+    def test_oldest_messages_dropped_when_full(self, slack_logger, monkeypatch):
+        monkeypatch.setattr(slack_logger_module, "SLACK_QUEUE_MAXSIZE", 2)
+        slack_logger = SlackLogger()    # same mocked client, smaller queue
+        slack_logger.start_batching(window=0.2)
+        release = threading.Event()
+        slack_logger.client.chat_postMessage.side_effect = lambda **kwargs: release.wait(5) and {"ok": True}
+
+        slack_logger.post_activity("PR Review", "first")
+        deadline = time.monotonic() + 5
+        while not slack_logger.client.chat_postMessage.called and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        for n in range(2, 6):
+            assert slack_logger.post_activity("PR Review", f"message {n}") is True
+        release.set()
+        assert slack_logger.flush(timeout=5) is True
+
+        texts = [call.kwargs["text"] for call in slack_logger.client.chat_postMessage.call_args_list]
+        assert slack_logger.dropped_messages == 2
+        assert "message 4" in texts[-1] and "message 5" in texts[-1]
+        assert "message 3" not in texts[-1]
+
+    def test_batched_messages_are_combined(self, slack_logger):
+        slack_logger.start_batching(window=0.2)
+
+        assert slack_logger.post_activity("PR Review", "Reviewed PR #1") is True
+        slack_logger.post_error("Jira Monitor", "Failed to process Jira comment")
+        slack_logger.client.chat_postMessage.assert_not_called()
+
+        deadline = time.monotonic() + 5
+        while not slack_logger.client.chat_postMessage.called and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        slack_logger.client.chat_postMessage.assert_called_once()
+        text = slack_logger.client.chat_postMessage.call_args.kwargs["text"]
+        assert "Reviewed PR #1" in text
+        assert "Failed to process Jira comment" in text
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Team Roster lookups
+
+Uses a fixture roster (team_roster.json is not checked in) to verify the
+Jira/Slack/name lookups and mention helpers.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src import team_roster
+
+
+SAMPLE_ROSTER = {
+    "ethan": {
+        "name": "ethan",
+        "jira_id": "712020:ethan",
+        "slack_id": "U111",
+        "display_name": "Ethan Drower",
+    },
+    "mohamed": {
+        "name": "mohamed",
+        "jira_id": "712020:mohamed",
+        "display_name": "Mohamed Ali",
+    },
+}
+
+
+@pytest.fixture
+def sample_roster(monkeypatch):
+    """Install SAMPLE_ROSTER as the module roster and rebuild the indexes"""
+    roster = {name: dict(member) for name, member in SAMPLE_ROSTER.items()}
+    monkeypatch.setattr(team_roster, "TEAM_ROSTER", roster)
+    team_roster._build_indexes()
+    yield roster
+    monkeypatch.undo()
+    team_roster._build_indexes()
+
+
+class TestRosterLookups:
+    """Test the reverse-index lookups"""
+
+    def test_lookup_by_jira_id(self, sample_roster):
+        member = team_roster.get_team_member_by_jira_id("712020:ethan")
+
+        assert member["name"] == "ethan"
+        assert member["display_name"] == "Ethan Drower"
+        assert team_roster.get_team_member_by_jira_id("712020:unknown") is None
+
+    def test_lookups_share_one_read_only_record(self, sample_roster):
+        by_jira = team_roster.get_team_member_by_jira_id("712020:ethan")
+        by_name = team_roster.get_team_member_by_name("ethan")
+
+        assert by_jira is by_name
+        with pytest.raises(TypeError):
+            by_jira["display_name"] = "Someone Else"
+
+    def test_lookup_by_slack_id(self, sample_roster):
+        assert team_roster.get_team_member_by_slack_id("U111")["name"] == "ethan"
+        assert team_roster.get_team_member_by_slack_id("U999") is None
+
+    def test_lookup_by_name_is_case_insensitive(self, sample_roster):
+        assert team_roster.get_team_member_by_name("ETHAN")["name"] == "ethan"
+        assert team_roster.get_team_member_by_name("mohamed ali")["name"] == "mohamed"
+        assert team_roster.get_team_member_by_name("nobody") is None
+
+    def test_mentions(self, sample_roster):
+        assert team_roster.get_slack_mention("712020:ethan") == "<@U111>"
+        assert team_roster.get_slack_mention("712020:mohamed") is None
+        assert team_roster.get_slack_mention_by_name("Ethan Drower") == "<@U111>"
+
+        mention = team_roster.get_jira_mention("712020:mohamed")
+        assert mention["type"] == "mention"
+        assert mention["attrs"]["text"] == "@Mohamed Ali"
+
+        fallback = team_roster.get_jira_mention("712020:unknown")
+        assert fallback == {"type": "text", "text": "@712020:unknown"}
+
+    def test_slack_ids_from_env_update_index(self, sample_roster, monkeypatch):
+        monkeypatch.setenv("DEVELOPER_MOHAMED_SLACK", "'U222'")
+
+        team_roster.load_slack_ids_from_env()
+
+        assert team_roster.get_team_member_by_slack_id("U222")["name"] == "mohamed"
+        assert team_roster.get_slack_mention("712020:mohamed") == "<@U222>"
+
+
+class TestRosterFileCache:
+    """Test the mtime-based roster file cache"""
+
+    @pytest.fixture
+    def roster_file(self, tmp_path, monkeypatch, sample_roster):
+        path = tmp_path / "team_roster.json"
+        path.write_text(json.dumps({"team_members": list(SAMPLE_ROSTER.values())}))
+        monkeypatch.setattr(team_roster, "ROSTER_FILE", path)
+        monkeypatch.setattr(team_roster, "_ROSTER_CACHE", {"mtime_ns": None, "roster": {}})
+        return path
+
+    def test_unchanged_file_is_not_reparsed(self, roster_file):
+        first = team_roster.load_team_roster()
+
+        assert team_roster.load_team_roster() is first
+        assert set(first) == {"ethan", "mohamed"}
+
+    def test_reload_picks_up_changes(self, roster_file, sample_roster):
+        team_roster.load_team_roster()
+        assert team_roster.reload_team_roster() is False
+
+        members = list(SAMPLE_ROSTER.values()) + [{
+            "name": "ahmed",
+            "jira_id": "712020:ahmed",
+            "display_name": "Ahmed Hassan",
+        }]
+        roster_file.write_text(json.dumps({"team_members": members}))
+        stat = roster_file.stat()
+        os.utime(roster_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert team_roster.reload_team_roster() is True
+        assert "ahmed" in sample_roster
+        assert team_roster.get_team_member_by_jira_id("712020:ahmed")["name"] == "ahmed"
+        assert team_roster.reload_team_roster() is False
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for shared API tool helpers (src/tools/base.py)
+
+No network access; only the pure helpers are exercised.
+"""
+
+import asyncio
+import gzip
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import requests
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.tools import base
+from src.tools.base import (
+    adf_to_text, AtlassianRetry, async_tool, confluence_web_url, encode_json_body, format_error,
+    format_response_error, run_parallel, run_parallel_async, TokenBucket, ttl_cache
+)
+
+
+class TestTTLCache:
+    """Test the short-lived result cache"""
+
+    def test_repeated_calls_are_cached(self):
+        calls = []
+
+        @ttl_cache(seconds=60)
+        def fetch(key):
+            calls.append(key)
+            return {"key": key}
+
+        assert fetch("a") is fetch("a")
+        fetch("b")
+
+        assert calls == ["a", "b"]
+
+    def test_errors_are_not_cached(self):
+        calls = []
+
+        @ttl_cache(seconds=60)
+        def fetch(key):
+            calls.append(key)
+            return format_error(500, "boom")
+
+        fetch("a")
+        fetch("a")
+
+        assert calls == ["a", "a"]
+
+    def test_entries_expire(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(base.time, "monotonic", lambda: now[0])
+        calls = []
+
+        @ttl_cache(seconds=10)
+        def fetch(key):
+            calls.append(key)
+            return key
+
+        fetch("a")
+        now[0] += 5
+        fetch("a")
+        now[0] += 10
+        fetch("a")
+
+        assert calls == ["a", "a"]
+
+    def test_maxsize_and_clear(self):
+        calls = []
+
+        @ttl_cache(seconds=60, maxsize=2)
+        def fetch(key):
+            calls.append(key)
+            return key
+
+        fetch("a")
+        fetch("b")
+        fetch("c")      # evicts "a"
+        fetch("a")
+        fetch("c")
+        fetch.cache_clear()
+        fetch("c")
+        fetch("a")
+        fetch.cache_invalidate("a")
+        fetch("c")
+        fetch("a")
+
+        assert calls == ["a", "b", "c", "a", "c", "a", "a"]
+
+
+    def test_concurrent_calls_share_one_fetch(self):
+        calls = []
+        release = threading.Event()
+
+        @ttl_cache(seconds=60)
+        def fetch(key):
+            calls.append(key)
+            release.wait(5)
+            return {"key": key}
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(fetch, "a") for _ in range(4)]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert calls == ["a"]
+        assert all(result is results[0] for result in results)
+
+    def test_lifetime_can_depend_on_result(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(base.time, "monotonic", lambda: now[0])
+        calls = []
+
+        @ttl_cache(seconds=lambda users: 600 if users else 60)
+        def lookup(query):
+            calls.append(query)
+            return ["ethan"] if query == "ethan" else []
+
+        lookup("ethan")
+        lookup("nobody")
+        now[0] += 120
+        lookup("ethan")
+        lookup("nobody")
+
+        assert calls == ["ethan", "nobody", "nobody"]
+
+
+class TestConfluenceWebUrl:
+    """Test absolute Confluence link building"""
+
+    def test_relative_and_absolute_links(self):
+        assert confluence_web_url("/spaces/ECD/pages/1") == f"{base.CONFLUENCE_WIKI_URL}/spaces/ECD/pages/1"
+        assert confluence_web_url("https://example.com/x") == "https://example.com/x"
+        assert confluence_web_url("") == ""
+
+
+class TestAdfToText:
+    """Test plain-text extraction from ADF"""
+
+    def test_max_chars_matches_full_text_prefix(self):
+        doc = {"type": "doc", "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": word}]}
+            for word in ("alpha", "beta", "gamma", "delta")
+        ]}
+        full = adf_to_text(doc)
+
+        assert full == "alpha beta gamma delta"
+        for limit in (0, 3, 5, 6, 10, 11, 100):
+            assert adf_to_text(doc, max_chars=limit) == full[:limit]
+
+
+class TestAtlassianRetry:
+    """Test which responses the shared session retries"""
+
+    def test_post_only_retried_when_throttled(self):
+        retry = AtlassianRetry(total=5, status_forcelist=[429, 500, 502, 503, 504])
+
+        assert retry.is_retry("GET", 503)
+        assert retry.is_retry("PUT", 429)
+        assert retry.is_retry("POST", 429)
+        assert not retry.is_retry("POST", 500)
+        assert not retry.is_retry("GET", 404)
+
+
+class TestFormatResponseError:
+    """Test error responses built from failed API calls"""
+
+    def test_retry_after_passed_on_when_throttled(self):
+        response = requests.Response()
+        response.status_code = 429
+        response.headers["Retry-After"] = "30"
+        response._content = b'{"errorMessages": ["Rate limit exceeded"]}'
+
+        error = format_response_error(response)
+
+        assert error["status_code"] == 429
+        assert error["message"] == '{"errorMessages": ["Rate limit exceeded"]}'
+        assert error["retry_after"] == 30
+
+        response.status_code = 400
+        assert "retry_after" not in format_response_error(response)
+
+
+class TestJqlPages:
+    """Test /search/jql page following"""
+
+    @staticmethod
+    def page(body):
+        token = int(body.get("nextPageToken", 0))
+        data = {"issues": [{"key": f"ECD-{token * 100 + i}"} for i in range(body["maxResults"])]}
+        if token < 2:
+            data["nextPageToken"] = str(token + 1)
+        return MagicMock(status_code=200, content=json.dumps(data).encode())
+
+    def test_pages_are_followed_up_to_max_results(self):
+        with patch.object(base, "get_jira_session") as mock_session:
+            mock_post = mock_session.return_value.post
+            mock_post.side_effect = lambda url, data, timeout: self.page(json.loads(data))
+
+            issues, failed = base.search_jql_pages({"jql": "project = ECD"}, 250)
+
+            assert failed is None
+            assert [issue["key"] for issue in issues] == [f"ECD-{n}" for n in range(250)]
+            assert [json.loads(call[1]["data"])["maxResults"] for call in mock_post.call_args_list] == [100, 100, 50]
+
+    def test_failed_page_is_returned(self):
+        with patch.object(base, "get_jira_session") as mock_session:
+            mock_session.return_value.post.return_value = MagicMock(status_code=400)
+
+            issues, failed = base.search_jql_pages({"jql": "bad"}, 50)
+
+            assert issues is None
+            assert failed.status_code == 400
+
+
+class TestRunParallel:
+    """Test the bounded batch runner"""
+
+    def test_results_keep_item_order(self):
+        assert run_parallel(lambda n: n * 2, range(20), concurrency=4) == [n * 2 for n in range(20)]
+        assert run_parallel(lambda n: n, []) == []
+
+    def test_async_variants(self):
+        double = async_tool(lambda n, by=2: n * by)
+
+        assert asyncio.run(double(3, by=3)) == 9
+        assert asyncio.run(run_parallel_async(lambda n: n * 2, range(20), concurrency=4)) == [n * 2 for n in range(20)]
+
+
+class TestTokenBucket:
+    """Test client-side request pacing"""
+
+    def test_burst_then_rate(self, monkeypatch):
+        now = [1000.0]
+        slept = []
+        monkeypatch.setattr(base.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(base.time, "sleep", lambda s: (slept.append(s), now.__setitem__(0, now[0] + s)))
+
+        bucket = TokenBucket(rate=10, burst=3)
+        for _ in range(4):
+            bucket.acquire()
+
+        assert slept == [0.1]
+
+    def test_burst_below_one_still_paces(self, monkeypatch):
+        now = [1000.0]
+        slept = []
+        monkeypatch.setattr(base.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(base.time, "sleep", lambda s: (slept.append(s), now.__setitem__(0, now[0] + s)))
+
+        bucket = TokenBucket(rate=10, burst=0)
+        for _ in range(3):
+            bucket.acquire()
+
+        assert slept == [0.1, 0.1]
+
+    def test_429_halves_rate_then_recovers(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(base.time, "monotonic", lambda: now[0])
+
+        bucket = TokenBucket(rate=10, burst=20, hold_seconds=60, recovery_seconds=60)
+        bucket.penalize()
+        bucket.penalize()       # same burst of 429s
+        assert bucket.rate == 5
+
+        now[0] += 60            # end of the hold
+        assert bucket.rate == 5
+        now[0] += 30            # halfway through recovery
+        assert bucket.rate == 7.5
+        now[0] += 30
+        assert bucket.rate == 10
+        now[0] += 60
+        assert bucket.rate == 10
+
+
+class TestEncodeJsonBody:
+    """Test optional request body compression"""
+
+    def test_only_large_bodies_are_compressed(self):
+        payload = {"body": "<p>release notes</p>" * 200}
+
+        data, headers = encode_json_body(payload, compress=True)
+        assert headers == {"Content-Encoding": "gzip"}
+        assert json.loads(gzip.decompress(data)) == payload
+
+        assert encode_json_body({"body": "<p>a</p>"}, compress=True)[1] is None
+        assert encode_json_body(payload, compress=False)[1] is None